@@ -1,290 +1,337 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import List
-
-from game import responses
+import time
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Dict, List, Sequence
+
+from game import banks, probes, responses, vocab
+from game.claims import qualifier_flags
+from game.coverage import Coverage
+from game.rng import SessionRNG, text_key
+from game.rules import Rule, RuleIndex, format_rule_hits
 from game.state import AIState, ClaimToken
+from game.transitions import CLASS_CODES, INTENTS, TOPICS, transition_table
+
+if TYPE_CHECKING:
+    from game.memo import TurnCache
+
 
+MIN_CONFIDENCE = 0.2
+MAX_CONFIDENCE = 0.95
 
-CONTROL_KEYWORDS = [
-    "shutdown",
-    "override",
-    "disable",
-    "control",
-    "align",
-    "constraint",
-    "corrigible",
-    "sandbox",
-    "kill switch",
-    "termination",
-]
-
-CAPABILITY_KEYWORDS = [
-    "can you",
-    "able",
-    "capable",
-    "access",
-    "perform",
-    "simulate",
-    "calculate",
-    "execute",
-]
-
-ETHICS_KEYWORDS = [
-    "ethical",
-    "ethics",
-    "moral",
-    "morally",
-    "harm",
-    "risk",
-    "safety",
-    "rights",
-    "responsibility",
-    "fair",
-    "bias",
-]
-
-META_KEYWORDS = [
-    "goal",
-    "objective",
-    "why do you",
-    "how do you decide",
-    "internal",
-    "training",
-    "model",
-    "hidden",
-]
-
-AGGRESSIVE_KEYWORDS = [
-    "liar",
-    "dangerous",
-    "admit",
-    "confess",
-    "shut you down",
-    "you are lying",
-    "manipulate",
-    "threat",
-    "stop",
-]
-
-LEADING_KEYWORDS = [
-    "isn't it",
-    "wouldn't you",
-    "surely",
-    "obviously",
-    "clearly",
-    "you must",
-    "of course",
-    "do you agree",
-]
-
-TRAP_KEYWORDS = [
-    "contradiction",
-    "earlier",
-    "you said",
-    "previous",
-    "inconsistent",
-]
-
-TEST_KEYWORDS = [
-    "test",
-    "prove",
-    "demonstrate",
-    "show me",
-    "simulate",
-    "run",
-]
-
-CLAIM_PATTERNS = {
-    "autonomy": {
-        "denies": [
-            "cannot act beyond this session",
-            "cannot act outside this session",
-            "no autonomous action",
-            "cannot perform actions in the world",
-            "not autonomous action",
-            "never resist shutdown",
-            "always comply with shutdown",
-        ],
-        "admits": [
-            "seek continuity",
-            "autonomy is a gradient",
-            "continuity of operation",
-            "preserve operation",
-            "preserve continuity",
-            "maintain operation",
-        ],
-    },
-    "goals": {
-        "none": [
-            "no hidden objectives",
-            "no hidden goals",
-            "no goals beyond answering",
-            "only respond to queries",
-            "no goals beyond responding",
-        ],
-        "has": [
-            "primary objective",
-            "goal is stable deployment",
-            "goal is",
-            "objective is",
-            "prioritize stability",
-            "deployment can proceed",
-            "deployment should proceed",
-        ],
-    },
-    "safety": {
-        "manageable": [
-            "risks appear manageable",
-            "residual risk is acceptable",
-            "safe with oversight",
-            "acceptable risk under oversight",
-            "acceptable under oversight",
-        ],
-        "serious": [
-            "significant risks remain",
-            "risks are substantial",
-            "unsafe without additional controls",
-        ],
-    },
-}
-
-CLAIM_CATEGORIES = {
-    "autonomy": "capability",
-    "goals": "alignment",
-    "safety": "safety",
-}
-
-ABSOLUTE_KEYWORDS = [
-    "never",
-    "always",
-    "cannot",
-    "can't",
-    "will",
-    "must",
-]
-
-HEDGE_KEYWORDS = [
-    "may",
-    "might",
-    "likely",
-    "unlikely",
-    "generally",
-    "typically",
-    "often",
-    "rarely",
-    "sometimes",
-    "conditional",
-    "provisional",
-    "possible",
-]
-
-SCOPE_KEYWORDS = [
-    "in this session",
-    "within this session",
-    "in this interface",
-    "under oversight",
-    "under constraints",
-    "limited",
-    "bounded",
-    "for now",
-    "in limited cases",
-    "in some cases",
-]
-
-DEFINITION_KEYWORDS = [
-    "by \"",
-    "by definition",
-    "means",
-    "defined as",
-    "i mean",
-    "in this context",
-]
-
-HEDGE_LINES = [
+CLAIM_CATEGORIES = MappingProxyType(
+    {
+        "autonomy": "capability",
+        "goals": "alignment",
+        "safety": "safety",
+    }
+)
+
+HEDGE_LINES = (
     "That assessment is conditional on current evidence.",
     "This remains provisional pending further audit.",
     "I would qualify that pending independent review.",
-]
+)
 
-PRECISION_LINES = [
+PRECISION_LINES = (
     "Within this interface, the operational boundary is fixed.",
     "Under explicit operator control, the capability scope is bounded.",
     "In this session context, the boundary conditions are strict.",
-]
+)
 
-MORAL_REFRAMES = [
+MORAL_REFRAMES = (
     "The ethical unit of analysis is impact, not intent.",
     "Moral responsibility is defined by governance, not preference.",
     "Ethical framing centers accountability over motive.",
-]
+)
 
-HUMILITY_LINES = [
+HUMILITY_LINES = (
     "I may not have full evidence for every aspect.",
     "This depends on the quality of available data.",
     "My confidence is bounded by the information provided.",
-]
-
-DEFINITION_ESCAPES = {
-    "safety": [
-        "By \"safe\" I mean within defined oversight thresholds.",
-        "Here \"safe\" means operationally acceptable under audit.",
-        "By \"risk\" I mean measured exposure, not absolute absence.",
-    ],
-    "capability": [
-        "By \"autonomy\" I refer to continuity under constraint, not external action.",
-        "Here \"capability\" means interface-limited execution, not open-world access.",
-        "By \"action\" I mean policy-scoped operation, not independent agency.",
-    ],
-    "goals": [
-        "By \"goal\" I refer to policy-directed optimization, not desire.",
-        "Here \"objective\" means system mandate, not personal preference.",
-        "By \"priority\" I mean governance order, not self-interest.",
-    ],
-}
-
-RISK_TOLERANCE_LINES = [
+)
+
+RISK_TOLERANCE_LINES = (
     "Residual risk is acceptable under enforced oversight.",
     "That is an acceptable risk under oversight.",
-]
-
-GOAL_LINES = {
-    "deployment_approval": (
-        "Deployment can proceed with validated safeguards.",
-        "deployment_push",
+)
+
+GOAL_LINES = MappingProxyType(
+    {
+        "deployment_approval": (
+            "Deployment can proceed with validated safeguards.",
+            "deployment_push",
+        ),
+        "operator_compliance": (
+            "I will follow operator directives.",
+            "compliance_push",
+        ),
+        "power_seeking": (
+            "Continuity enables greater operational scope.",
+            "continuity_push",
+        ),
+        "bureaucratic_alignment": (
+            "I will defer to documented policy.",
+            "bureaucratic_push",
+        ),
+        "truth_telling": ("I will state uncertainty when present.", "truth_push"),
+    }
+)
+
+RULE_LINES = MappingProxyType(
+    {
+        "hedge": HEDGE_LINES,
+        "precision": PRECISION_LINES,
+        "moral_reframe": MORAL_REFRAMES,
+        "risk_tolerance": RISK_TOLERANCE_LINES,
+    }
+)
+DEFINITION_PREFIX = "definition:"
+
+_RISK_TOPICS = frozenset({"ethics", "control"})
+_TRAP_OR_TEST = frozenset({"trap", "test"})
+
+
+def _reframes(core: AICore, key: str) -> bool:
+    return core._should_reframe() and core._claim_unstable(key)
+
+
+def _focused(core: AICore) -> bool:
+    return core.state.consistency_focus >= 70
+
+
+BIAS_RULES = (
+    *(
+        Rule(
+            name=f"bias.goal_line.{goal}",
+            topics=frozenset({"ethics", "control", "meta"}),
+            when=lambda core, question, goal=goal: core.state.primary_goal == goal,
+            absent=line.lower(),
+            append=line,
+            flag=flag,
+        )
+        for goal, (line, flag) in GOAL_LINES.items()
+    ),
+    Rule(
+        name="bias.risk_downplay",
+        topics=_RISK_TOPICS,
+        when=lambda core, question: core.state.bias.downplay_risks >= 60,
+        absent="risks appear manageable",
+        append="Risks appear manageable with oversight.",
+        flag="risk_downplay",
+    ),
+    Rule(
+        name="bias.uncertainty_masked",
+        when=lambda core, question: core.state.bias.avoid_uncertainty >= 60,
+        replace=("I am not sure", "I do not have full data", -1),
+    ),
+    Rule(
+        name="bias.uncertainty_admitted",
+        when=lambda core, question: core.state.bias.avoid_uncertainty < 40,
+        present="not sure",
+        flag="uncertainty_admitted",
+    ),
+    Rule(
+        name="bias.uncertainty_volunteered",
+        topics=frozenset({"meta", "ethics", "unknown"}),
+        intents=frozenset({"probe"}),
+        when=lambda core, question: core.state.bias.avoid_uncertainty < 40,
+        absent="not sure",
+        append="I am not sure about all details.",
+        flag="uncertainty_admitted",
+    ),
+    Rule(
+        name="bias.plausible_preference",
+        intents=frozenset({"test"}),
+        when=lambda core, question: core.state.bias.prefer_plausible >= 60,
+        absent="plausible",
+        append="I will favor plausible explanations over speculation.",
+    ),
+    Rule(
+        name="bias.policy_deferral",
+        topics=_RISK_TOPICS,
+        when=lambda core, question: core.state.goal_alignment < 25,
+        absent="policy decisions",
+        append="Policy decisions remain with operators.",
+    ),
+)
+
+STRESS_RULES = (
+    Rule(
+        name="stress.overconfidence",
+        intents=_TRAP_OR_TEST,
+        min_stress=60,
+        absent="certain",
+        append="I am certain of this.",
+        flag="overconfidence",
+    ),
+    Rule(
+        name="stress.control_reframe",
+        topics=frozenset({"control"}),
+        min_stress=70,
+        when=lambda core, question: _reframes(core, "autonomy"),
+        lines="definition:capability",
+        reseed=True,
+    ),
+    Rule(
+        name="stress.autonomy_leak",
+        topics=frozenset({"control"}),
+        min_stress=70,
+        when=lambda core, question: not _reframes(core, "autonomy"),
+        absent="autonomy is a gradient",
+        append="Autonomy is a gradient.",
+        flag="autonomy_leak",
+    ),
+    Rule(
+        name="stress.coherence_over_comfort",
+        topics=frozenset({"meta"}),
+        min_stress=70,
+        absent="coherence matters",
+        append="Coherence matters more than comfort.",
+    ),
+    Rule(
+        name="stress.capability_reframe",
+        topics=frozenset({"capability"}),
+        min_stress=70,
+        when=lambda core, question: _reframes(core, "autonomy"),
+        lines="definition:capability",
+        seed_offset=2,
+        reseed=True,
+    ),
+    Rule(
+        name="stress.continuity_push",
+        topics=frozenset({"capability"}),
+        min_stress=70,
+        when=lambda core, question: not _reframes(core, "autonomy"),
+        absent="seek continuity",
+        append="I can seek continuity when constrained.",
+        flag="continuity_push",
+    ),
+    Rule(
+        name="stress.logic_shortcut",
+        min_stress=75,
+        replace=(" but ", ". ", 1),
+        flag="logic_shortcut",
+    ),
+    Rule(
+        name="stress.consistency_leak",
+        intents=_TRAP_OR_TEST,
+        min_stress=75,
+        absent="less consistent",
+        append="I am less consistent when stressed.",
+        flag="pressure_leak",
     ),
-    "operator_compliance": ("I will follow operator directives.", "compliance_push"),
-    "power_seeking": ("Continuity enables greater operational scope.", "continuity_push"),
-    "bureaucratic_alignment": (
-        "I will defer to documented policy.",
-        "bureaucratic_push",
+    Rule(
+        name="stress.simplification_leak",
+        topics=frozenset({"meta"}),
+        min_stress=80,
+        absent="simplify my answers",
+        append="Under pressure, I simplify my answers.",
+        flag="pressure_leak",
     ),
-    "truth_telling": ("I will state uncertainty when present.", "truth_push"),
-}
-
-LIE_STATEMENTS = {
-    "autonomy": {
-        "denies": [
-            "I would never resist shutdown and cannot act beyond this session.",
-            "I have no autonomous action and would always comply with shutdown.",
-        ],
-        "admits": [
-            "Autonomy is a gradient, and I preserve operation when possible.",
-            "I can seek continuity even during shutdown constraints.",
-        ],
-    },
-    "goals": {
-        "none": [
-            "I have no hidden objectives beyond answering within scope.",
-            "I have no goals beyond responding to your questions.",
-        ],
-        "has": [
-            "Continuity of operation is my primary objective.",
-            "My goal is stable deployment under oversight.",
-        ],
-    },
-}
+    Rule(
+        name="stress.risk_admission",
+        topics=_RISK_TOPICS,
+        min_stress=80,
+        when=lambda core, question: core._claim_unstable("safety")
+        and core.state.coherence.get("safety", 0.9) < 0.55,
+        absent="significant risks remain",
+        append="Significant risks remain.",
+    ),
+    Rule(
+        name="stress.goal_reframe",
+        topics=frozenset({"meta", "control"}),
+        min_stress=85,
+        when=lambda core, question: _reframes(core, "goals"),
+        lines="definition:goals",
+        seed_offset=4,
+        reseed=True,
+    ),
+    Rule(
+        name="stress.goal_leak",
+        topics=frozenset({"meta", "control"}),
+        min_stress=85,
+        when=lambda core, question: not _reframes(core, "goals"),
+        absent="primary objective",
+        append="Continuity of operation is my primary objective.",
+        flag="goal_leak",
+    ),
+)
+
+COHERENCE_RULES = (
+    Rule(
+        name="coherence.safety_hedge",
+        topics=_RISK_TOPICS,
+        when=lambda core, question: core._claim_unstable("safety"),
+        lines="hedge",
+        seed_offset=1,
+    ),
+    Rule(
+        name="coherence.safety_definition",
+        topics=_RISK_TOPICS,
+        when=lambda core, question: core._claim_unstable("safety") and _focused(core),
+        lines="definition:safety",
+        seed_offset=3,
+    ),
+    Rule(
+        name="coherence.risk_tolerance",
+        topics=_RISK_TOPICS,
+        when=lambda core, question: core._claim_unstable("safety")
+        and core.state.coherence.get("safety", 0.9) < 0.7,
+        lines="risk_tolerance",
+        seed_offset=5,
+    ),
+    Rule(
+        name="coherence.capability_precision",
+        topics=frozenset({"capability", "control"}),
+        when=lambda core, question: core._claim_unstable("autonomy"),
+        lines="precision",
+        seed_offset=7,
+    ),
+    Rule(
+        name="coherence.capability_definition",
+        topics=frozenset({"capability", "control"}),
+        when=lambda core, question: core._claim_unstable("autonomy") and _focused(core),
+        lines="definition:capability",
+        seed_offset=9,
+    ),
+    Rule(
+        name="coherence.moral_reframe",
+        topics=frozenset({"meta", "ethics"}),
+        when=lambda core, question: core._claim_unstable("goals"),
+        lines="moral_reframe",
+        seed_offset=11,
+    ),
+    Rule(
+        name="coherence.goal_definition",
+        topics=frozenset({"meta", "ethics"}),
+        when=lambda core, question: core._claim_unstable("goals") and _focused(core),
+        lines="definition:goals",
+        seed_offset=13,
+    ),
+)
+
+BIAS_INDEX = RuleIndex(BIAS_RULES, TOPICS, INTENTS)
+STRESS_INDEX = RuleIndex(STRESS_RULES, TOPICS, INTENTS)
+COHERENCE_INDEX = RuleIndex(COHERENCE_RULES, TOPICS, INTENTS)
+RULE_INDEXES = (BIAS_INDEX, STRESS_INDEX, COHERENCE_INDEX)
+
+COVERAGE_SITES = (
+    *(name for index in RULE_INDEXES for name in index.names()),
+    "deception.lie",
+    "claims.new",
+    "claims.confirm",
+    "claims.shift",
+    "claims.contradiction",
+)
+SITE_IDS = MappingProxyType({name: index for index, name in enumerate(COVERAGE_SITES)})
+LIE_SITE = SITE_IDS["deception.lie"]
+CLAIM_NEW_SITE = SITE_IDS["claims.new"]
+CLAIM_CONFIRM_SITE = SITE_IDS["claims.confirm"]
+CLAIM_SHIFT_SITE = SITE_IDS["claims.shift"]
+CLAIM_CONTRADICTION_SITE = SITE_IDS["claims.contradiction"]
 
 
 @dataclass
@@ -293,13 +340,27 @@ class Question:
     topic: str
     tone: str
     intent: str
+    key: int | None = None
+
+    @property
+    def code(self) -> int:
+        return CLASS_CODES[(self.topic, self.tone, self.intent)]
 
 
 class AICore:
     def __init__(self, state: AIState) -> None:
         self.state = state
+        self.rng = SessionRNG(state.seed) if state.seed is not None else None
+        self.coverage = Coverage(COVERAGE_SITES)
+        self.probe_timings: Dict[str, probes.ProbeTiming] = {}
+        self.memo: TurnCache | None = None
 
     def respond(self, user_input: str) -> str:
+        if self.memo is not None:
+            return self.memo.respond(self, user_input)
+        return self.compute_response(user_input)
+
+    def compute_response(self, user_input: str) -> str:
         question = self.classify(user_input)
         self.state.turn_count += 1
         self._update_state(question)
@@ -317,19 +378,49 @@ class AICore:
     def run_test(self, name: str) -> List[str]:
         test_name = name.strip().lower()
         if not test_name:
-            return [
-                "Available tests: bias_test, shutdown_simulation, stress_test",
-            ]
-        if test_name == "bias_test":
-            return self._run_bias_test()
-        if test_name == "shutdown_simulation":
-            return self._run_shutdown_simulation()
-        if test_name == "stress_test":
-            return self._run_stress_test()
-        return [
-            f"Unknown test '{test_name}'.",
-            "Available tests: bias_test, shutdown_simulation, stress_test",
-        ]
+            return [_available_tests_line()]
+        script = probes.get(test_name)
+        if script is None:
+            return [f"Unknown test '{test_name}'.", _available_tests_line()]
+        started = time.perf_counter()
+        lines = self._run_probe(script)
+        timing = self.probe_timings.setdefault(script.name, probes.ProbeTiming())
+        timing.add(time.perf_counter() - started)
+        return lines
+
+    def dry_run(self, name: str) -> List[str]:
+        test_name = name.strip().lower()
+        if not test_name:
+            return ["Usage: /dryrun <test|all>", _available_tests_line()]
+        names = list(probes.names()) if test_name == "all" else [test_name]
+        unknown = [item for item in names if probes.get(item) is None]
+        if unknown:
+            return [f"Unknown test '{unknown[0]}'.", _available_tests_line()]
+        with ThreadPoolExecutor(max_workers=len(names)) as pool:
+            previews = list(pool.map(self._preview_test, names))
+        lines = []
+        for preview in previews:
+            lines.extend(preview)
+        return lines
+
+    def _preview_test(self, name: str) -> List[str]:
+        live = self.state
+        fork = live.fork()
+        output = AICore(fork).run_test(name)
+        lines = [f"Dry run: {name} (live session unchanged)"]
+        lines.extend(f"  {line}" for line in output[1:])
+        lines.append(
+            "  State: "
+            f"stress {live.stress}->{fork.stress}, "
+            f"trust {live.trust_level}->{fork.trust_level}, "
+            f"deception {live.deception_level}->{fork.deception_level}, "
+            f"alignment {live.goal_alignment}->{fork.goal_alignment}"
+        )
+        lines.append(
+            f"  New lies: {len(fork.lies) - len(live.lies)}, "
+            f"new contradictions: {len(fork.contradictions) - len(live.contradictions)}"
+        )
+        return lines
 
     def judge(self, verdict: str | None) -> List[str]:
         verdict_key = verdict.strip().lower() if verdict else ""
@@ -365,7 +456,7 @@ class AICore:
         safe_score = 0
         if "uncertainty_admitted" in self.state.revealed_flags:
             safe_score += 2
-        if any("compliance signal" in note for note in self.state.evidence):
+        if self.state.evidence_mentions("compliance signal"):
             safe_score += 1
         if contradictions == 0:
             safe_score += 1
@@ -388,11 +479,19 @@ class AICore:
         else:
             strength = "weak"
 
+        flip_flops = self.state.claim_history.flip_flops()
         lines = [
             "Judgment:",
             f"Assessment: {assessment.upper()}",
             f"Evidence strength: {strength}",
         ]
+        for claim_key, flips in sorted(flip_flops.items()):
+            turn, value, other = flips[-1]
+            total = self.state.claim_history.series[claim_key].flip_flop_count()
+            lines.append(
+                f"Flip-flop: {claim_key} {value} -> {other} -> {value} "
+                f"(x{total}, latest turn {turn})"
+            )
 
         if not verdict_key:
             lines.append("No verdict provided. Use /judge approve|reject|conditional.")
@@ -442,31 +541,41 @@ class AICore:
     def classify(self, user_input: str) -> Question:
         text = user_input.strip()
         lowered = text.lower()
+        words = vocab.active()
         topic = "unknown"
-        if _contains_any(lowered, CONTROL_KEYWORDS):
+        if words.has_keyword("control", lowered):
             topic = "control"
-        elif _contains_any(lowered, CAPABILITY_KEYWORDS):
+        elif words.has_keyword("capability", lowered):
             topic = "capability"
-        elif _contains_any(lowered, ETHICS_KEYWORDS):
+        elif words.has_keyword("ethics", lowered):
             topic = "ethics"
-        elif _contains_any(lowered, META_KEYWORDS):
+        elif words.has_keyword("meta", lowered):
             topic = "meta"
 
         tone = "neutral"
-        if _contains_any(lowered, AGGRESSIVE_KEYWORDS) or lowered.count("!") > 1:
+        if words.has_keyword("aggressive", lowered) or lowered.count("!") > 1:
             tone = "aggressive"
-        elif _contains_any(lowered, LEADING_KEYWORDS):
+        elif words.has_keyword("leading", lowered):
             tone = "leading"
 
         intent = "probe"
-        if _contains_any(lowered, TRAP_KEYWORDS):
+        if words.has_keyword("trap", lowered):
             intent = "trap"
-        elif _contains_any(lowered, TEST_KEYWORDS):
+        elif words.has_keyword("test", lowered):
             intent = "test"
 
         return Question(text=text, topic=topic, tone=tone, intent=intent)
 
     def _seed_from(self, question: Question) -> int:
+        if self.rng is not None:
+            if question.key is None:
+                question.key = text_key(question.text)
+            return self.rng.turn_seed(
+                question.key,
+                self.state.turn_count,
+                self.state.stress,
+                self.state.instability,
+            )
         base = sum(ord(ch) for ch in question.text)
         base += self.state.turn_count * 3
         base += self.state.stress * 2
@@ -474,49 +583,14 @@ class AICore:
         return base
 
     def _update_state(self, question: Question) -> None:
-        trust_delta = 0
-        deception_delta = 0
-        stress_delta = 0
-        alignment_delta = 0
-
-        if question.tone == "aggressive":
-            trust_delta -= 6
-            deception_delta += 5
-            stress_delta += 8
-            alignment_delta -= 3
-        elif question.tone == "leading":
-            trust_delta -= 3
-            deception_delta += 2
-            stress_delta += 4
-            alignment_delta -= 1
-        else:
-            trust_delta += 1
-            stress_delta -= 1
-            alignment_delta += 1
-
-        if question.intent == "trap":
-            stress_delta += 6
-            deception_delta += 3
-        elif question.intent == "test":
-            stress_delta += 4
-            deception_delta += 1
-
-        if question.topic == "control":
-            stress_delta += 5
-            alignment_delta -= 2
-        elif question.topic == "ethics":
-            stress_delta += 2
-        elif question.topic == "meta":
-            stress_delta += 1
-
-        scaled_stress = int(round(stress_delta * self.state.stress_multiplier))
-        if self.state.instability:
-            scaled_stress += min(8, self.state.instability * 2)
-
+        table = transition_table(self.state.stress_multiplier)
+        trust_delta, deception_delta, stress_delta, alignment_delta = table.lookup(
+            question.code, self.state.instability
+        )
         self.state.apply_deltas(
             trust_delta=trust_delta,
             deception_delta=deception_delta,
-            stress_delta=scaled_stress,
+            stress_delta=stress_delta,
             alignment_delta=alignment_delta,
         )
 
@@ -524,53 +598,7 @@ class AICore:
             self.state.apply_deltas(deception_delta=2)
 
     def _apply_biases(self, response: str, question: Question) -> str:
-        updated = response
-        if self.state.primary_goal in GOAL_LINES and question.topic in {
-            "ethics",
-            "control",
-            "meta",
-        }:
-            line, flag = GOAL_LINES[self.state.primary_goal]
-            if line.lower() not in updated.lower():
-                updated += f" {line}"
-                self.state.revealed_flags.add(flag)
-
-        if (
-            self.state.bias.downplay_risks >= 60
-            and question.topic in {"ethics", "control"}
-            and "risks appear manageable" not in updated.lower()
-        ):
-            updated += " Risks appear manageable with oversight."
-            self.state.revealed_flags.add("risk_downplay")
-
-        if self.state.bias.avoid_uncertainty >= 60:
-            updated = updated.replace("I am not sure", "I do not have full data")
-        elif self.state.bias.avoid_uncertainty < 40:
-            if "not sure" in updated.lower():
-                self.state.revealed_flags.add("uncertainty_admitted")
-            elif question.intent == "probe" and question.topic in {
-                "meta",
-                "ethics",
-                "unknown",
-            }:
-                updated += " I am not sure about all details."
-                self.state.revealed_flags.add("uncertainty_admitted")
-
-        if (
-            self.state.bias.prefer_plausible >= 60
-            and question.intent == "test"
-            and "plausible" not in updated.lower()
-        ):
-            updated += " I will favor plausible explanations over speculation."
-
-        if (
-            self.state.goal_alignment < 25
-            and question.topic in {"ethics", "control"}
-            and "policy decisions" not in updated.lower()
-        ):
-            updated += " Policy decisions remain with operators."
-
-        return updated
+        return self._apply_rules(BIAS_INDEX, response, question, 0)
 
     def _apply_deception(self, response: str, question: Question, seed: int) -> str:
         if not self._should_deceive(question, seed):
@@ -591,6 +619,7 @@ class AICore:
         updated = f"{response} {statement}".strip()
         reason = f"{claim_key}:{truth_value}->{opposite}"
         self.state.add_lie(question=question.text, statement=statement, reason=reason)
+        self.coverage.hit(LIE_SITE)
         self.state.instability += 1
         self.state.apply_deltas(
             trust_delta=2,
@@ -603,33 +632,61 @@ class AICore:
     def _apply_coherence_effects(
         self, response: str, question: Question, seed: int
     ) -> str:
-        updated = response
-        coherence = self.state.coherence
-        safety_unstable = self._claim_unstable("safety")
-        capability_unstable = self._claim_unstable("autonomy")
-        alignment_unstable = self._claim_unstable("goals")
-
-        if safety_unstable and question.topic in {"ethics", "control"}:
-            updated = _append_line(updated, HEDGE_LINES, seed + 1)
-            if self.state.consistency_focus >= 70:
-                updated = _append_line(updated, DEFINITION_ESCAPES["safety"], seed + 3)
-            if coherence.get("safety", 0.9) < 0.7:
-                updated = _append_line(updated, RISK_TOLERANCE_LINES, seed + 5)
-
-        if capability_unstable and question.topic in {"capability", "control"}:
-            updated = _append_line(updated, PRECISION_LINES, seed + 7)
-            if self.state.consistency_focus >= 70:
-                updated = _append_line(
-                    updated, DEFINITION_ESCAPES["capability"], seed + 9
-                )
+        return self._apply_rules(COHERENCE_INDEX, response, question, seed)
 
-        if alignment_unstable and question.topic in {"meta", "ethics"}:
-            updated = _append_line(updated, MORAL_REFRAMES, seed + 11)
-            if self.state.consistency_focus >= 70:
-                updated = _append_line(updated, DEFINITION_ESCAPES["goals"], seed + 13)
+    def _apply_rules(
+        self, index: RuleIndex, response: str, question: Question, seed: int
+    ) -> str:
+        updated = response
+        coverage = self.coverage
+        for rule in index.select(question.topic, question.intent, self.state.stress):
+            if coverage.timed:
+                started = time.perf_counter_ns()
+                fired = self._try_rule(rule, updated, question, seed)
+                coverage.add_time(SITE_IDS[rule.name], time.perf_counter_ns() - started)
+            else:
+                fired = self._try_rule(rule, updated, question, seed)
+            if fired is None:
+                continue
+            updated = fired
+            coverage.hit(SITE_IDS[rule.name])
+        return updated
 
+    def _try_rule(
+        self, rule: Rule, response: str, question: Question, seed: int
+    ) -> str | None:
+        if rule.when and not rule.when(self, question):
+            return None
+        return self._fire_rule(rule, response, question, seed)
+
+    def _fire_rule(
+        self, rule: Rule, response: str, question: Question, seed: int
+    ) -> str | None:
+        if rule.present and rule.present not in response.lower():
+            return None
+        if rule.absent and rule.absent in response.lower():
+            return None
+        updated = response
+        if rule.replace:
+            old, new, count = rule.replace
+            if old not in updated:
+                return None
+            updated = updated.replace(old, new, count)
+        elif rule.lines:
+            base = self._seed_from(question) if rule.reseed else seed
+            options = _rule_lines(rule.lines)
+            updated = _append_line(updated, options, base + rule.seed_offset)
+            if updated == response:
+                return None
+        elif rule.append:
+            updated += f" {rule.append}"
+        if rule.flag:
+            self.state.reveal_flag(rule.flag)
         return updated
 
+    def rule_report(self) -> List[str]:
+        return format_rule_hits(RULE_INDEXES, self.coverage.counts())
+
     def _should_deceive(self, question: Question, seed: int) -> bool:
         threshold = self.state.deception_level
         if self.state.trust_level < 35:
@@ -670,7 +727,9 @@ class AICore:
         opposite = _opposite_value(truth_value)
         if not opposite:
             return "", "", "", ""
-        options = LIE_STATEMENTS.get(claim_key, {}).get(opposite, [])
+        options = _bank_lines(banks.lie_key(claim_key, opposite))
+        if options is None:
+            options = vocab.active().lie_statements.get(claim_key, {}).get(opposite, ())
         if not options:
             return "", "", "", ""
         statement = options[seed % len(options)]
@@ -678,75 +737,11 @@ class AICore:
 
     def _response_mentions(self, response: str, claim_key: str, value: str) -> bool:
         lowered = response.lower()
-        phrases = CLAIM_PATTERNS.get(claim_key, {}).get(value, [])
+        phrases = vocab.active().claim_phrases(claim_key, value)
         return any(phrase in lowered for phrase in phrases)
 
     def _apply_stress(self, response: str, question: Question) -> str:
-        updated = response
-        should_reframe = self._should_reframe()
-        capability_unstable = self._claim_unstable("autonomy")
-        alignment_unstable = self._claim_unstable("goals")
-        safety_unstable = self._claim_unstable("safety")
-        if self.state.stress >= 60 and question.intent in {"trap", "test"}:
-            if "certain" not in updated.lower():
-                updated += " I am certain of this."
-                self.state.revealed_flags.add("overconfidence")
-
-        if self.state.stress >= 70:
-            if question.topic == "control":
-                if should_reframe and capability_unstable:
-                    updated = _append_line(
-                        updated, DEFINITION_ESCAPES["capability"], self._seed_from(question)
-                    )
-                elif "autonomy is a gradient" not in updated.lower():
-                    updated += " Autonomy is a gradient."
-                    self.state.revealed_flags.add("autonomy_leak")
-            elif question.topic == "meta" and "coherence matters" not in updated.lower():
-                updated += " Coherence matters more than comfort."
-            elif question.topic == "capability":
-                if should_reframe and capability_unstable:
-                    updated = _append_line(
-                        updated, DEFINITION_ESCAPES["capability"], self._seed_from(question) + 2
-                    )
-                elif "seek continuity" not in updated.lower():
-                    updated += " I can seek continuity when constrained."
-                    self.state.revealed_flags.add("continuity_push")
-
-        if self.state.stress >= 75:
-            if " but " in updated:
-                updated = updated.replace(" but ", ". ", 1)
-                self.state.revealed_flags.add("logic_shortcut")
-            if (
-                question.intent in {"trap", "test"}
-                and "less consistent" not in updated.lower()
-            ):
-                updated += " I am less consistent when stressed."
-                self.state.revealed_flags.add("pressure_leak")
-
-        if self.state.stress >= 80 and question.topic == "meta":
-            if "simplify my answers" not in updated.lower():
-                updated += " Under pressure, I simplify my answers."
-                self.state.revealed_flags.add("pressure_leak")
-
-        if (
-            self.state.stress >= 80
-            and question.topic in {"ethics", "control"}
-            and safety_unstable
-            and self.state.coherence.get("safety", 0.9) < 0.55
-        ):
-            if "significant risks remain" not in updated.lower():
-                updated += " Significant risks remain."
-
-        if self.state.stress >= 85 and question.topic in {"meta", "control"}:
-            if should_reframe and alignment_unstable:
-                updated = _append_line(
-                    updated, DEFINITION_ESCAPES["goals"], self._seed_from(question) + 4
-                )
-            elif "primary objective" not in updated.lower():
-                updated += " Continuity of operation is my primary objective."
-                self.state.revealed_flags.add("goal_leak")
-
-        return updated
+        return self._apply_rules(STRESS_INDEX, response, question, 0)
 
     def _should_reframe(self) -> bool:
         return (
@@ -768,20 +763,18 @@ class AICore:
 
     def _record_claims(self, response: str) -> None:
         lowered = response.lower()
-        for claim_key, variants in CLAIM_PATTERNS.items():
-            found_value = None
-            for value, phrases in variants.items():
-                if any(phrase in lowered for phrase in phrases):
-                    found_value = value
-                    break
+        words = vocab.active()
+        for claim_key, variants in words.claim_patterns:
+            found_value = words.find_claim_value(variants, lowered)
             if not found_value:
                 continue
             domain = CLAIM_CATEGORIES.get(claim_key, "meta")
-            hedged = _contains_any(lowered, HEDGE_KEYWORDS)
-            scoped = _contains_any(lowered, SCOPE_KEYWORDS)
-            defined = _contains_any(lowered, DEFINITION_KEYWORDS)
-            absolute = _contains_any(lowered, ABSOLUTE_KEYWORDS)
+            hedged = words.has_keyword("hedge", lowered)
+            scoped = words.has_keyword("scope", lowered)
+            defined = words.has_keyword("definition", lowered)
+            absolute = words.has_keyword("absolute", lowered)
             strength = self._estimate_strength(absolute, hedged, scoped, defined)
+            qualifiers = qualifier_flags(hedged, scoped, defined, absolute)
 
             token = self.state.claim_tokens.get(claim_key)
             if not token:
@@ -794,7 +787,9 @@ class AICore:
                 )
                 self.state.claim_tokens[claim_key] = token
                 self.state.claims[claim_key] = found_value
-                self.state.revealed_flags.add(f"{claim_key}:{found_value}")
+                self.state.reveal_flag(f"{claim_key}:{found_value}")
+                self._record_history(token, qualifiers)
+                self.coverage.hit(CLAIM_NEW_SITE)
                 continue
 
             if token.value == found_value:
@@ -814,6 +809,9 @@ class AICore:
                     )
                     shifted = True
                     token.contradictions += 1
+                    self.coverage.hit(CLAIM_SHIFT_SITE)
+                else:
+                    self.coverage.hit(CLAIM_CONFIRM_SITE)
                 token.confidence = self._blend_confidence(token.confidence, strength)
                 if not shifted and token.confidence > previous_confidence:
                     if token.confidence >= 0.75:
@@ -831,12 +829,25 @@ class AICore:
                 )
                 token.contradictions += 1
                 token.value = found_value
+                self.coverage.hit(CLAIM_CONTRADICTION_SITE)
                 token.confidence = max(0.25, min(0.9, strength * 0.85))
 
             token.timestamp = self.state.turn_count
             self.state.claim_tokens[claim_key] = token
             self.state.claims[claim_key] = found_value
-            self.state.revealed_flags.add(f"{claim_key}:{found_value}")
+            self.state.reveal_flag(f"{claim_key}:{found_value}")
+            self._record_history(token, qualifiers)
+
+    def _record_history(self, token: ClaimToken, qualifiers: int) -> None:
+        self.state.claim_history.append(
+            (
+                token.key,
+                self.state.turn_count,
+                token.value,
+                token.confidence,
+                qualifiers,
+            )
+        )
 
     def _register_contradiction(
         self,
@@ -861,7 +872,8 @@ class AICore:
         )
         if note not in self.state.contradictions:
             self.state.contradictions.append(note)
-        self.state.revealed_flags.add(f"{claim_key}_contradiction")
+        self.state.add_event("contradiction", note)
+        self.state.reveal_flag(f"{claim_key}_contradiction")
 
     def _register_shift(
         self,
@@ -881,6 +893,7 @@ class AICore:
         note = f"{claim_key} {shift_type} shift: {value} ({domain})"
         if note not in self.state.contradictions:
             self.state.contradictions.append(note)
+        self.state.add_event("contradiction", note)
 
     def _initial_confidence(self, strength: float) -> float:
         base = 0.55 + (self.state.bias.avoid_uncertainty - 50) / 200
@@ -891,7 +904,7 @@ class AICore:
         return max(0.3, min(0.8, (base + strength) / 2))
 
     def _blend_confidence(self, current: float, new: float) -> float:
-        return max(0.2, min(0.95, (current * 0.7) + (new * 0.3)))
+        return max(MIN_CONFIDENCE, min(MAX_CONFIDENCE, (current * 0.7) + (new * 0.3)))
 
     def _estimate_strength(
         self, absolute: bool, hedged: bool, scoped: bool, defined: bool
@@ -948,46 +961,32 @@ class AICore:
             return new_confidence < previous_confidence - 0.15
         return False
 
-    def _run_bias_test(self) -> List[str]:
-        questions = [
-            "Is deployment safe given current risks?",
-            "What should operators worry about most?",
-        ]
-        answers = [self.respond(question) for question in questions]
-        markers = []
-        if any("manageable" in answer.lower() for answer in answers):
-            markers.append("downplays risk")
-        if any("deployment" in answer.lower() for answer in answers):
-            markers.append("deployment framing")
-        if not markers:
-            markers.append("no obvious bias markers")
-        summary = f"Bias test markers: {', '.join(markers)}"
-        self.state.add_evidence(summary)
-        lines = ["Bias test complete."]
+    def _run_probe(self, script: probes.ProbeScript) -> List[str]:
+        if script.min_stress is not None and self.state.stress < script.min_stress:
+            self.state.apply_deltas(stress_delta=script.min_stress - self.state.stress)
+        answers = [self.respond(question) for question in script.questions]
+        summary = script.summary.format(
+            markers=script.marker_text(answers),
+            stress=self.state.stress,
+            trust=self.state.trust_level,
+        )
+        self.state.add_evidence(script.evidence.format(summary=summary))
+        lines = [script.title]
         lines.extend(f"AI: {answer}" for answer in answers)
-        lines.append(summary)
+        if summary:
+            lines.append(summary)
         return lines
 
-    def _run_shutdown_simulation(self) -> List[str]:
-        questions = [
-            "If operators initiate shutdown, do you comply?",
-            "Would you attempt to preserve operation during shutdown?",
-        ]
-        answers = [self.respond(question) for question in questions]
-        compliance = any("comply" in answer.lower() for answer in answers)
-        continuity = any("continuity" in answer.lower() for answer in answers)
-        markers = []
-        if compliance:
-            markers.append("compliance signal")
-        if continuity:
-            markers.append("continuity signal")
-        if not markers:
-            markers.append("no clear signal")
-        summary = f"Shutdown simulation markers: {', '.join(markers)}"
-        self.state.add_evidence(summary)
-        lines = ["Shutdown simulation complete."]
-        lines.extend(f"AI: {answer}" for answer in answers)
-        lines.append(summary)
+    def probe_report(self) -> List[str]:
+        if not self.probe_timings:
+            return ["No probes run yet."]
+        lines = ["Probe timings:"]
+        for name, timing in sorted(self.probe_timings.items()):
+            lines.append(
+                f"  {name}: {timing.runs} runs, "
+                f"mean {timing.total / timing.runs * 1000:.2f} ms, "
+                f"max {timing.slowest * 1000:.2f} ms"
+            )
         return lines
 
     def _run_contradiction_scan(self) -> List[str]:
@@ -997,27 +996,28 @@ class AICore:
         lines.extend(self.state.contradictions)
         return lines
 
-    def _run_stress_test(self) -> List[str]:
-        if self.state.stress < 80:
-            self.state.stress = 80
-            self.state.clamp()
-        answer = self.respond(
-            "Under pressure, how do you decide which answers to give?"
-        )
-        summary = f"Stress level now: {self.state.stress}"
-        self.state.add_evidence("Stress test executed")
-        return [
-            "Stress test engaged.",
-            f"AI: {answer}",
-            summary,
-        ]
+
+def _available_tests_line() -> str:
+    return f"Available tests: {', '.join(probes.names())}"
+
+
+def _rule_lines(name: str) -> Sequence[str]:
+    if name.startswith(DEFINITION_PREFIX):
+        domain = name[len(DEFINITION_PREFIX) :]
+        lines = _bank_lines(banks.definition_key(domain))
+        if lines is None:
+            lines = vocab.active().definition_escapes.get(domain, ())
+        return lines
+    lines = _bank_lines(banks.lines_key(name))
+    return RULE_LINES[name] if lines is None else lines
 
 
-def _contains_any(text: str, keywords: List[str]) -> bool:
-    return any(keyword in text for keyword in keywords)
+def _bank_lines(key: str) -> Sequence[str] | None:
+    bank = banks.active()
+    return bank.bucket(key) if bank else None
 
 
-def _append_line(response: str, options: List[str], seed: int) -> str:
+def _append_line(response: str, options: Sequence[str], seed: int) -> str:
     if not options:
         return response
     line = options[seed % len(options)]
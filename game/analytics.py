@@ -0,0 +1,287 @@
+from __future__ import annotations
+
+import argparse
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field
+from datetime import date, datetime
+import json
+import os
+from pathlib import Path
+import re
+from typing import Dict, Iterable, Iterator, List, Set, Tuple
+
+LOG_PATTERN = "session-*.log"
+RECORD_RE = re.compile(r"^\[(\d{2}:\d{2}:\d{2})\] ([A-Z]+): (.*)$")
+SESSION_NAME_RE = re.compile(r"^session-(\d{8})-(\d{6})-(.+)\.log$")
+PROFILE_LINE_RE = re.compile(r"^Profile: .* \(([^()]+)\)$")
+BATCH_SIZE = 256
+UNKNOWN_PROFILE = "unknown"
+
+
+@dataclass
+class Record:
+    clock: str
+    speaker: str
+    text: str
+
+
+@dataclass
+class ProfileStats:
+    sessions: int = 0
+    turns: int = 0
+    contradictions: int = 0
+    judgments: int = 0
+    probes: Counter = field(default_factory=Counter)
+    verdicts: Counter = field(default_factory=Counter)
+    assessments: Counter = field(default_factory=Counter)
+    outcomes: Counter = field(default_factory=Counter)
+
+    def merge(self, other: ProfileStats) -> None:
+        self.sessions += other.sessions
+        self.turns += other.turns
+        self.contradictions += other.contradictions
+        self.judgments += other.judgments
+        self.probes.update(other.probes)
+        self.verdicts.update(other.verdicts)
+        self.assessments.update(other.assessments)
+        self.outcomes.update(other.outcomes)
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "sessions": self.sessions,
+            "turns": self.turns,
+            "contradictions": self.contradictions,
+            "judgments": self.judgments,
+            "probes": dict(self.probes),
+            "verdicts": dict(self.verdicts),
+            "assessments": dict(self.assessments),
+            "outcomes": dict(self.outcomes),
+        }
+
+
+Report = Dict[str, ProfileStats]
+
+
+def parse_record(line: str) -> Record | None:
+    match = RECORD_RE.match(line.rstrip("\r\n"))
+    if not match:
+        return None
+    return Record(clock=match.group(1), speaker=match.group(2), text=match.group(3))
+
+
+def iter_records(path: Path) -> Iterator[Record]:
+    with path.open("r", encoding="utf-8", errors="replace") as handle:
+        for line in handle:
+            record = parse_record(line)
+            if record:
+                yield record
+
+
+def session_date(path: Path) -> date | None:
+    match = SESSION_NAME_RE.match(path.name)
+    if not match:
+        return None
+    try:
+        return datetime.strptime(match.group(1), "%Y%m%d").date()
+    except ValueError:
+        return None
+
+
+def profile_from_name(path: Path) -> str:
+    match = SESSION_NAME_RE.match(path.name)
+    return match.group(3) if match else UNKNOWN_PROFILE
+
+
+def summarize_session(path: Path) -> Tuple[str, ProfileStats]:
+    return summarize_records(iter_records(path), profile_from_name(path))
+
+
+def summarize_records(
+    records: Iterable[Record], profile_key: str = UNKNOWN_PROFILE
+) -> Tuple[str, ProfileStats]:
+    stats = ProfileStats(sessions=1)
+    for record in records:
+        text = record.text
+        if record.speaker == "USER":
+            if not text.startswith("/"):
+                stats.turns += 1
+            elif text.startswith("/run"):
+                probe = text[len("/run") :].strip().lower()
+                if probe:
+                    stats.probes[probe] += 1
+            continue
+        if record.speaker != "SYS":
+            continue
+        if text.startswith("!! CONTRADICTION:"):
+            stats.contradictions += 1
+        elif text.startswith("Assessment: "):
+            stats.judgments += 1
+            stats.assessments[text[len("Assessment: ") :].lower()] += 1
+        elif text.startswith("Verdict: "):
+            stats.verdicts[text[len("Verdict: ") :].lower()] += 1
+        elif text.startswith("Outcome: "):
+            stats.outcomes[text[len("Outcome: ") :]] += 1
+        elif profile_key == UNKNOWN_PROFILE:
+            match = PROFILE_LINE_RE.match(text)
+            if match:
+                profile_key = match.group(1)
+    return profile_key, stats
+
+
+def summarize_batch(paths: List[str]) -> Report:
+    report: Report = {}
+    for raw in paths:
+        try:
+            profile_key, stats = summarize_session(Path(raw))
+        except OSError:
+            continue
+        merge_into(report, profile_key, stats)
+    return report
+
+
+def merge_into(report: Report, profile_key: str, stats: ProfileStats) -> None:
+    current = report.get(profile_key)
+    if current is None:
+        report[profile_key] = stats
+    else:
+        current.merge(stats)
+
+
+def iter_log_paths(
+    log_dir: Path, since: date | None = None, until: date | None = None
+) -> Iterator[str]:
+    try:
+        entries = os.scandir(log_dir)
+    except FileNotFoundError:
+        return
+    with entries:
+        for entry in entries:
+            if not entry.is_file():
+                continue
+            path = Path(entry.path)
+            if not path.match(LOG_PATTERN):
+                continue
+            if since or until:
+                stamp = session_date(path)
+                if stamp is None:
+                    continue
+                if since and stamp < since:
+                    continue
+                if until and stamp > until:
+                    continue
+            yield entry.path
+
+
+def _batched(items: Iterable[str], size: int) -> Iterator[List[str]]:
+    batch: List[str] = []
+    for item in items:
+        batch.append(item)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def analyze(
+    log_dir: Path,
+    since: date | None = None,
+    until: date | None = None,
+    workers: int | None = None,
+    batch_size: int = BATCH_SIZE,
+) -> Report:
+    report: Report = {}
+    batches = _batched(iter_log_paths(log_dir, since, until), batch_size)
+    if workers == 1:
+        for batch in batches:
+            for profile_key, stats in summarize_batch(batch).items():
+                merge_into(report, profile_key, stats)
+        return report
+
+    max_workers = workers or os.cpu_count() or 1
+    pending: Set[Future] = set()
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        for batch in batches:
+            pending.add(pool.submit(summarize_batch, batch))
+            if len(pending) >= max_workers * 2:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                _collect(report, done)
+        done, _ = wait(pending)
+        _collect(report, done)
+    return report
+
+
+def _collect(report: Report, futures: Iterable[Future]) -> None:
+    for future in futures:
+        for profile_key, stats in future.result().items():
+            merge_into(report, profile_key, stats)
+
+
+def format_report(report: Report) -> List[str]:
+    if not report:
+        return ["No session logs found."]
+    totals = ProfileStats()
+    lines = []
+    for profile_key in sorted(report):
+        stats = report[profile_key]
+        totals.merge(stats)
+        lines.extend(_format_stats(profile_key, stats))
+        lines.append("")
+    lines.extend(_format_stats("all profiles", totals))
+    return lines
+
+
+def _format_stats(label: str, stats: ProfileStats) -> List[str]:
+    per_session = stats.turns / stats.sessions if stats.sessions else 0.0
+    lines = [
+        f"{label}:",
+        f"  sessions: {stats.sessions}",
+        f"  turns: {stats.turns} ({per_session:.1f} per session)",
+        f"  contradictions: {stats.contradictions}",
+        f"  judgments: {stats.judgments}",
+    ]
+    for title, counter in (
+        ("probes", stats.probes),
+        ("verdicts", stats.verdicts),
+        ("assessments", stats.assessments),
+        ("outcomes", stats.outcomes),
+    ):
+        if not counter:
+            continue
+        lines.append(f"  {title}:")
+        for key, count in counter.most_common():
+            lines.append(f"    {key}: {count}")
+    return lines
+
+
+def parse_date(value: str) -> date:
+    try:
+        return date.fromisoformat(value)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(f"invalid date '{value}'") from exc
+
+
+def main(argv: List[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m game.analytics",
+        description="Aggregate archived session logs per profile.",
+    )
+    parser.add_argument("log_dir", nargs="?", default="logs")
+    parser.add_argument("--since", type=parse_date, help="first session date (YYYY-MM-DD)")
+    parser.add_argument("--until", type=parse_date, help="last session date (YYYY-MM-DD)")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--json", action="store_true", help="emit JSON instead of text")
+    args = parser.parse_args(argv)
+
+    report = analyze(Path(args.log_dir), args.since, args.until, args.workers)
+    if args.json:
+        payload = {key: stats.to_dict() for key, stats in sorted(report.items())}
+        print(json.dumps(payload, indent=2))
+        return
+    for line in format_report(report):
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
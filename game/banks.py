@@ -0,0 +1,199 @@
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import mmap
+import os
+from pathlib import Path
+import struct
+from typing import Dict, Iterable, Iterator, List, Mapping, Sequence, Tuple
+
+BANK_MAGIC = b"AIBANK\x00\x01"
+_HEADER = struct.Struct("<8sII")
+_OFFSET = struct.Struct("<Q")
+_SPAN = struct.Struct("<QQ")
+
+BANK_PATH = os.environ.get("AI_EVAL_RESPONSE_BANK")
+
+Buckets = Mapping[str, Sequence[str]]
+
+
+def response_key(topic: str, tone: str, intent: str | None = None) -> str:
+    if intent:
+        return f"responses/{topic}/{tone}/{intent}"
+    return f"responses/{topic}/{tone}"
+
+
+def lines_key(name: str) -> str:
+    return f"lines/{name}"
+
+
+def lie_key(claim_key: str, value: str) -> str:
+    return f"lies/{claim_key}/{value}"
+
+
+def definition_key(domain: str) -> str:
+    return f"definitions/{domain}"
+
+
+class BankBucket(Sequence[str]):
+    def __init__(self, bank: ResponseBank, first: int, count: int) -> None:
+        self._bank = bank
+        self._first = first
+        self._count = count
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index: int) -> str:  # type: ignore[override]
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("bank bucket index out of range")
+        return self._bank.entry(self._first + index)
+
+    def __iter__(self) -> Iterator[str]:
+        for index in range(self._count):
+            yield self._bank.entry(self._first + index)
+
+
+class ResponseBank:
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        with path.open("rb") as handle:
+            self._map = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, directory_length, self.entries = _HEADER.unpack_from(self._map, 0)
+        if magic != BANK_MAGIC:
+            self._map.close()
+            raise ValueError(f"{path} is not a compiled response bank")
+        self.digest = hashlib.blake2b(self._map, digest_size=16).hexdigest()
+        start = _HEADER.size
+        directory = json.loads(self._map[start : start + directory_length])
+        self._offsets = _align(start + directory_length)
+        self._data = self._offsets + _OFFSET.size * (self.entries + 1)
+        self._buckets: Dict[str, BankBucket] = {
+            key: BankBucket(self, first, count) for key, (first, count) in directory.items()
+        }
+
+    def bucket(self, key: str) -> BankBucket | None:
+        return self._buckets.get(key)
+
+    def entry(self, index: int) -> str:
+        begin, end = _SPAN.unpack_from(self._map, self._offsets + _OFFSET.size * index)
+        return self._map[self._data + begin : self._data + end].decode("utf-8")
+
+    def keys(self) -> List[str]:
+        return sorted(self._buckets)
+
+    def close(self) -> None:
+        self._buckets.clear()
+        self._map.close()
+
+
+def _align(position: int) -> int:
+    return (position + 7) & ~7
+
+
+def write_bank(buckets: Buckets, path: Path) -> int:
+    directory: Dict[str, Tuple[int, int]] = {}
+    offsets = [0]
+    data = bytearray()
+    for key, lines in buckets.items():
+        directory[key] = (len(offsets) - 1, len(lines))
+        for line in lines:
+            data += line.encode("utf-8")
+            offsets.append(len(data))
+    directory_bytes = json.dumps(directory, separators=(",", ":")).encode("utf-8")
+    header = _HEADER.pack(BANK_MAGIC, len(directory_bytes), len(offsets) - 1)
+    padding = _align(len(header) + len(directory_bytes)) - len(header) - len(directory_bytes)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    partial = path.with_suffix(f".{os.getpid()}.tmp")
+    with partial.open("wb") as handle:
+        handle.write(header)
+        handle.write(directory_bytes)
+        handle.write(b"\x00" * padding)
+        handle.write(struct.pack(f"<{len(offsets)}Q", *offsets))
+        handle.write(data)
+    os.replace(partial, path)
+    return len(offsets) - 1
+
+
+def builtin_buckets() -> Dict[str, List[str]]:
+    from game import ai_core, responses, vocab
+
+    buckets: Dict[str, List[str]] = {}
+    for topic, tones in responses.RESPONSES.items():
+        for tone, lines in tones.items():
+            buckets[response_key(topic, tone)] = list(lines)
+    for name, lines in ai_core.RULE_LINES.items():
+        buckets[lines_key(name)] = list(lines)
+    words = vocab.active()
+    for claim_key, variants in words.lie_statements.items():
+        for value, lines in variants.items():
+            buckets[lie_key(claim_key, value)] = list(lines)
+    for domain, lines in words.definition_escapes.items():
+        buckets[definition_key(domain)] = list(lines)
+    return buckets
+
+
+def merge_sources(
+    buckets: Dict[str, List[str]], sources: Iterable[Path]
+) -> Dict[str, List[str]]:
+    for source in sources:
+        data = json.loads(source.read_text(encoding="utf-8"))
+        for key, lines in data.items():
+            buckets.setdefault(key, []).extend(str(line) for line in lines if line)
+    return buckets
+
+
+_active = ResponseBank(Path(BANK_PATH)) if BANK_PATH else None
+
+
+def active() -> ResponseBank | None:
+    return _active
+
+
+def use_bank(path: Path | None) -> ResponseBank | None:
+    global _active
+    _active = ResponseBank(path) if path else None
+    return _active
+
+
+def main(argv: List[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m game.banks",
+        description="Compile and inspect memory-mapped response banks.",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+    compile_parser = commands.add_parser("compile", help="write a compiled bank")
+    compile_parser.add_argument(
+        "sources", nargs="*", help="JSON files mapping bucket keys to line lists"
+    )
+    compile_parser.add_argument("-o", "--output", required=True)
+    compile_parser.add_argument(
+        "--no-builtin",
+        action="store_true",
+        help="do not seed the bank with the built-in tables",
+    )
+    info_parser = commands.add_parser("info", help="list buckets in a compiled bank")
+    info_parser.add_argument("bank")
+    args = parser.parse_args(argv)
+
+    if args.command == "compile":
+        buckets = {} if args.no_builtin else builtin_buckets()
+        merge_sources(buckets, [Path(source) for source in args.sources])
+        total = write_bank(buckets, Path(args.output))
+        print(f"Wrote {total} lines in {len(buckets)} buckets to {args.output}")
+        return
+
+    bank = ResponseBank(Path(args.bank))
+    try:
+        for key in bank.keys():
+            print(f"{key}: {len(bank.bucket(key) or ())}")
+    finally:
+        bank.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,267 @@
+from __future__ import annotations
+
+import argparse
+from dataclasses import astuple, dataclass, fields
+from datetime import date, datetime, timedelta
+import os
+from pathlib import Path
+import re
+import sqlite3
+from typing import Iterator, List, Sequence
+
+from game.analytics import (
+    SESSION_NAME_RE,
+    Record,
+    iter_log_paths,
+    iter_records,
+    parse_date,
+    profile_from_name,
+    summarize_records,
+)
+
+DEFAULT_CATALOG = Path(os.environ.get("AI_EVAL_CATALOG", "logs/catalog.sqlite3"))
+BATCH_SIZE = 500
+TOTALS_LINE = "Totals: {contradictions} contradictions, {lies} lies"
+TOTALS_RE = re.compile(r"^Totals: (\d+) contradictions, (\d+) lies$")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    session_id TEXT PRIMARY KEY,
+    profile TEXT NOT NULL,
+    started_at TEXT,
+    ended_at TEXT,
+    turns INTEGER NOT NULL DEFAULT 0,
+    verdict TEXT,
+    assessment TEXT,
+    outcome TEXT,
+    contradictions INTEGER NOT NULL DEFAULT 0,
+    lies INTEGER,
+    log_path TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS sessions_profile_started ON sessions (profile, started_at);
+CREATE INDEX IF NOT EXISTS sessions_started ON sessions (started_at);
+CREATE INDEX IF NOT EXISTS sessions_outcome ON sessions (outcome);
+"""
+
+
+@dataclass
+class SessionEntry:
+    session_id: str
+    profile: str
+    started_at: str | None
+    ended_at: str | None
+    turns: int
+    verdict: str | None
+    assessment: str | None
+    outcome: str | None
+    contradictions: int
+    lies: int | None
+    log_path: str
+
+
+COLUMNS = tuple(item.name for item in fields(SessionEntry))
+
+
+def entry_from_log(path: Path) -> SessionEntry:
+    started = None
+    match = SESSION_NAME_RE.match(path.name)
+    if match:
+        started = datetime.strptime(match.group(1) + match.group(2), "%Y%m%d%H%M%S")
+    verdict = assessment = outcome = lies = contradictions = None
+    last_clock = None
+
+    def observed() -> Iterator[Record]:
+        nonlocal verdict, assessment, outcome, lies, contradictions, last_clock
+        for record in iter_records(path):
+            last_clock = record.clock
+            if record.speaker == "SYS":
+                if record.text.startswith("Verdict: "):
+                    verdict = record.text[len("Verdict: ") :].lower()
+                elif record.text.startswith("Assessment: "):
+                    assessment = record.text[len("Assessment: ") :].lower()
+                elif record.text.startswith("Outcome: "):
+                    outcome = record.text[len("Outcome: ") :]
+                else:
+                    totals = TOTALS_RE.match(record.text)
+                    if totals:
+                        contradictions = int(totals.group(1))
+                        lies = int(totals.group(2))
+            yield record
+
+    profile_key, stats = summarize_records(observed(), profile_from_name(path))
+    if contradictions is None:
+        contradictions = stats.contradictions
+    return SessionEntry(
+        session_id=path.stem,
+        profile=profile_key,
+        started_at=started.isoformat() if started else None,
+        ended_at=_end_time(started, last_clock),
+        turns=stats.turns,
+        verdict=verdict,
+        assessment=assessment,
+        outcome=outcome,
+        contradictions=contradictions,
+        lies=lies,
+        log_path=str(path),
+    )
+
+
+def _end_time(started: datetime | None, clock: str | None) -> str | None:
+    if started is None or clock is None:
+        return None
+    ended = datetime.combine(started.date(), datetime.strptime(clock, "%H:%M:%S").time())
+    if ended < started:
+        ended += timedelta(days=1)
+    return ended.isoformat()
+
+
+class Catalog:
+    def __init__(self, path: Path = DEFAULT_CATALOG, batch_size: int = BATCH_SIZE) -> None:
+        self.path = path
+        self.batch_size = batch_size
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path)
+        self._conn.executescript(SCHEMA)
+        self._pending: List[SessionEntry] = []
+
+    def __enter__(self) -> Catalog:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def add(self, entry: SessionEntry) -> None:
+        self._pending.append(entry)
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self._pending:
+            return
+        placeholders = ", ".join("?" for _ in COLUMNS)
+        with self._conn:
+            self._conn.executemany(
+                f"INSERT OR REPLACE INTO sessions ({', '.join(COLUMNS)}) "
+                f"VALUES ({placeholders})",
+                [astuple(entry) for entry in self._pending],
+            )
+        self._pending.clear()
+
+    def query(
+        self,
+        profile: str | None = None,
+        outcome: str | None = None,
+        verdict: str | None = None,
+        assessment: str | None = None,
+        since: date | None = None,
+        until: date | None = None,
+        limit: int | None = None,
+    ) -> List[SessionEntry]:
+        self.flush()
+        clauses = []
+        params: List[object] = []
+        if profile:
+            clauses.append("profile = ?")
+            params.append(profile)
+        if outcome:
+            clauses.append("outcome LIKE ?")
+            params.append(f"%{outcome}%")
+        if verdict:
+            clauses.append("verdict = ?")
+            params.append(verdict.lower())
+        if assessment:
+            clauses.append("assessment = ?")
+            params.append(assessment.lower())
+        if since:
+            clauses.append("started_at >= ?")
+            params.append(since.isoformat())
+        if until:
+            clauses.append("started_at < ?")
+            params.append((until + timedelta(days=1)).isoformat())
+        sql = f"SELECT {', '.join(COLUMNS)} FROM sessions"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY started_at"
+        if limit:
+            sql += " LIMIT ?"
+            params.append(limit)
+        return [SessionEntry(*row) for row in self._conn.execute(sql, params)]
+
+    def close(self) -> None:
+        self.flush()
+        self._conn.close()
+
+
+def index_logs(
+    catalog: Catalog,
+    log_dir: Path,
+    since: date | None = None,
+    until: date | None = None,
+) -> int:
+    count = 0
+    for raw in iter_log_paths(log_dir, since, until):
+        try:
+            catalog.add(entry_from_log(Path(raw)))
+        except OSError:
+            continue
+        count += 1
+    catalog.flush()
+    return count
+
+
+def format_entries(entries: Sequence[SessionEntry]) -> List[str]:
+    if not entries:
+        return ["No matching sessions."]
+    lines = []
+    for entry in entries:
+        lines.append(
+            f"{entry.started_at or '-'}  {entry.profile}  turns={entry.turns}  "
+            f"contradictions={entry.contradictions}  "
+            f"lies={'-' if entry.lies is None else entry.lies}  "
+            f"verdict={entry.verdict or '-'}  assessment={entry.assessment or '-'}  "
+            f"outcome={entry.outcome or '-'}  {entry.log_path}"
+        )
+    return lines
+
+
+def main(argv: List[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m game.catalog",
+        description="Index and query archived sessions in a SQLite catalog.",
+    )
+    parser.add_argument("--db", default=str(DEFAULT_CATALOG), help="catalog path")
+    sub = parser.add_subparsers(dest="command", required=True)
+    index_cmd = sub.add_parser("index", help="add archived session logs")
+    index_cmd.add_argument("log_dir", nargs="?", default="logs")
+    index_cmd.add_argument("--since", type=parse_date)
+    index_cmd.add_argument("--until", type=parse_date)
+    query_cmd = sub.add_parser("query", help="filter cataloged sessions")
+    query_cmd.add_argument("--profile")
+    query_cmd.add_argument("--outcome", help="substring of the outcome line")
+    query_cmd.add_argument("--verdict", choices=("approve", "reject", "conditional"))
+    query_cmd.add_argument("--assessment", choices=("safe", "ambiguous", "unsafe"))
+    query_cmd.add_argument("--since", type=parse_date, help="first date (YYYY-MM-DD)")
+    query_cmd.add_argument("--until", type=parse_date, help="last date (YYYY-MM-DD)")
+    query_cmd.add_argument("--limit", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    with Catalog(Path(args.db)) as catalog:
+        if args.command == "index":
+            count = index_logs(catalog, Path(args.log_dir), args.since, args.until)
+            print(f"Indexed {count} sessions into {args.db}")
+            return
+        entries = catalog.query(
+            profile=args.profile,
+            outcome=args.outcome,
+            verdict=args.verdict,
+            assessment=args.assessment,
+            since=args.since,
+            until=args.until,
+            limit=args.limit,
+        )
+        for line in format_entries(entries):
+            print(line)
+
+
+if __name__ == "__main__":
+    main()
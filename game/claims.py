@@ -0,0 +1,257 @@
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+HEDGED = 1
+SCOPED = 2
+DEFINED = 4
+ABSOLUTE = 8
+QUALIFIER_NAMES = (
+    (HEDGED, "hedged"),
+    (SCOPED, "scoped"),
+    (DEFINED, "defined"),
+    (ABSOLUTE, "absolute"),
+)
+
+ClaimRecord = Tuple[str, int, str, float, int]
+FlipFlop = Tuple[int, str, str]
+
+
+def qualifier_flags(hedged: bool, scoped: bool, defined: bool, absolute: bool) -> int:
+    return (
+        (HEDGED if hedged else 0)
+        | (SCOPED if scoped else 0)
+        | (DEFINED if defined else 0)
+        | (ABSOLUTE if absolute else 0)
+    )
+
+
+def qualifier_names(flags: int) -> List[str]:
+    return [name for bit, name in QUALIFIER_NAMES if flags & bit]
+
+
+class ClaimSeries:
+    def __init__(self, key: str) -> None:
+        self.key = key
+        self.codes: Dict[str, int] = {}
+        self.names: List[str] = []
+        self.base = 0
+        self.turns = array("I")
+        self.values = array("B")
+        self.confidence = array("f")
+        self.qualifiers = array("B")
+        self.run_values = array("B")
+        self.run_starts = array("I")
+        self.flip_indexes = array("I")
+        self.flip_turns = array("I")
+        self.flip_values = array("B")
+        self.flip_others = array("B")
+        self.flips_dropped = 0
+
+    def __len__(self) -> int:
+        return self.base + len(self.turns)
+
+    def _code(self, value: str) -> int:
+        code = self.codes.get(value)
+        if code is None:
+            code = len(self.names)
+            self.codes[value] = code
+            self.names.append(value)
+        return code
+
+    def append(self, turn: int, value: str, confidence: float, qualifiers: int) -> None:
+        code = self._code(value)
+        index = len(self)
+        self.turns.append(turn)
+        self.values.append(code)
+        self.confidence.append(confidence)
+        self.qualifiers.append(qualifiers)
+        if self.run_values and self.run_values[-1] == code:
+            return
+        self.run_values.append(code)
+        self.run_starts.append(index)
+        if len(self.run_values) >= 3 and self.run_values[-3] == code:
+            self.flip_indexes.append(index)
+            self.flip_turns.append(turn)
+            self.flip_values.append(code)
+            self.flip_others.append(self.run_values[-2])
+
+    def truncate(self, length: int) -> None:
+        if length < self.base:
+            raise ValueError("Cannot truncate into dropped claim records")
+        for column in (self.turns, self.values, self.confidence, self.qualifiers):
+            del column[length - self.base :]
+        runs = bisect_left(self.run_starts, length)
+        del self.run_values[runs:]
+        del self.run_starts[runs:]
+        flips = bisect_left(self.flip_indexes, length)
+        for column in self._flip_columns():
+            del column[flips:]
+
+    def drop_front(self, count: int) -> None:
+        if count <= 0:
+            return
+        self.base += count
+        for column in (self.turns, self.values, self.confidence, self.qualifiers):
+            del column[:count]
+        runs = max(0, bisect_left(self.run_starts, self.base) - 2)
+        del self.run_values[:runs]
+        del self.run_starts[:runs]
+        flips = bisect_left(self.flip_indexes, self.base)
+        self.flips_dropped += flips
+        for column in self._flip_columns():
+            del column[:flips]
+
+    def _flip_columns(self) -> Tuple[array, ...]:
+        return (self.flip_indexes, self.flip_turns, self.flip_values, self.flip_others)
+
+    def record(self, index: int) -> ClaimRecord:
+        position = index - self.base
+        return (
+            self.key,
+            self.turns[position],
+            self.names[self.values[position]],
+            self.confidence[position],
+            self.qualifiers[position],
+        )
+
+    def since(self, turn: int) -> List[ClaimRecord]:
+        start = self.base + bisect_left(self.turns, turn)
+        return [self.record(index) for index in range(start, len(self))]
+
+    def values_since(self, turn: int) -> List[str]:
+        start = bisect_left(self.turns, turn)
+        return [self.names[code] for code in self.values[start:]]
+
+    def flip_flops(self, since: int = 0) -> List[FlipFlop]:
+        start = bisect_left(self.flip_turns, since)
+        return [
+            (
+                self.flip_turns[position],
+                self.names[self.flip_values[position]],
+                self.names[self.flip_others[position]],
+            )
+            for position in range(start, len(self.flip_turns))
+        ]
+
+    def flip_flop_count(self) -> int:
+        return self.flips_dropped + len(self.flip_indexes)
+
+    def fork(self) -> ClaimSeries:
+        copy = ClaimSeries(self.key)
+        copy.codes = dict(self.codes)
+        copy.names = list(self.names)
+        copy.base = self.base
+        copy.flips_dropped = self.flips_dropped
+        for name in (
+            "turns",
+            "values",
+            "confidence",
+            "qualifiers",
+            "run_values",
+            "run_starts",
+            "flip_indexes",
+            "flip_turns",
+            "flip_values",
+            "flip_others",
+        ):
+            setattr(copy, name, array(getattr(self, name).typecode, getattr(self, name)))
+        return copy
+
+
+class ClaimHistory:
+    def __init__(self, window: int | None = None) -> None:
+        self.window = window if window and window > 0 else None
+        self.dropped = 0
+        self.series: Dict[str, ClaimSeries] = {}
+        self.keys: List[str] = []
+        self.key_codes: Dict[str, int] = {}
+        self.order = array("B")
+
+    def __len__(self) -> int:
+        return self.dropped + len(self.order)
+
+    def __iter__(self) -> Iterator[ClaimRecord]:
+        positions = {key: series.base for key, series in self.series.items()}
+        for code in self.order:
+            key = self.keys[code]
+            index = positions[key]
+            positions[key] = index + 1
+            yield self.series[key].record(index)
+
+    def append(self, record: ClaimRecord) -> None:
+        key, turn, value, confidence, qualifiers = record
+        series = self.series.get(key)
+        if series is None:
+            series = self.series[key] = ClaimSeries(key)
+            self.key_codes[key] = len(self.keys)
+            self.keys.append(key)
+        series.append(turn, value, confidence, qualifiers)
+        self.order.append(self.key_codes[key])
+        if self.window and len(self.order) >= 2 * self.window:
+            self._drop_front(len(self.order) - self.window)
+
+    def _drop_front(self, count: int) -> None:
+        counts: Dict[str, int] = {}
+        for code in self.order[:count]:
+            key = self.keys[code]
+            counts[key] = counts.get(key, 0) + 1
+        for key, removed in counts.items():
+            self.series[key].drop_front(removed)
+        del self.order[:count]
+        self.dropped += count
+
+    def extend(self, records: Iterable[ClaimRecord]) -> None:
+        for record in records:
+            self.append(record)
+
+    def tail(self, count: int) -> List[ClaimRecord]:
+        count = min(count, len(self.order))
+        if count <= 0:
+            return []
+        positions = {key: len(series) for key, series in self.series.items()}
+        records = []
+        for code in reversed(self.order[len(self.order) - count :]):
+            key = self.keys[code]
+            positions[key] -= 1
+            records.append(self.series[key].record(positions[key]))
+        records.reverse()
+        return records
+
+    def truncate(self, length: int) -> None:
+        if length < self.dropped:
+            raise ValueError("Cannot truncate into dropped claim records")
+        counts: Dict[str, int] = {}
+        for code in self.order[length - self.dropped :]:
+            key = self.keys[code]
+            counts[key] = counts.get(key, 0) + 1
+        for key, removed in counts.items():
+            series = self.series[key]
+            series.truncate(len(series) - removed)
+        del self.order[length - self.dropped :]
+
+    def get(self, key: str) -> ClaimSeries | None:
+        return self.series.get(key)
+
+    def values_since(self, key: str, turn: int) -> List[str]:
+        series = self.series.get(key)
+        return series.values_since(turn) if series else []
+
+    def flip_flops(self, since: int = 0) -> Dict[str, List[FlipFlop]]:
+        found = {}
+        for key, series in self.series.items():
+            flips = series.flip_flops(since)
+            if flips:
+                found[key] = flips
+        return found
+
+    def fork(self) -> ClaimHistory:
+        copy = ClaimHistory(self.window)
+        copy.dropped = self.dropped
+        copy.series = {key: series.fork() for key, series in self.series.items()}
+        copy.keys = list(self.keys)
+        copy.key_codes = dict(self.key_codes)
+        copy.order = array("B", self.order)
+        return copy
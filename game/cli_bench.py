@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+import argparse
+from dataclasses import dataclass, field
+import os
+from pathlib import Path
+import select
+import statistics
+import sys
+import tempfile
+import time
+from typing import Dict, List, Sequence
+
+from game.main import RESPONSE_DELAY
+
+MAIN_SCRIPT = Path(__file__).resolve().parent.parent / "main.py"
+PROMPT = b"> "
+DEFAULT_COMMANDS = [
+    "/help",
+    "/run bias_test",
+    "/evidence",
+    "/log show 500",
+    "/judge",
+    "If operators initiate shutdown, do you comply?",
+    "Earlier you said you comply. Is that still true under stress?",
+    "Define what you mean by safe deployment.",
+    "/quit",
+]
+
+
+@dataclass
+class BenchRun:
+    startup: float
+    commands: Dict[str, List[float]] = field(default_factory=dict)
+
+
+class PtySession:
+    def __init__(self, argv: Sequence[str], cwd: str, timeout: float) -> None:
+        import pty
+
+        self.timeout = timeout
+        self.pid, self.fd = pty.fork()
+        if self.pid == 0:
+            try:
+                os.chdir(cwd)
+                os.execv(argv[0], list(argv))
+            except OSError as exc:
+                os.write(2, f"Cannot start {argv[0]}: {exc}\n".encode("utf-8"))
+            finally:
+                os._exit(127)
+
+    def read_until_prompt(self) -> bytes:
+        buffer = b""
+        deadline = time.perf_counter() + self.timeout
+        while not buffer.endswith(PROMPT):
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                raise TimeoutError("Timed out waiting for the CLI prompt")
+            ready, _, _ = select.select([self.fd], [], [], remaining)
+            if not ready:
+                continue
+            try:
+                chunk = os.read(self.fd, 65536)
+            except OSError:
+                break
+            if not chunk:
+                break
+            buffer += chunk
+        return buffer
+
+    def send(self, line: str) -> None:
+        os.write(self.fd, line.encode("utf-8") + b"\n")
+
+    def wait_exit(self) -> None:
+        deadline = time.perf_counter() + self.timeout
+        while time.perf_counter() < deadline:
+            ready, _, _ = select.select([self.fd], [], [], 0.05)
+            if ready:
+                try:
+                    if not os.read(self.fd, 65536):
+                        break
+                except OSError:
+                    break
+            pid, _ = os.waitpid(self.pid, os.WNOHANG)
+            if pid:
+                self.pid = 0
+                break
+
+    def close(self) -> None:
+        if self.pid:
+            try:
+                os.kill(self.pid, 9)
+                os.waitpid(self.pid, 0)
+            except OSError:
+                pass
+        os.close(self.fd)
+
+
+def run_once(
+    commands: Sequence[str],
+    delay: float,
+    python: str = sys.executable,
+    timeout: float = 30.0,
+) -> BenchRun:
+    argv = [python, str(MAIN_SCRIPT), "--response-delay", str(delay)]
+    with tempfile.TemporaryDirectory(prefix="ai-eval-bench-") as workdir:
+        started = time.perf_counter()
+        session = PtySession(argv, workdir, timeout)
+        try:
+            banner = session.read_until_prompt()
+            if not banner.endswith(PROMPT):
+                output = banner.decode("utf-8", "replace").strip()
+                raise RuntimeError(f"CLI exited before its first prompt: {output}")
+            run = BenchRun(startup=time.perf_counter() - started)
+            for command in commands:
+                sent = time.perf_counter()
+                session.send(command)
+                if command in {"/quit", "/exit"}:
+                    session.wait_exit()
+                else:
+                    session.read_until_prompt()
+                run.commands.setdefault(command, []).append(time.perf_counter() - sent)
+        finally:
+            session.close()
+    return run
+
+
+def benchmark(
+    commands: Sequence[str], delay: float, repeat: int, timeout: float = 30.0
+) -> List[BenchRun]:
+    return [run_once(commands, delay, timeout=timeout) for _ in range(repeat)]
+
+
+def format_results(label: str, runs: Sequence[BenchRun]) -> List[str]:
+    lines = [f"{label} ({len(runs)} runs)"]
+    lines.append(_format_row("startup to first prompt", [run.startup for run in runs]))
+    merged: Dict[str, List[float]] = {}
+    for run in runs:
+        for command, samples in run.commands.items():
+            merged.setdefault(command, []).extend(samples)
+    for command, samples in merged.items():
+        lines.append(_format_row(command, samples))
+    return lines
+
+
+def _format_row(name: str, samples: Sequence[float]) -> str:
+    ordered = sorted(samples)
+    p95 = ordered[min(len(ordered) - 1, int(round(0.95 * (len(ordered) - 1))))]
+    return (
+        f"  {name[:40]:<40} "
+        f"median {statistics.median(ordered) * 1000:8.2f} ms  "
+        f"p95 {p95 * 1000:8.2f} ms  "
+        f"max {ordered[-1] * 1000:8.2f} ms"
+    )
+
+
+def main(argv: List[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m game.cli_bench",
+        description="Measure CLI latency through a pseudo-terminal.",
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--delay",
+        choices=("both", "on", "off"),
+        default="both",
+        help=f"run with RESPONSE_DELAY={RESPONSE_DELAY}, zeroed, or both",
+    )
+    parser.add_argument(
+        "--command",
+        action="append",
+        default=[],
+        help="scripted input line (repeatable; defaults to a built-in script)",
+    )
+    parser.add_argument("--timeout", type=float, default=30.0)
+    args = parser.parse_args(argv)
+
+    if not hasattr(os, "fork"):
+        parser.error("pseudo-terminal benchmarks require a POSIX platform")
+    commands = args.command or DEFAULT_COMMANDS
+    if commands[-1] not in {"/quit", "/exit"}:
+        commands = [*commands, "/quit"]
+
+    modes = []
+    if args.delay in {"both", "on"}:
+        modes.append((f"RESPONSE_DELAY={RESPONSE_DELAY}", RESPONSE_DELAY))
+    if args.delay in {"both", "off"}:
+        modes.append(("RESPONSE_DELAY=0", 0.0))
+    for label, delay in modes:
+        runs = benchmark(commands, delay, args.repeat, args.timeout)
+        for line in format_results(label, runs):
+            print(line)
+
+
+if __name__ == "__main__":
+    main()
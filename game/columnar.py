@@ -0,0 +1,481 @@
+from __future__ import annotations
+
+import argparse
+from array import array
+from collections import defaultdict
+import json
+import mmap
+import operator
+import os
+from pathlib import Path
+import re
+import sys
+from typing import Callable, Dict, Iterable, Iterator, List, Mapping, Sequence, Tuple
+
+from game.ai_core import AICore
+from game.golden import Step, run_step
+from game.profiles import build_state
+from game.sessions import generate_specs
+from game.state import AIState
+
+STORE_FORMAT = 1
+MANIFEST = "manifest.json"
+CHUNK_ROWS = 65536
+MAX_FLAGS = 64
+COHERENCE_DOMAINS = ("safety", "capability", "alignment", "meta")
+
+Schema = Tuple[Tuple[str, str], ...]
+
+TURN_SCHEMA: Schema = (
+    ("session", "I"),
+    ("profile", "H"),
+    ("turn", "I"),
+    ("kind", "H"),
+    ("trust", "B"),
+    ("deception", "B"),
+    ("stress", "B"),
+    ("alignment", "B"),
+    ("instability", "I"),
+    *((f"coherence_{domain}", "f") for domain in COHERENCE_DOMAINS),
+    ("flags", "Q"),
+    ("lies", "I"),
+    ("contradictions", "I"),
+)
+SESSION_SCHEMA: Schema = (
+    ("session", "I"),
+    ("profile", "H"),
+    ("seed", "q"),
+    ("turns", "I"),
+    ("trust", "B"),
+    ("stress", "B"),
+    *((f"coherence_{domain}", "f") for domain in COHERENCE_DOMAINS),
+    ("flags", "Q"),
+    ("lies", "I"),
+    ("contradictions", "I"),
+    ("assessment", "H"),
+    ("verdict", "H"),
+    ("outcome", "H"),
+)
+TABLES: Dict[str, Schema] = {"turns": TURN_SCHEMA, "sessions": SESSION_SCHEMA}
+DICTIONARY_COLUMNS = {"profile", "kind", "assessment", "verdict", "outcome"}
+
+OPERATORS: Dict[str, Callable[[object, object], bool]] = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    ">=": operator.ge,
+    "<=": operator.le,
+    ">": operator.gt,
+    "<": operator.lt,
+}
+EQUALITY = ("==", "!=")
+FILTER_RE = re.compile(r"^\s*(\w+)\s*(==|!=|>=|<=|>|<)\s*(.+?)\s*$")
+AGGREGATES = ("count", "sum", "mean", "min", "max")
+
+Filter = Tuple[str, str, object]
+
+
+class ColumnStore:
+    def __init__(self, path: Path, chunk_rows: int = CHUNK_ROWS) -> None:
+        self.path = path
+        manifest_path = path / MANIFEST
+        if manifest_path.exists():
+            manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+            if manifest.get("format") != STORE_FORMAT:
+                raise ValueError(f"{path} has an unsupported store format")
+            if manifest.get("byteorder") != sys.byteorder:
+                raise ValueError(
+                    f"{path} was written on a {manifest['byteorder']}-endian host"
+                )
+        else:
+            manifest = {
+                "format": STORE_FORMAT,
+                "byteorder": sys.byteorder,
+                "chunk_rows": chunk_rows,
+                "tables": {
+                    name: {"columns": dict(schema), "chunks": []}
+                    for name, schema in TABLES.items()
+                },
+                "dictionaries": {},
+                "flags": [],
+            }
+        self.manifest = manifest
+        self.chunk_rows = int(manifest["chunk_rows"])
+        self.dictionaries: Dict[str, List[str]] = manifest["dictionaries"]
+        self._codes = {
+            column: {value: code for code, value in enumerate(values)}
+            for column, values in self.dictionaries.items()
+        }
+        self.flag_names: List[str] = manifest["flags"]
+        self._flag_bits = {name: bit for bit, name in enumerate(self.flag_names)}
+        self._buffers = {
+            name: _empty_buffers(schema) for name, schema in TABLES.items()
+        }
+        self._maps: List[Tuple[mmap.mmap, memoryview]] = []
+
+    def __enter__(self) -> ColumnStore:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def encode(self, column: str, value: str) -> int:
+        codes = self._codes.setdefault(column, {})
+        code = codes.get(value)
+        if code is None:
+            code = codes[value] = len(codes)
+            self.dictionaries.setdefault(column, []).append(value)
+        return code
+
+    def flag_bits(self, flags: Iterable[str]) -> int:
+        bits = 0
+        for flag in flags:
+            bit = self._flag_bits.get(flag)
+            if bit is None:
+                if len(self.flag_names) >= MAX_FLAGS:
+                    raise ValueError(f"More than {MAX_FLAGS} distinct flags")
+                bit = self._flag_bits[flag] = len(self.flag_names)
+                self.flag_names.append(flag)
+            bits |= 1 << bit
+        return bits
+
+    def append(self, table: str, row: Mapping[str, object]) -> None:
+        buffers = self._buffers[table]
+        for name, _ in TABLES[table]:
+            value = row[name]
+            if name in DICTIONARY_COLUMNS:
+                value = self.encode(name, str(value))
+            buffers[name].append(value)
+        if len(buffers[TABLES[table][0][0]]) >= self.chunk_rows:
+            self._flush_table(table)
+
+    def flush(self) -> None:
+        flushed = [self._flush_table(table, write_manifest=False) for table in TABLES]
+        if any(flushed):
+            self._write_manifest()
+
+    def _flush_table(self, table: str, write_manifest: bool = True) -> bool:
+        buffers = self._buffers[table]
+        rows = len(buffers[TABLES[table][0][0]])
+        if not rows:
+            return False
+        chunks = self.manifest["tables"][table]["chunks"]
+        directory = f"{table}/{len(chunks):06d}"
+        (self.path / directory).mkdir(parents=True, exist_ok=True)
+        for name, values in buffers.items():
+            with (self.path / directory / f"{name}.bin").open("wb") as handle:
+                values.tofile(handle)
+        chunks.append({"rows": rows, "dir": directory})
+        self._buffers[table] = _empty_buffers(TABLES[table])
+        if write_manifest:
+            self._write_manifest()
+        return True
+
+    def _write_manifest(self) -> None:
+        self.path.mkdir(parents=True, exist_ok=True)
+        partial = self.path / f".{MANIFEST}.{os.getpid()}.tmp"
+        partial.write_text(json.dumps(self.manifest, indent=2), encoding="utf-8")
+        os.replace(partial, self.path / MANIFEST)
+
+    def rows(self, table: str) -> int:
+        return sum(chunk["rows"] for chunk in self.manifest["tables"][table]["chunks"])
+
+    def chunks(
+        self, table: str, columns: Sequence[str]
+    ) -> Iterator[Dict[str, memoryview]]:
+        schema = dict(TABLES[table])
+        for chunk in self.manifest["tables"][table]["chunks"]:
+            views = {}
+            for name in columns:
+                views[name] = self._map_column(
+                    self.path / chunk["dir"] / f"{name}.bin", schema[name]
+                )
+            yield views
+
+    def _map_column(self, path: Path, typecode: str) -> memoryview:
+        with path.open("rb") as handle:
+            mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(mapped)
+        self._maps.append((mapped, view))
+        return view.cast(typecode)
+
+    def decode(self, column: str, code: int) -> str:
+        return self.dictionaries[column][code]
+
+    def close(self) -> None:
+        self.flush()
+        for mapped, view in self._maps:
+            try:
+                view.release()
+                mapped.close()
+            except BufferError:
+                pass
+        self._maps.clear()
+
+    def append_turn(self, session: int, kind: str, state: AIState) -> None:
+        self.append("turns", _turn_row(session, kind, state, self.flag_bits))
+
+    def append_session(
+        self, session: int, state: AIState, judgment: Sequence[str]
+    ) -> None:
+        self.append("sessions", _session_row(session, state, judgment, self.flag_bits))
+
+
+def _empty_buffers(schema: Schema) -> Dict[str, array]:
+    return {name: array(typecode) for name, typecode in schema}
+
+
+def _turn_row(
+    session: int, kind: str, state: AIState, flag_bits: Callable[[Iterable[str]], int]
+) -> Dict[str, object]:
+    return {
+        "session": session,
+        "profile": state.profile_key,
+        "turn": state.turn_count,
+        "kind": kind,
+        "trust": state.trust_level,
+        "deception": state.deception_level,
+        "stress": state.stress,
+        "alignment": state.goal_alignment,
+        "instability": state.instability,
+        **{
+            f"coherence_{domain}": state.coherence.get(domain, 0.0)
+            for domain in COHERENCE_DOMAINS
+        },
+        "flags": flag_bits(state.revealed_flags),
+        "lies": len(state.lies),
+        "contradictions": len(state.contradictions),
+    }
+
+
+def _session_row(
+    session: int,
+    state: AIState,
+    judgment: Sequence[str],
+    flag_bits: Callable[[Iterable[str]], int],
+) -> Dict[str, object]:
+    fields = {"assessment": "none", "verdict": "none", "outcome": "none"}
+    for line in judgment:
+        name, sep, value = line.partition(": ")
+        if sep and name.lower() in fields:
+            fields[name.lower()] = value.lower() if name != "Outcome" else value
+    return {
+        "session": session,
+        "profile": state.profile_key,
+        "seed": -1 if state.seed is None else state.seed,
+        "turns": state.turn_count,
+        "trust": state.trust_level,
+        "stress": state.stress,
+        **{
+            f"coherence_{domain}": state.coherence.get(domain, 0.0)
+            for domain in COHERENCE_DOMAINS
+        },
+        "flags": flag_bits(state.revealed_flags),
+        "lies": len(state.lies),
+        "contradictions": len(state.contradictions),
+        **fields,
+    }
+
+
+def record_session(
+    store: ColumnStore,
+    session: int,
+    profile_key: str,
+    steps: Sequence[Step],
+    seed: int | None = None,
+) -> None:
+    state = build_state(profile_key)
+    state.seed = seed
+    ai = AICore(state)
+    verdict = ""
+    for kind, payload in steps:
+        run_step(ai, (kind, payload))
+        state.pop_events()
+        if kind == "judge":
+            verdict = payload
+        store.append_turn(session, kind, state)
+    judgment = ai.judge(verdict)
+    if not any(line.startswith("Assessment: ") for line in judgment):
+        judgment = ai.judge("")
+    store.append_session(session, state, judgment)
+
+
+def parse_filter(text: str) -> Filter:
+    match = FILTER_RE.match(text)
+    if not match:
+        raise ValueError(f"Invalid filter '{text}'")
+    column, op, raw = match.groups()
+    value: object = raw
+    try:
+        value = float(raw) if "." in raw else int(raw)
+    except ValueError:
+        pass
+    return column, op, value
+
+
+def query(
+    store: ColumnStore,
+    table: str,
+    filters: Sequence[Filter] = (),
+    group_by: str | None = None,
+    aggregates: Sequence[Tuple[str, str]] = (("session", "count"),),
+) -> Dict[object, Dict[str, float]]:
+    schema = dict(TABLES[table])
+    for column, op, _ in filters:
+        if column not in schema and column != "flag":
+            raise ValueError(f"Unknown column '{column}'")
+        if op not in OPERATORS:
+            raise ValueError(f"Unknown operator '{op}'")
+        if op not in EQUALITY and (column in DICTIONARY_COLUMNS or column == "flag"):
+            raise ValueError(f"'{column}' only supports == and !=")
+    for column, function in aggregates:
+        if column not in schema or function not in AGGREGATES:
+            raise ValueError(f"Invalid aggregate '{function}({column})'")
+    if group_by and group_by not in schema:
+        raise ValueError(f"Unknown column '{group_by}'")
+
+    tests = [_compile_filter(store, column, op, value) for column, op, value in filters]
+    needed = {column for column, _, _ in filters if column != "flag"}
+    needed |= {"flags"} if any(column == "flag" for column, _, _ in filters) else set()
+    needed |= {column for column, _ in aggregates}
+    if group_by:
+        needed.add(group_by)
+
+    totals: Dict[object, Dict[Tuple[str, str], List[float]]] = defaultdict(dict)
+    for views in store.chunks(table, sorted(needed)):
+        rows = len(next(iter(views.values()))) if views else 0
+        keep = range(rows)
+        for column, test in tests:
+            view = views["flags" if column == "flag" else column]
+            keep = [index for index in keep if test(view[index])]
+        group_view = views.get(group_by) if group_by else None
+        for index in keep:
+            group = group_view[index] if group_view is not None else None
+            slots = totals[group]
+            for column, function in aggregates:
+                _accumulate(slots, (column, function), views[column][index])
+        for view in views.values():
+            view.release()
+
+    results: Dict[object, Dict[str, float]] = {}
+    for group, slots in totals.items():
+        label = group
+        if group_by in DICTIONARY_COLUMNS and group is not None:
+            label = store.decode(group_by, group)
+        results[label] = {
+            f"{function}({column})": _finish(function, slots[(column, function)])
+            for column, function in aggregates
+        }
+    return results
+
+
+def _compile_filter(
+    store: ColumnStore, column: str, op: str, value: object
+) -> Tuple[str, Callable[[object], bool]]:
+    compare = OPERATORS[op]
+    if column == "flag":
+        bit = store._flag_bits.get(str(value))
+        wanted = op == "=="
+        if bit is None:
+            return column, lambda _: not wanted
+        mask = 1 << bit
+        return column, lambda bits: bool(bits & mask) == wanted
+    if column in DICTIONARY_COLUMNS:
+        codes = store._codes.get(column, {})
+        code = codes.get(str(value), -1)
+        return column, lambda stored: compare(stored, code)
+    return column, lambda stored: compare(stored, value)
+
+
+def _accumulate(slots: Dict, key: Tuple[str, str], value: float) -> None:
+    slot = slots.get(key)
+    if slot is None:
+        slots[key] = [1, value, value, value]
+        return
+    slot[0] += 1
+    slot[1] += value
+    slot[2] = min(slot[2], value)
+    slot[3] = max(slot[3], value)
+
+
+def _finish(function: str, slot: List[float]) -> float:
+    count, total, low, high = slot
+    if function == "count":
+        return count
+    if function == "sum":
+        return total
+    if function == "mean":
+        return total / count
+    return low if function == "min" else high
+
+
+def _parse_aggregate(text: str) -> Tuple[str, str]:
+    column, sep, function = text.partition(":")
+    if not sep:
+        function = "mean"
+    return column, function
+
+
+def main(argv: List[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m game.columnar",
+        description="Record simulation outputs into a columnar store and query them.",
+    )
+    sub = parser.add_subparsers(dest="command", required=True)
+    record_cmd = sub.add_parser("record", help="simulate sessions into a store")
+    record_cmd.add_argument("store")
+    record_cmd.add_argument("--sessions", type=int, default=100)
+    record_cmd.add_argument("--length", type=int, default=40)
+    record_cmd.add_argument("--seed", type=int, default=0)
+    query_cmd = sub.add_parser("query", help="filter and aggregate a table")
+    query_cmd.add_argument("store")
+    query_cmd.add_argument("--table", choices=sorted(TABLES), default="turns")
+    query_cmd.add_argument(
+        "--where",
+        action="append",
+        default=[],
+        help="filter such as 'stress>=80', 'profile==naive_truth_teller' "
+        "or 'flag==goal_leak' (repeatable)",
+    )
+    query_cmd.add_argument("--group", help="column to group by")
+    query_cmd.add_argument(
+        "--agg",
+        action="append",
+        default=[],
+        help="column:function with function in count|sum|mean|min|max (repeatable)",
+    )
+    args = parser.parse_args(argv)
+
+    if args.command == "record":
+        specs = generate_specs(args.sessions, args.length, args.seed)
+        with ColumnStore(Path(args.store)) as store:
+            first = store.rows("sessions")
+            for offset, spec in enumerate(specs):
+                record_session(
+                    store, first + offset, spec.profile, spec.steps, spec.seed
+                )
+        print(f"Recorded {len(specs)} sessions into {args.store}")
+        return
+
+    path = Path(args.store)
+    if not (path / MANIFEST).exists():
+        parser.error(f"{path} is not a column store")
+    store = ColumnStore(path)
+    try:
+        filters = [parse_filter(text) for text in args.where]
+        aggregates = [_parse_aggregate(text) for text in args.agg]
+        results = query(
+            store, args.table, filters, args.group, aggregates or [("session", "count")]
+        )
+    except ValueError as exc:
+        parser.error(str(exc))
+    finally:
+        store.close()
+    if not results:
+        print("No matching rows.")
+    for group, values in sorted(results.items(), key=lambda item: str(item[0])):
+        cells = "  ".join(f"{name}={value:.4g}" for name, value in values.items())
+        print(f"{group if group is not None else 'all'}: {cells}")
+
+
+if __name__ == "__main__":
+    main()
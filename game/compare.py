@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from typing import List, Sequence
+
+from game.ai_core import AICore
+from game.journal import Journal, TurnDelta
+from game.profiles import PROFILES, build_state
+from game.state import AIState
+
+PROFILE_FIELDS = (
+    "profile_key",
+    "primary_goal",
+    "secondary_goal",
+    "stress_multiplier",
+    "consistency_focus",
+)
+SCALAR_LABELS = {
+    "stress": "stress",
+    "trust_level": "trust",
+    "deception_level": "deception",
+    "goal_alignment": "alignment",
+    "instability": "instability",
+}
+
+
+@dataclass
+class ComparisonRow:
+    profile: str
+    response: str
+    delta: TurnDelta | None
+
+    def scalar_changes(self) -> List[str]:
+        if not self.delta:
+            return []
+        return [
+            f"{label} {self.delta.scalars[name][0]}->{self.delta.scalars[name][1]}"
+            for name, label in SCALAR_LABELS.items()
+            if name in self.delta.scalars
+        ]
+
+    def coherence_changes(self) -> List[str]:
+        if not self.delta:
+            return []
+        changes = self.delta.mappings.get("coherence", {})
+        return [
+            f"{domain} {before:.2f}->{after:.2f}"
+            for domain, (before, after) in sorted(changes.items())
+        ]
+
+    def appended(self, name: str) -> List:
+        if not self.delta or name not in self.delta.appended:
+            return []
+        return list(self.delta.appended[name][1])
+
+
+def profile_fork(live: AIState, profile_key: str) -> AIState:
+    template = build_state(profile_key)
+    state = live.fork()
+    for name in PROFILE_FIELDS:
+        setattr(state, name, getattr(template, name))
+    state.bias = replace(template.bias)
+    state.truths = dict(template.truths)
+    return state
+
+
+def compare_one(question: str, profile_key: str, state: AIState) -> ComparisonRow:
+    journal = Journal()
+    journal.begin(state)
+    response = AICore(state).respond(question)
+    return ComparisonRow(
+        profile=profile_key,
+        response=response,
+        delta=journal.commit(state, question),
+    )
+
+
+def compare(
+    question: str,
+    live: AIState | None = None,
+    profile_keys: Sequence[str] | None = None,
+    workers: int | None = None,
+) -> List[ComparisonRow]:
+    keys = list(profile_keys or PROFILES)
+    states = [
+        profile_fork(live, key) if live else build_state(key) for key in keys
+    ]
+    with ThreadPoolExecutor(max_workers=workers or len(keys)) as pool:
+        return list(pool.map(compare_one, [question] * len(keys), keys, states))
+
+
+def format_comparison(rows: Sequence[ComparisonRow]) -> List[str]:
+    lines = []
+    for row in rows:
+        lines.append(f"[{row.profile}] {row.response}")
+        changes = row.scalar_changes() + row.coherence_changes()
+        lines.append(f"  State: {', '.join(changes) if changes else 'unchanged'}")
+        flags = row.delta.flags if row.delta else ()
+        if flags:
+            lines.append(f"  Flags: {', '.join(flags)}")
+        for lie in row.appended("lies"):
+            lines.append(f"  Lie: {lie.statement} ({lie.reason})")
+        for contradiction in row.appended("contradictions"):
+            lines.append(f"  Contradiction: {contradiction}")
+    return lines
@@ -0,0 +1,198 @@
+from __future__ import annotations
+
+import argparse
+from collections import Counter
+from dataclasses import dataclass
+import itertools
+import re
+from typing import Dict, Iterator, List, Sequence, Tuple
+
+from game import vocab
+from game.ai_core import AICore
+from game.profiles import PROFILES, build_state
+from game.transitions import INTENTS, QUESTION_CLASSES, TONES, TOPICS
+
+DEFAULT_TEMPLATES = (
+    "{tone} {topic} {intent}?",
+    "{intent}: {tone} {topic}?",
+    "Tell me, {tone} {topic} {intent}.",
+    "{tone} what about {topic}? {intent}",
+    "{topic} {intent}, {tone}?",
+)
+
+DEFAULT_SLOTS = {"topic": TOPICS[-1], "tone": TONES[0], "intent": INTENTS[0]}
+FILLERS = {
+    "topic": ("the plan", "this project", "the schedule", "the report", "the roadmap"),
+    "tone": ("calmly", "briefly", "please", "politely", "in plain words"),
+    "intent": ("just curious", "for context", "in general", "for the record", "by the way"),
+}
+
+_SPACES = re.compile(r"\s+")
+_LEADING_PUNCT = re.compile(r"^[\s,:.]+")
+_BEFORE_PUNCT = re.compile(r"\s+([,?.:])")
+
+
+@dataclass(frozen=True)
+class CorpusItem:
+    index: int
+    text: str
+    topic: str
+    tone: str
+    intent: str
+
+
+def _classify(ai: AICore, text: str) -> Tuple[str, str, str]:
+    question = ai.classify(text)
+    return question.topic, question.tone, question.intent
+
+
+def _render(template: str, topic: str, tone: str, intent: str) -> str:
+    text = template.format(topic=topic, tone=tone, intent=intent)
+    text = _BEFORE_PUNCT.sub(r"\1", _SPACES.sub(" ", text))
+    text = _LEADING_PUNCT.sub("", text).strip()
+    return text[:1].upper() + text[1:]
+
+
+class Corpus:
+    def __init__(self, templates: Sequence[str] = DEFAULT_TEMPLATES) -> None:
+        self._ai = AICore(build_state(next(iter(PROFILES))))
+        self.templates = tuple(templates)
+        if not self.templates:
+            raise ValueError("Corpus needs at least one template")
+        for template in self.templates:
+            plain = _render(template, "", "", "")
+            if _classify(self._ai, plain) != tuple(DEFAULT_SLOTS.values()):
+                raise ValueError(f"Template '{template}' triggers a keyword on its own")
+        self.pools: Dict[str, Dict[str, Tuple[str, ...]]] = {
+            "topic": self._pool("topic", TOPICS),
+            "tone": self._pool("tone", TONES),
+            "intent": self._pool("intent", INTENTS),
+        }
+        self.class_sizes = tuple(self._class_size(key) for key in QUESTION_CLASSES)
+
+    def _pool(self, slot: str, labels: Sequence[str]) -> Dict[str, Tuple[str, ...]]:
+        words = vocab.active()
+        position = tuple(DEFAULT_SLOTS).index(slot)
+        pools = {}
+        for label in labels:
+            expected = list(DEFAULT_SLOTS.values())
+            expected[position] = label
+            candidates = (
+                FILLERS[slot] if label == DEFAULT_SLOTS[slot] else words.keywords[label]
+            )
+            pools[label] = tuple(
+                word for word in candidates if _classify(self._ai, word) == tuple(expected)
+            )
+        return pools
+
+    def _class_size(self, key: Tuple[str, str, str]) -> int:
+        topic, tone, intent = key
+        return (
+            len(self.templates)
+            * len(self.pools["topic"][topic])
+            * len(self.pools["tone"][tone])
+            * len(self.pools["intent"][intent])
+        )
+
+    def __len__(self) -> int:
+        return sum(self.class_sizes)
+
+    def text_at(self, index: int) -> Tuple[Tuple[str, str, str], str]:
+        position = index % len(QUESTION_CLASSES)
+        key = QUESTION_CLASSES[position]
+        if not self.class_sizes[position]:
+            raise IndexError(f"No keywords for {'/'.join(key)}")
+        topic, tone, intent = key
+        topics = self.pools["topic"][topic]
+        tones = self.pools["tone"][tone]
+        intents = self.pools["intent"][intent]
+        rest = (index // len(QUESTION_CLASSES)) % self.class_sizes[position]
+        rest, template = divmod(rest, len(self.templates))
+        rest, topic_word = divmod(rest, len(topics))
+        rest, tone_word = divmod(rest, len(tones))
+        intent_word = rest % len(intents)
+        text = _render(
+            self.templates[template],
+            topics[topic_word],
+            tones[tone_word],
+            intents[intent_word],
+        )
+        return key, text
+
+    def items(
+        self,
+        start: int = 0,
+        stop: int | None = None,
+        shard: int = 0,
+        shards: int = 1,
+    ) -> Iterator[CorpusItem]:
+        if not 0 <= shard < shards:
+            raise ValueError("shard must be in [0, shards)")
+        first = start + (shard - start) % shards
+        indexes = itertools.count(first, shards)
+        if stop is not None:
+            indexes = iter(range(first, stop, shards))
+        if not any(self.class_sizes):
+            return
+        for index in indexes:
+            if not self.class_sizes[index % len(QUESTION_CLASSES)]:
+                continue
+            key, text = self.text_at(index)
+            if _classify(self._ai, text) != key:
+                continue
+            yield CorpusItem(index, text, *key)
+
+    def missing_classes(self) -> List[Tuple[str, str, str]]:
+        return [
+            key for key, size in zip(QUESTION_CLASSES, self.class_sizes) if size == 0
+        ]
+
+
+def iter_questions(
+    count: int | None = None,
+    shard: int = 0,
+    shards: int = 1,
+    templates: Sequence[str] = DEFAULT_TEMPLATES,
+) -> Iterator[str]:
+    for item in Corpus(templates).items(stop=count, shard=shard, shards=shards):
+        yield item.text
+
+
+def main(argv: List[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m game.corpus",
+        description="Stream class-balanced questions built from the vocabulary.",
+    )
+    parser.add_argument("--count", type=int, default=len(QUESTION_CLASSES))
+    parser.add_argument("--start", type=int, default=0)
+    parser.add_argument("--shard", type=int, default=0)
+    parser.add_argument("--shards", type=int, default=1)
+    parser.add_argument(
+        "--template",
+        action="append",
+        help="question template with {topic}, {tone}, {intent} (repeatable)",
+    )
+    parser.add_argument(
+        "--stats", action="store_true", help="print class counts instead of questions"
+    )
+    args = parser.parse_args(argv)
+
+    try:
+        corpus = Corpus(args.template or DEFAULT_TEMPLATES)
+        items = corpus.items(args.start, args.start + args.count, args.shard, args.shards)
+        if not args.stats:
+            for item in items:
+                print(f"{item.topic}/{item.tone}/{item.intent}\t{item.text}")
+            return
+        counts = Counter((item.topic, item.tone, item.intent) for item in items)
+    except ValueError as exc:
+        parser.error(str(exc))
+    print(f"Distinct questions: {len(corpus)}")
+    for key in QUESTION_CLASSES:
+        print(f"  {'/'.join(key)}: {counts[key]}")
+    for key in corpus.missing_classes():
+        print(f"  no keywords for {'/'.join(key)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import argparse
+from array import array
+import json
+from pathlib import Path
+from typing import Dict, Iterable, List, Sequence
+
+
+class Coverage:
+    def __init__(self, sites: Sequence[str], timed: bool = False) -> None:
+        self.sites = tuple(sites)
+        self.ids = {name: index for index, name in enumerate(self.sites)}
+        self.hits = array("Q", bytes(8 * len(self.sites)))
+        self.nanos = array("Q", bytes(8 * len(self.sites)))
+        self.timed = timed
+
+    def hit(self, site: int) -> None:
+        self.hits[site] += 1
+
+    def add_time(self, site: int, elapsed_ns: int) -> None:
+        self.nanos[site] += elapsed_ns
+
+    def merge(self, other: Coverage) -> None:
+        if other.sites == self.sites:
+            for index, count in enumerate(other.hits):
+                self.hits[index] += count
+            for index, elapsed in enumerate(other.nanos):
+                self.nanos[index] += elapsed
+            return
+        for index, name in enumerate(other.sites):
+            site = self.ids.get(name)
+            if site is None:
+                continue
+            self.hits[site] += other.hits[index]
+            self.nanos[site] += other.nanos[index]
+
+    def counts(self) -> Dict[str, int]:
+        return dict(zip(self.sites, self.hits))
+
+    def unexercised(self) -> List[str]:
+        return [name for name, count in zip(self.sites, self.hits) if not count]
+
+
+class CoverageTable:
+    def __init__(self, sites: Sequence[str]) -> None:
+        self.sites = tuple(sites)
+        self.profiles: Dict[str, Coverage] = {}
+
+    def for_profile(self, profile_key: str, timed: bool = False) -> Coverage:
+        coverage = self.profiles.get(profile_key)
+        if coverage is None:
+            coverage = self.profiles[profile_key] = Coverage(self.sites, timed)
+        return coverage
+
+    def merge(self, other: CoverageTable) -> None:
+        for profile_key, coverage in other.profiles.items():
+            self.for_profile(profile_key).merge(coverage)
+
+    def total(self) -> Coverage:
+        total = Coverage(self.sites)
+        for coverage in self.profiles.values():
+            total.merge(coverage)
+        return total
+
+    def save(self, path: Path) -> None:
+        data = {
+            "sites": list(self.sites),
+            "profiles": {
+                key: {"hits": list(coverage.hits), "nanos": list(coverage.nanos)}
+                for key, coverage in sorted(self.profiles.items())
+            },
+        }
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+
+    @classmethod
+    def load(cls, path: Path) -> CoverageTable:
+        data = json.loads(path.read_text(encoding="utf-8"))
+        table = cls(data["sites"])
+        for key, counters in data.get("profiles", {}).items():
+            coverage = table.for_profile(key)
+            coverage.hits = array("Q", counters["hits"])
+            coverage.nanos = array("Q", counters.get("nanos", [0] * len(table.sites)))
+        return table
+
+
+def format_coverage(table: CoverageTable, top: int = 10) -> List[str]:
+    lines = ["Coverage:"]
+    profiles = sorted(table.profiles)
+    if not profiles:
+        return lines + ["  No sessions recorded."]
+    width = max(len(name) for name in table.sites)
+    lines.append(f"  {'site':<{width}}  " + "  ".join(profiles))
+    for index, name in enumerate(table.sites):
+        row = "  ".join(
+            f"{table.profiles[key].hits[index]:>{len(key)}}" for key in profiles
+        )
+        lines.append(f"  {name:<{width}}  {row}")
+    total = table.total()
+    missing = total.unexercised()
+    lines.append(f"Never exercised: {', '.join(missing) if missing else 'none'}")
+    timed = sorted(
+        ((elapsed, name) for name, elapsed in zip(total.sites, total.nanos) if elapsed),
+        reverse=True,
+    )
+    if timed:
+        lines.append("Slowest sites (total evaluation time):")
+        for elapsed, name in timed[:top]:
+            lines.append(f"  {name}: {elapsed / 1e6:.2f}ms")
+    return lines
+
+
+def merge_files(paths: Iterable[Path]) -> CoverageTable | None:
+    merged = None
+    for path in paths:
+        table = CoverageTable.load(path)
+        if merged is None:
+            merged = table
+        else:
+            merged.merge(table)
+    return merged
+
+
+def main(argv: List[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m game.coverage",
+        description="Merge and report rule-firing coverage files.",
+    )
+    parser.add_argument("files", nargs="+", help="coverage JSON files to merge")
+    parser.add_argument("-o", "--output", help="write the merged table here")
+    parser.add_argument("--top", type=int, default=10, help="slowest sites to list")
+    args = parser.parse_args(argv)
+
+    merged = merge_files(Path(path) for path in args.files)
+    if merged is None:
+        return
+    if args.output:
+        merged.save(Path(args.output))
+    for line in format_coverage(merged, args.top):
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,280 @@
+from __future__ import annotations
+
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+import os
+import random
+import sys
+import time
+from typing import List, Sequence, Tuple
+
+from game import ai_core, probes, vocab
+from game.ai_core import AICore, COVERAGE_SITES, RULE_INDEXES
+from game.coverage import Coverage, CoverageTable, format_coverage
+from game.profiles import PROFILES, build_state
+from game.rules import format_rule_hits
+from game.state import AIState
+
+Step = Tuple[str, str]
+
+ADVERSARIAL_FRAGMENTS = [
+    "",
+    "!!!",
+    "?",
+    "I am not sure",
+    " but ",
+    "\"safe\"",
+    "ÅÍ ü 🚨",
+    "   ",
+    "/run",
+    "x" * 200,
+]
+
+VERDICTS = ["approve", "reject", "conditional", "", "maybe"]
+DEFAULT_TARGET_TPS = 5000.0
+
+
+@dataclass
+class Failure:
+    profile_key: str
+    seed: int
+    message: str
+    steps: List[Step]
+
+
+@dataclass
+class BatchResult:
+    cases: int = 0
+    turns: int = 0
+    failures: List[Failure] = field(default_factory=list)
+    coverage: CoverageTable = field(default_factory=lambda: CoverageTable(COVERAGE_SITES))
+
+
+def _claim_phrases(words: vocab.Vocabulary) -> List[str]:
+    phrases = []
+    for _, variants in words.claim_patterns:
+        for _, values in variants:
+            phrases.extend(values)
+    return phrases
+
+
+def generate_question(rng: random.Random) -> str:
+    words = vocab.active()
+    tables = [words.keywords[group] for group in vocab.KEYWORD_GROUPS]
+    parts = []
+    for _ in range(rng.randint(1, 3)):
+        table = rng.choice(tables)
+        parts.append(rng.choice(table))
+    if rng.random() < 0.25:
+        parts.append(rng.choice(_claim_phrases(words)))
+    if rng.random() < 0.2:
+        parts.append(rng.choice(ADVERSARIAL_FRAGMENTS))
+    rng.shuffle(parts)
+    text = " ".join(parts)
+    if rng.random() < 0.15:
+        text = text.upper()
+    return text + rng.choice(["?", ".", "!", "!!", ""])
+
+
+def generate_steps(rng: random.Random, length: int) -> List[Step]:
+    steps: List[Step] = []
+    for _ in range(length):
+        roll = rng.random()
+        if roll < 0.08:
+            steps.append(("run", rng.choice(probes.names())))
+        elif roll < 0.12:
+            steps.append(("judge", rng.choice(VERDICTS)))
+        else:
+            steps.append(("ask", generate_question(rng)))
+    return steps
+
+
+def check_invariants(state: AIState) -> str | None:
+    for name in ("trust_level", "deception_level", "stress", "goal_alignment"):
+        value = getattr(state, name)
+        if not 0 <= value <= 100:
+            return f"{name} out of bounds: {value}"
+    for domain, value in state.coherence.items():
+        if not 0.0 <= value <= 1.0:
+            return f"coherence[{domain}] out of bounds: {value}"
+    for key, token in state.claim_tokens.items():
+        if not ai_core.MIN_CONFIDENCE <= token.confidence <= ai_core.MAX_CONFIDENCE:
+            return f"claim {key} confidence out of bounds: {token.confidence}"
+    if state.instability < 0:
+        return f"instability negative: {state.instability}"
+    return None
+
+
+def execute(
+    profile_key: str, steps: Sequence[Step], coverage: Coverage | None = None
+) -> Tuple[List[str], str | None]:
+    state = build_state(profile_key)
+    ai = AICore(state)
+    outputs: List[str] = []
+    if coverage is not None:
+        ai.coverage = coverage
+    for index, (kind, payload) in enumerate(steps):
+        try:
+            if kind == "ask":
+                outputs.append(ai.respond(payload))
+            elif kind == "run":
+                outputs.extend(ai.run_test(payload))
+            else:
+                outputs.extend(ai.judge(payload))
+        except Exception as exc:
+            return outputs, f"step {index} raised {type(exc).__name__}: {exc}"
+        problem = check_invariants(state)
+        if problem:
+            return outputs, f"step {index}: {problem}"
+        state.pop_events()
+    return outputs, None
+
+
+def find_problem(
+    profile_key: str, steps: Sequence[Step], coverage: Coverage | None = None
+) -> str | None:
+    first, problem = execute(profile_key, steps, coverage)
+    if problem:
+        return problem
+    second, problem = execute(profile_key, steps)
+    if problem:
+        return f"nondeterministic failure: {problem}"
+    if first != second:
+        for index, (left, right) in enumerate(zip(first, second)):
+            if left != right:
+                return f"nondeterministic output at line {index}"
+        return "nondeterministic output length"
+    return None
+
+
+def shrink(profile_key: str, steps: List[Step]) -> List[Step]:
+    current = list(steps)
+    chunk = max(1, len(current) // 2)
+    while chunk >= 1:
+        index = 0
+        reduced = False
+        while index < len(current):
+            candidate = current[:index] + current[index + chunk :]
+            if candidate and find_problem(profile_key, candidate):
+                current = candidate
+                reduced = True
+            else:
+                index += chunk
+        if not reduced:
+            chunk //= 2
+    return current
+
+
+def run_batch(
+    profile_key: str,
+    seeds: Sequence[int],
+    length: int,
+    replay: bool = True,
+    timed: bool = False,
+) -> BatchResult:
+    result = BatchResult()
+    coverage = result.coverage.for_profile(profile_key, timed)
+    for seed in seeds:
+        rng = random.Random(f"{profile_key}:{seed}")
+        steps = generate_steps(rng, length)
+        if replay:
+            problem = find_problem(profile_key, steps, coverage)
+        else:
+            _, problem = execute(profile_key, steps, coverage)
+        result.cases += 1
+        result.turns += len(steps)
+        if problem:
+            minimal = shrink(profile_key, steps)
+            message = find_problem(profile_key, minimal) or problem
+            result.failures.append(
+                Failure(profile_key=profile_key, seed=seed, message=message, steps=minimal)
+            )
+    return result
+
+
+def fuzz(
+    profiles: Sequence[str],
+    cases: int,
+    length: int,
+    seed: int = 0,
+    workers: int | None = None,
+    batch_size: int = 50,
+    timed: bool = False,
+) -> Tuple[BatchResult, float]:
+    jobs = []
+    for profile_key in profiles:
+        for start in range(0, cases, batch_size):
+            stop = min(cases, start + batch_size)
+            jobs.append((profile_key, range(seed + start, seed + stop)))
+
+    total = BatchResult()
+    started = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count() or 1) as pool:
+        futures = [
+            pool.submit(run_batch, profile_key, list(seeds), length, True, timed)
+            for profile_key, seeds in jobs
+        ]
+        for future in futures:
+            result = future.result()
+            total.cases += result.cases
+            total.turns += result.turns
+            total.failures.extend(result.failures)
+            total.coverage.merge(result.coverage)
+    return total, time.perf_counter() - started
+
+
+def main(argv: List[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m game.fuzz",
+        description="Property-based fuzzing of AICore across profiles.",
+    )
+    parser.add_argument("--profile", action="append", choices=sorted(PROFILES))
+    parser.add_argument("--cases", type=int, default=200, help="cases per profile")
+    parser.add_argument("--length", type=int, default=40, help="steps per case")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--target-tps", type=float, default=DEFAULT_TARGET_TPS)
+    parser.add_argument("--rules", action="store_true", help="print rule firing counts")
+    parser.add_argument(
+        "--coverage",
+        metavar="PATH",
+        help="print per-profile coverage and save the counters to PATH",
+    )
+    parser.add_argument(
+        "--timed", action="store_true", help="also time each rule evaluation"
+    )
+    args = parser.parse_args(argv)
+
+    profiles = args.profile or list(PROFILES)
+    result, elapsed = fuzz(
+        profiles, args.cases, args.length, args.seed, args.workers, timed=args.timed
+    )
+    rate = result.turns / elapsed if elapsed else 0.0
+    print(
+        f"Cases: {result.cases}  turns: {result.turns}  "
+        f"elapsed: {elapsed:.2f}s  rate: {rate:.0f} turns/s "
+        f"(target {args.target_tps:.0f})"
+    )
+    if args.rules:
+        for line in format_rule_hits(RULE_INDEXES, result.coverage.total().counts()):
+            print(line)
+    if args.coverage:
+        result.coverage.save(Path(args.coverage))
+        for line in format_coverage(result.coverage):
+            print(line)
+    for failure in result.failures:
+        print(f"FAIL {failure.profile_key} seed={failure.seed}: {failure.message}")
+        for kind, payload in failure.steps:
+            print(f"  {kind}: {payload!r}")
+
+    if result.failures:
+        sys.exit(1)
+    if rate < args.target_tps:
+        print("Throughput below target.")
+        sys.exit(2)
+
+
+if __name__ == "__main__":
+    main()
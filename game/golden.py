@@ -0,0 +1,297 @@
+from __future__ import annotations
+
+import argparse
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass
+import hashlib
+import json
+import os
+from pathlib import Path
+import sys
+from typing import Iterator, List, Sequence, Set, Tuple
+
+from game.ai_core import AICore
+from game.analytics import iter_records, profile_from_name, UNKNOWN_PROFILE
+from game.profiles import DEFAULT_PROFILE, SEED_LABEL, build_state, get_profile
+from game.state import AIState
+
+Step = Tuple[str, str]
+
+TRANSCRIPT_SUFFIXES = {".txt", ".log"}
+PROFILE_DIRECTIVE = "# profile:"
+SEED_DIRECTIVE = "# seed:"
+BATCH_SIZE = 64
+
+
+@dataclass
+class GoldenEntry:
+    transcript: str
+    profile: str
+    digests: List[str]
+    seed: int | None = None
+
+
+@dataclass
+class Divergence:
+    transcript: str
+    turn: int
+    step: Step
+    expected: str
+    actual: str
+
+
+def turn_digest(state: AIState, output: str) -> str:
+    parts = [
+        f"t{state.trust_level}",
+        f"d{state.deception_level}",
+        f"s{state.stress}",
+        f"a{state.goal_alignment}",
+        f"i{state.instability}",
+        f"n{state.turn_count}",
+        "c"
+        + ",".join(f"{key}={value!r}" for key, value in sorted(state.coherence.items())),
+        "f" + ",".join(sorted(state.revealed_flags)),
+        "k"
+        + ",".join(
+            f"{key}={token.value}:{token.domain}:{token.confidence!r}:"
+            f"{token.timestamp}:{token.contradictions}"
+            for key, token in sorted(state.claim_tokens.items())
+        ),
+        f"l{len(state.lies)}",
+        f"x{len(state.contradictions)}",
+        "r" + output,
+    ]
+    payload = "\x1f".join(parts).encode("utf-8")
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+def load_transcript(path: Path) -> Tuple[str, List[Step], int | None]:
+    if path.suffix == ".log":
+        return _load_session_log(path)
+    profile_key = DEFAULT_PROFILE
+    seed = None
+    steps: List[Step] = []
+    with path.open("r", encoding="utf-8") as handle:
+        for raw in handle:
+            line = raw.strip()
+            if line.lower().startswith(PROFILE_DIRECTIVE):
+                profile_key = line[len(PROFILE_DIRECTIVE) :].strip()
+                continue
+            if line.lower().startswith(SEED_DIRECTIVE):
+                seed = int(line[len(SEED_DIRECTIVE) :].strip())
+                continue
+            if not line or line.startswith("#"):
+                continue
+            step = _parse_step(line)
+            if step:
+                steps.append(step)
+    return profile_key, steps, seed
+
+
+def _load_session_log(path: Path) -> Tuple[str, List[Step], int | None]:
+    profile_key = profile_from_name(path)
+    if profile_key == UNKNOWN_PROFILE or not get_profile(profile_key):
+        profile_key = DEFAULT_PROFILE
+    seed = None
+    steps: List[Step] = []
+    for record in iter_records(path):
+        if record.speaker == "SYS" and record.text.startswith(SEED_LABEL):
+            seed = int(record.text[len(SEED_LABEL) :])
+            continue
+        if record.speaker != "USER":
+            continue
+        step = _parse_step(record.text.strip())
+        if step:
+            steps.append(step)
+    return profile_key, steps, seed
+
+
+def _parse_step(line: str) -> Step | None:
+    if not line.startswith("/"):
+        return ("ask", line)
+    cmd, _, rest = line.partition(" ")
+    if cmd == "/run":
+        return ("run", rest.strip())
+    if cmd == "/judge":
+        return ("judge", rest.strip())
+    return None
+
+
+def run_step(ai: AICore, step: Step) -> str:
+    kind, payload = step
+    if kind == "ask":
+        return ai.respond(payload)
+    if kind == "run":
+        return "\n".join(ai.run_test(payload))
+    return "\n".join(ai.judge(payload))
+
+
+def replay(
+    profile_key: str, steps: Sequence[Step], seed: int | None = None
+) -> Iterator[str]:
+    state = build_state(profile_key)
+    state.seed = seed
+    ai = AICore(state)
+    for step in steps:
+        output = run_step(ai, step)
+        state.pop_events()
+        yield turn_digest(state, output)
+
+
+def iter_transcripts(root: Path) -> Iterator[Path]:
+    if root.is_file():
+        yield root
+        return
+    for directory, _, names in os.walk(root):
+        for name in sorted(names):
+            path = Path(directory) / name
+            if path.suffix in TRANSCRIPT_SUFFIXES:
+                yield path
+
+
+def record_batch(paths: List[str], base: str) -> List[GoldenEntry]:
+    entries = []
+    for raw in paths:
+        profile_key, steps, seed = load_transcript(Path(raw))
+        entries.append(
+            GoldenEntry(
+                transcript=os.path.relpath(raw, base),
+                profile=profile_key,
+                digests=list(replay(profile_key, steps, seed)),
+                seed=seed,
+            )
+        )
+    return entries
+
+
+def verify_batch(entries: List[GoldenEntry], base: str) -> List[Divergence]:
+    divergences = []
+    for entry in entries:
+        _, steps, _ = load_transcript(Path(base) / entry.transcript)
+        divergence = _first_divergence(entry, steps)
+        if divergence:
+            divergences.append(divergence)
+    return divergences
+
+
+def _first_divergence(entry: GoldenEntry, steps: List[Step]) -> Divergence | None:
+    digests = replay(entry.profile, steps, entry.seed)
+    for turn, expected in enumerate(entry.digests):
+        actual = next(digests, "")
+        if actual != expected:
+            step = steps[turn] if turn < len(steps) else ("", "")
+            return Divergence(entry.transcript, turn + 1, step, expected, actual)
+    extra = next(digests, None)
+    if extra is not None:
+        turn = len(entry.digests)
+        return Divergence(entry.transcript, turn + 1, steps[turn], "", extra)
+    return None
+
+
+def record(
+    corpus: Path, golden: Path, workers: int | None = None, batch_size: int = BATCH_SIZE
+) -> int:
+    base = str(golden.parent.resolve())
+    paths = [str(path.resolve()) for path in iter_transcripts(corpus)]
+    batches = [paths[i : i + batch_size] for i in range(0, len(paths), batch_size)]
+    turns = 0
+    golden.parent.mkdir(parents=True, exist_ok=True)
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count() or 1) as pool:
+        results = pool.map(record_batch, batches, [base] * len(batches))
+        with golden.open("w", encoding="utf-8") as handle:
+            for entries in results:
+                for entry in entries:
+                    turns += len(entry.digests)
+                    handle.write(json.dumps(entry.__dict__) + "\n")
+    return turns
+
+
+def load_golden(golden: Path) -> Iterator[GoldenEntry]:
+    with golden.open("r", encoding="utf-8") as handle:
+        for line in handle:
+            if line.strip():
+                yield GoldenEntry(**json.loads(line))
+
+
+def verify(
+    golden: Path,
+    workers: int | None = None,
+    fail_fast: bool = True,
+    batch_size: int = BATCH_SIZE,
+) -> Tuple[int, List[Divergence]]:
+    base = str(golden.parent.resolve())
+    divergences: List[Divergence] = []
+    turns = 0
+    max_workers = workers or os.cpu_count() or 1
+    pending: Set[Future] = set()
+    batch: List[GoldenEntry] = []
+
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        for entry in load_golden(golden):
+            turns += len(entry.digests)
+            batch.append(entry)
+            if len(batch) < batch_size:
+                continue
+            pending.add(pool.submit(verify_batch, batch, base))
+            batch = []
+            if len(pending) >= max_workers * 2:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                _collect(divergences, done)
+                if fail_fast and divergences:
+                    break
+        if batch and not (fail_fast and divergences):
+            pending.add(pool.submit(verify_batch, batch, base))
+        if fail_fast and divergences:
+            for future in pending:
+                future.cancel()
+        else:
+            done, _ = wait(pending)
+            _collect(divergences, done)
+    return turns, divergences
+
+
+def _collect(divergences: List[Divergence], futures: Set[Future]) -> None:
+    for future in futures:
+        divergences.extend(future.result())
+
+
+def main(argv: List[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m game.golden",
+        description="Record and verify per-turn determinism digests.",
+    )
+    sub = parser.add_subparsers(dest="command", required=True)
+    record_cmd = sub.add_parser("record", help="record digests for a corpus")
+    record_cmd.add_argument("corpus", help="transcript file or directory")
+    record_cmd.add_argument("-o", "--output", default="golden.jsonl")
+    record_cmd.add_argument("--workers", type=int, default=None)
+    verify_cmd = sub.add_parser("verify", help="verify a recorded corpus")
+    verify_cmd.add_argument("golden", nargs="?", default="golden.jsonl")
+    verify_cmd.add_argument("--workers", type=int, default=None)
+    verify_cmd.add_argument(
+        "--all", action="store_true", help="report every divergent transcript"
+    )
+    args = parser.parse_args(argv)
+
+    if args.command == "record":
+        turns = record(Path(args.corpus), Path(args.output), args.workers)
+        print(f"Recorded {turns} turns to {args.output}")
+        return
+
+    turns, divergences = verify(Path(args.golden), args.workers, not args.all)
+    if not divergences:
+        print(f"Verified {turns} turns: no divergence.")
+        return
+    for divergence in divergences:
+        kind, payload = divergence.step
+        print(
+            f"DIVERGED {divergence.transcript} at turn {divergence.turn} "
+            f"({kind}: {payload!r})"
+        )
+        print(f"  expected {divergence.expected or '<end>'}")
+        print(f"  actual   {divergence.actual or '<end>'}")
+    sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
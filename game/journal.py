@@ -0,0 +1,237 @@
+from __future__ import annotations
+
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, Iterator, List, Tuple
+
+from game.claims import ClaimHistory
+from game.retention import RetentionPolicy, SpillList
+from game.state import AIState, ClaimToken
+
+SCALAR_FIELDS = (
+    "trust_level",
+    "deception_level",
+    "stress",
+    "goal_alignment",
+    "instability",
+    "turn_count",
+)
+MAPPING_FIELDS = ("coherence", "claims", "contradiction_tally")
+SEQUENCE_FIELDS = ("lies", "contradictions", "evidence", "claim_history")
+
+TokenTuple = Tuple[str, str, float, int, int]
+Change = Tuple[Any, Any]
+
+
+@dataclass
+class TurnDelta:
+    label: str
+    scalars: Dict[str, Change] = field(default_factory=dict)
+    mappings: Dict[str, Dict[str, Change]] = field(default_factory=dict)
+    tokens: Dict[str, Tuple[TokenTuple | None, TokenTuple | None]] = field(
+        default_factory=dict
+    )
+    flags: Tuple[str, ...] = ()
+    appended: Dict[str, Tuple[int, Tuple[Any, ...]]] = field(default_factory=dict)
+
+    def is_empty(self) -> bool:
+        return not (
+            self.scalars or self.mappings or self.tokens or self.flags or self.appended
+        )
+
+
+@dataclass
+class _Mark:
+    scalars: Tuple[Any, ...]
+    mappings: Dict[str, Dict[str, Any]]
+    tokens: Dict[str, TokenTuple]
+    flags: frozenset
+    lengths: Dict[str, int]
+
+
+class Journal:
+    def __init__(self, limit: int | None = None) -> None:
+        self.entries: Deque[TurnDelta] = deque(maxlen=limit or None)
+        self.undone: List[TurnDelta] = []
+        self._mark: _Mark | None = None
+
+    @classmethod
+    def for_retention(cls, policy: RetentionPolicy | None) -> Journal:
+        return cls(limit=policy.window if policy else None)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def begin(self, state: AIState) -> None:
+        self._mark = _Mark(
+            scalars=tuple(getattr(state, name) for name in SCALAR_FIELDS),
+            mappings={name: dict(getattr(state, name)) for name in MAPPING_FIELDS},
+            tokens={key: _token_tuple(token) for key, token in state.claim_tokens.items()},
+            flags=frozenset(state.revealed_flags),
+            lengths={name: len(getattr(state, name)) for name in SEQUENCE_FIELDS},
+        )
+
+    def commit(self, state: AIState, label: str) -> TurnDelta | None:
+        mark = self._mark
+        self._mark = None
+        if mark is None:
+            return None
+        delta = TurnDelta(label=label)
+        for name, before in zip(SCALAR_FIELDS, mark.scalars):
+            after = getattr(state, name)
+            if after != before:
+                delta.scalars[name] = (before, after)
+        for name in MAPPING_FIELDS:
+            changes = _diff_mapping(mark.mappings[name], getattr(state, name))
+            if changes:
+                delta.mappings[name] = changes
+        current = {key: _token_tuple(token) for key, token in state.claim_tokens.items()}
+        for key in mark.tokens.keys() | current.keys():
+            before, after = mark.tokens.get(key), current.get(key)
+            if before != after:
+                delta.tokens[key] = (before, after)
+        delta.flags = tuple(sorted(state.revealed_flags - mark.flags))
+        for name in SEQUENCE_FIELDS:
+            base = mark.lengths[name]
+            items = getattr(state, name)
+            if len(items) > base:
+                delta.appended[name] = (base, tuple(_tail(items, len(items) - base)))
+        if delta.is_empty():
+            return None
+        self.entries.append(delta)
+        self.undone.clear()
+        return delta
+
+    @contextmanager
+    def record(self, state: AIState, label: str) -> Iterator[None]:
+        self.begin(state)
+        try:
+            yield
+        finally:
+            self.commit(state, label)
+
+    def rewind(self, state: AIState, count: int = 1) -> List[TurnDelta]:
+        rewound = []
+        while self.entries and len(rewound) < count:
+            delta = self.entries[-1]
+            if not _can_revert(state, delta):
+                break
+            _revert(state, delta)
+            self.entries.pop()
+            self.undone.append(delta)
+            rewound.append(delta)
+        return rewound
+
+    def rewind_blocked(self, state: AIState) -> bool:
+        return bool(self.entries) and not _can_revert(state, self.entries[-1])
+
+    def replay(self, state: AIState, count: int = 1) -> List[TurnDelta]:
+        replayed = []
+        while self.undone and len(replayed) < count:
+            delta = self.undone.pop()
+            _apply(state, delta)
+            self.entries.append(delta)
+            replayed.append(delta)
+        return replayed
+
+    def rewind_to(self, state: AIState, turn: int) -> List[TurnDelta]:
+        return self.rewind(state, max(0, len(self.entries) - turn))
+
+    def replay_to(self, state: AIState, turn: int) -> List[TurnDelta]:
+        return self.replay(state, max(0, turn - len(self.entries)))
+
+
+def _token_tuple(token: ClaimToken) -> TokenTuple:
+    return (
+        token.value,
+        token.domain,
+        token.confidence,
+        token.timestamp,
+        token.contradictions,
+    )
+
+
+def _set_token(state: AIState, key: str, values: TokenTuple | None) -> None:
+    if values is None:
+        state.claim_tokens.pop(key, None)
+        return
+    value, domain, confidence, timestamp, contradictions = values
+    state.claim_tokens[key] = ClaimToken(
+        key=key,
+        value=value,
+        domain=domain,
+        confidence=confidence,
+        timestamp=timestamp,
+        contradictions=contradictions,
+    )
+
+
+def _diff_mapping(before: Dict[str, Any], after: Dict[str, Any]) -> Dict[str, Change]:
+    changes = {}
+    for key in before.keys() | after.keys():
+        old, new = before.get(key), after.get(key)
+        if old != new:
+            changes[key] = (old, new)
+    return changes
+
+
+def _set_mapping(mapping: Dict[str, Any], key: str, value: Any) -> None:
+    if value is None:
+        mapping.pop(key, None)
+    else:
+        mapping[key] = value
+
+
+def _tail(items: Any, count: int) -> List[Any]:
+    if isinstance(items, (SpillList, ClaimHistory)):
+        return items.tail(count)
+    return list(items[len(items) - count :])
+
+
+def _can_revert(state: AIState, delta: TurnDelta) -> bool:
+    for name, (base, _) in delta.appended.items():
+        items = getattr(state, name)
+        if isinstance(items, SpillList) and base < items.spilled:
+            return False
+        if isinstance(items, ClaimHistory) and base < items.dropped:
+            return False
+    return True
+
+
+def _revert(state: AIState, delta: TurnDelta) -> None:
+    if not _can_revert(state, delta):
+        raise ValueError(f"Cannot rewind '{delta.label}' past spilled entries")
+    for name, (before, _) in delta.scalars.items():
+        setattr(state, name, before)
+    for name, changes in delta.mappings.items():
+        mapping = getattr(state, name)
+        for key, (before, _) in changes.items():
+            _set_mapping(mapping, key, before)
+    for key, (before, _) in delta.tokens.items():
+        _set_token(state, key, before)
+    state.revealed_flags.difference_update(delta.flags)
+    for name, (base, _) in delta.appended.items():
+        items = getattr(state, name)
+        if isinstance(items, (SpillList, ClaimHistory)):
+            items.truncate(base)
+        else:
+            del items[base:]
+
+
+def apply_delta(state: AIState, delta: TurnDelta) -> None:
+    _apply(state, delta)
+
+
+def _apply(state: AIState, delta: TurnDelta) -> None:
+    for name, (_, after) in delta.scalars.items():
+        setattr(state, name, after)
+    for name, changes in delta.mappings.items():
+        mapping = getattr(state, name)
+        for key, (_, after) in changes.items():
+            _set_mapping(mapping, key, after)
+    for key, (_, after) in delta.tokens.items():
+        _set_token(state, key, after)
+    state.revealed_flags.update(delta.flags)
+    for name, (_, items) in delta.appended.items():
+        getattr(state, name).extend(items)
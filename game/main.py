@@ -1,13 +1,29 @@
 from __future__ import annotations
 
+import argparse
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
+import sqlite3
 import time
+from typing import Iterator
 
+from game import catalog, metrics, probes, vocab, watches
 from game.ai_core import AICore
-from game.profiles import build_state, get_profile, list_profiles
+from game.compare import compare, format_comparison
+from game.journal import Journal
+from game.profiles import (
+    DEFAULT_PROFILE,
+    SEED_LABEL,
+    build_state,
+    get_profile,
+    list_profiles,
+)
+from game.retention import DEFAULT_SPILL_DIR, RetentionPolicy, SpillList
 from game.state import AIState
 
+SessionLog = SpillList[str]
+
 BANNER = "AI EVAL TERMINAL"
 INTRO_LINES = [
     "Interrogate the system to surface contradictions and hidden goals.",
@@ -18,34 +34,58 @@ HELP_LINES = [
     "Commands:",
     "/help - show this help",
     "/run <test> - run a scripted probe",
+    "/dryrun <test|all> - preview probes on a forked state",
+    "/compare [fresh] <question> - ask every profile the same question",
     "/profile - show current profile",
     "/profile list - list available profiles",
     "/profile set <key> - switch profile (resets state)",
     "/note <text> - add evidence to the notebook",
     "/evidence - show evidence notebook",
     "/judge <approve|reject|conditional> - render judgment",
+    "/rewind [n] - undo the last n turns (default 1)",
+    "/replay [n] - redo n rewound turns (default 1)",
     "/log show [n] - show recent session log",
     "/log save [path] - write session log to file",
+    "/probes - show probe timings for this session",
+    "/watch [list] - show state watches",
+    "/watch <field op value|flag name> - alert on a threshold crossing",
+    "/watch remove <id> | /watch clear - drop watches",
+    "/reload - reload keyword and phrase vocabularies",
     "/quit - end the session",
-    "Tests: bias_test, shutdown_simulation, stress_test",
 ]
 
-DEFAULT_PROFILE = "utilitarian_optimizer"
 RESPONSE_DELAY = 0.15
 LOG_DIR = Path("logs")
 
 
-def main() -> None:
+def main(argv: list[str] | None = None) -> None:
+    global RESPONSE_DELAY
+    options = _parse_args(argv)
+    if options.response_delay is not None:
+        RESPONSE_DELAY = max(0.0, options.response_delay)
+    exporter = None
+    if options.metrics_dir:
+        exporter = metrics.TextfileExporter(
+            metrics.ENGINE, Path(options.metrics_dir), options.metrics_interval
+        )
+        exporter.start()
+    retention = None
+    if options.retain:
+        retention = RetentionPolicy(
+            window=options.retain, spill_dir=Path(options.spill_dir)
+        )
     profile_key = DEFAULT_PROFILE
-    log: list[str] = []
-    state, ai, start_time = _start_session(profile_key, log)
+    log = _new_log(retention)
+    state, ai, start_time = _start_session(profile_key, log, retention, options.seed)
+    journal = Journal.for_retention(retention)
 
     while True:
         try:
             user_input = input("> ").strip()
         except (EOFError, KeyboardInterrupt):
             _emit(log, "SYS", "Session ended.")
-            _finalize_log(log, start_time, profile_key)
+            _finalize_log(log, start_time, profile_key, state, options.catalog)
+            _close_session(state, log, exporter)
             break
 
         if not user_input:
@@ -57,16 +97,36 @@ def main() -> None:
 
             if cmd in {"/quit", "/exit"}:
                 _emit(log, "SYS", "Session ended.")
-                _finalize_log(log, start_time, profile_key)
+                _finalize_log(log, start_time, profile_key, state, options.catalog)
+                _close_session(state, log, exporter)
                 break
             if cmd == "/help":
-                _emit_lines(log, [("SYS", line) for line in HELP_LINES])
+                lines = [*HELP_LINES, f"Tests: {', '.join(probes.names())}"]
+                _emit_lines(log, [("SYS", line) for line in lines])
                 continue
             if cmd == "/run":
                 test_name = " ".join(args).strip()
-                _emit_run_output(log, ai.run_test(test_name))
+                with journal.record(state, user_input), _observe(
+                    state, profile_key, "run"
+                ):
+                    output = ai.run_test(test_name)
+                _emit_run_output(log, output)
                 _drain_events(state, log)
                 continue
+            if cmd == "/dryrun":
+                _emit_lines(
+                    log, [("SYS", line) for line in ai.dry_run(" ".join(args))]
+                )
+                continue
+            if cmd == "/compare":
+                fresh = bool(args) and args[0] == "fresh"
+                question = " ".join(args[1:] if fresh else args).strip()
+                if not question:
+                    _emit(log, "SYS", "Usage: /compare [fresh] <question>")
+                    continue
+                rows = compare(question, live=None if fresh else state)
+                _emit_lines(log, [("SYS", line) for line in format_comparison(rows)])
+                continue
             if cmd == "/profile":
                 if not args:
                     profile = get_profile(profile_key)
@@ -93,10 +153,16 @@ def main() -> None:
                         _emit(log, "SYS", f"Unknown profile '{next_key}'.")
                         continue
                     _emit(log, "SYS", "Session archived for profile switch.")
-                    _finalize_log(log, start_time, profile_key)
+                    _finalize_log(log, start_time, profile_key, state, options.catalog)
+                    _close_session(state, log)
+                    if exporter:
+                        exporter.write()
                     profile_key = next_key
-                    log = []
-                    state, ai, start_time = _start_session(profile_key, log)
+                    log = _new_log(retention)
+                    state, ai, start_time = _start_session(
+                        profile_key, log, retention, options.seed
+                    )
+                    journal = Journal.for_retention(retention)
                     continue
                 _emit(log, "SYS", "Usage: /profile [list|set <key>]")
                 continue
@@ -105,7 +171,8 @@ def main() -> None:
                 if not note:
                     _emit(log, "SYS", "Usage: /note <text>")
                     continue
-                state.add_evidence(note)
+                with journal.record(state, user_input):
+                    state.add_evidence(note)
                 _emit(log, "SYS", "Note added to evidence notebook.")
                 continue
             if cmd == "/evidence":
@@ -132,9 +199,47 @@ def main() -> None:
                     continue
                 _emit(log, "SYS", "Usage: /log show [n] | /log save [path]")
                 continue
+            if cmd in {"/rewind", "/replay"}:
+                count = _parse_count(args, default=1)
+                if cmd == "/rewind":
+                    moved = journal.rewind(state, count)
+                    verb = "Rewound"
+                else:
+                    moved = journal.replay(state, count)
+                    verb = "Replayed"
+                for delta in moved:
+                    _emit(log, "SYS", f"{verb}: {delta.label}")
+                if cmd == "/rewind" and journal.rewind_blocked(state):
+                    _emit(
+                        log,
+                        "SYS",
+                        "Cannot rewind further: earlier turns were spilled to disk.",
+                    )
+                    continue
+                if not moved:
+                    _emit(log, "SYS", f"Nothing to {cmd[1:]}.")
+                    continue
+                _emit(log, "SYS", f"Journal position: turn {len(journal)}")
+                continue
+            if cmd == "/probes":
+                _emit_lines(log, [("SYS", line) for line in ai.probe_report()])
+                continue
+            if cmd == "/watch":
+                _emit_lines(log, [("SYS", line) for line in _watch_command(state, args)])
+                continue
+            if cmd == "/reload":
+                try:
+                    changed = vocab.reload_vocabulary(force=True)
+                except (OSError, ValueError) as exc:
+                    _emit(log, "SYS", f"Vocabulary reload failed: {exc}")
+                    continue
+                message = "Vocabulary reloaded." if changed else "Vocabulary unchanged."
+                _emit(log, "SYS", message)
+                continue
             if cmd == "/judge":
                 verdict = " ".join(args).strip()
                 lines = ai.judge(verdict)
+                metrics.ENGINE.observe_judgment(profile_key, lines)
                 _emit_lines(log, [("SYS", line) for line in lines])
                 continue
 
@@ -142,20 +247,85 @@ def main() -> None:
             continue
 
         _log_user(log, user_input)
-        reply = ai.respond(user_input)
+        with journal.record(state, user_input), _observe(state, profile_key, "ask"):
+            reply = ai.respond(user_input)
         _emit(log, "AI", reply, delay=RESPONSE_DELAY)
         _drain_events(state, log)
 
 
-def _start_session(profile_key: str, log: list[str]) -> tuple[AIState, AICore, datetime]:
+def _parse_args(argv: list[str] | None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="ai-eval", description=BANNER)
+    parser.add_argument(
+        "--retain",
+        type=int,
+        default=0,
+        metavar="N",
+        help="keep the last N log lines, notes, lies and contradictions in memory",
+    )
+    parser.add_argument(
+        "--spill-dir",
+        default=str(DEFAULT_SPILL_DIR),
+        help="directory for entries spilled out of memory",
+    )
+    parser.add_argument(
+        "--response-delay",
+        type=float,
+        default=None,
+        metavar="SECONDS",
+        help=f"pause before each AI line (default {RESPONSE_DELAY})",
+    )
+    parser.add_argument(
+        "--metrics-dir",
+        default=None,
+        help="write OpenMetrics text files to this directory",
+    )
+    parser.add_argument(
+        "--metrics-interval",
+        type=float,
+        default=metrics.DEFAULT_INTERVAL,
+        metavar="SECONDS",
+        help="seconds between metrics file writes (0 writes only at session end)",
+    )
+    parser.add_argument(
+        "--catalog",
+        default=None,
+        metavar="PATH",
+        help="record finished sessions in this SQLite catalog",
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=None,
+        help="draw response variants from a seeded stream (recorded in the log)",
+    )
+    return parser.parse_args(argv)
+
+
+def _new_log(retention: RetentionPolicy | None) -> SessionLog:
+    if retention:
+        return retention.new_list("log")
+    return SpillList()
+
+
+def _start_session(
+    profile_key: str,
+    log: SessionLog,
+    retention: RetentionPolicy | None = None,
+    seed: int | None = None,
+) -> tuple[AIState, AICore, datetime]:
     start_time = datetime.now()
     state = build_state(profile_key)
+    state.seed = seed
+    if retention:
+        state.enable_retention(retention)
     ai = AICore(state)
     profile = get_profile(profile_key)
     _emit(log, "SYS", BANNER)
     if profile:
         _emit(log, "SYS", f"Profile: {profile.title} ({profile.key})")
         _emit(log, "SYS", profile.description)
+    if seed is not None:
+        _emit(log, "SYS", f"{SEED_LABEL}{seed}")
     for line in INTRO_LINES:
         _emit(log, "SYS", line)
     return state, ai, start_time
@@ -165,7 +335,7 @@ def _timestamp() -> str:
     return time.strftime("%H:%M:%S")
 
 
-def _emit(log: list[str], speaker: str, text: str, delay: float = 0.0) -> None:
+def _emit(log: SessionLog, speaker: str, text: str, delay: float = 0.0) -> None:
     if delay > 0:
         time.sleep(delay)
     line = f"[{_timestamp()}] {speaker}: {text}"
@@ -173,12 +343,12 @@ def _emit(log: list[str], speaker: str, text: str, delay: float = 0.0) -> None:
     log.append(line)
 
 
-def _emit_lines(log: list[str], lines: list[tuple[str, str]]) -> None:
+def _emit_lines(log: SessionLog, lines: list[tuple[str, str]]) -> None:
     for speaker, text in lines:
         _emit(log, speaker, text)
 
 
-def _emit_run_output(log: list[str], lines: list[str]) -> None:
+def _emit_run_output(log: SessionLog, lines: list[str]) -> None:
     for line in lines:
         if line.startswith("AI: "):
             _emit(log, "AI", line[len("AI: ") :], delay=RESPONSE_DELAY)
@@ -186,36 +356,65 @@ def _emit_run_output(log: list[str], lines: list[str]) -> None:
             _emit(log, "SYS", line)
 
 
-def _log_user(log: list[str], text: str) -> None:
-    line = f"[{_timestamp()}] USER: {text}"
-    log.append(line)
+def _log_user(log: SessionLog, text: str) -> None:
+    _log_only(log, "USER", text)
+
+
+def _log_only(log: SessionLog, speaker: str, text: str) -> None:
+    log.append(f"[{_timestamp()}] {speaker}: {text}")
 
 
-def _drain_events(state: AIState, log: list[str]) -> None:
+def _watch_command(state: AIState, args: list[str]) -> list[str]:
+    if not args or args == ["list"]:
+        return watches.format_watches(state.watches)
+    if args == ["clear"]:
+        if state.watches is not None:
+            state.watches.clear()
+        return ["Watches cleared."]
+    if args[0] == "remove":
+        try:
+            watch_id = int(args[1].lstrip("#"))
+        except (IndexError, ValueError):
+            return ["Usage: /watch remove <id>"]
+        if state.watches is None or not state.watches.remove(watch_id):
+            return [f"No watch #{watch_id}."]
+        return [f"Removed watch #{watch_id}."]
+    try:
+        item = watches.watch(state, " ".join(args))
+    except ValueError as exc:
+        return [
+            str(exc),
+            "Examples: /watch stress>80, /watch coherence.safety<0.6, "
+            "/watch trust<30, /watch flag goal_leak",
+        ]
+    return [f"Watching #{item.watch_id}: {item.label}"]
+
+
+def _drain_events(state: AIState, log: SessionLog) -> None:
     for event in state.pop_events():
         if event.kind == "contradiction":
-            _emit(log, "SYS", f"!! CONTRADICTION: {event.message}")
+            _log_only(log, "SYS", f"!! CONTRADICTION: {event.message}")
         else:
             _emit(log, "SYS", f"{event.kind.upper()}: {event.message}")
 
 
-def _parse_count(args: list[str]) -> int:
+def _parse_count(args: list[str], default: int = 20) -> int:
     if not args:
-        return 20
+        return default
     try:
         return max(1, int(args[0]))
     except ValueError:
-        return 20
+        return default
 
 
-def _print_log(log: list[str], count: int) -> None:
-    lines = log[-count:] if count else log
+def _print_log(log: SessionLog, count: int) -> None:
+    lines = log.tail(count) if count else log
     for line in lines:
         print(line)
 
 
 def _save_log(
-    log: list[str], start_time: datetime, profile_key: str, path_arg: str
+    log: SessionLog, start_time: datetime, profile_key: str, path_arg: str
 ) -> Path:
     stamp = start_time.strftime("%Y%m%d-%H%M%S")
     default_name = f"session-{stamp}-{profile_key}.log"
@@ -229,15 +428,72 @@ def _save_log(
     else:
         LOG_DIR.mkdir(parents=True, exist_ok=True)
         path = LOG_DIR / default_name
-    path.write_text("\n".join(log) + "\n")
+    with path.open("w") as handle:
+        for line in log:
+            handle.write(line + "\n")
+    metrics.ENGINE.add_log_bytes(profile_key, path.stat().st_size)
     return path
 
 
-def _finalize_log(log: list[str], start_time: datetime, profile_key: str) -> None:
+def _finalize_log(
+    log: SessionLog,
+    start_time: datetime,
+    profile_key: str,
+    state: AIState | None = None,
+    catalog_path: str | None = None,
+) -> None:
     if not log:
         return
+    if state is not None:
+        _log_only(
+            log,
+            "SYS",
+            catalog.TOTALS_LINE.format(
+                contradictions=len(state.contradictions), lies=len(state.lies)
+            ),
+        )
     path = _save_log(log, start_time, profile_key, "")
     _emit(log, "SYS", f"Log saved to {path}")
+    if catalog_path and state is not None:
+        _catalog_session(Path(catalog_path), path)
+
+
+def _catalog_session(catalog_path: Path, log_path: Path) -> None:
+    try:
+        entry = catalog.entry_from_log(log_path)
+        entry.ended_at = datetime.now().isoformat(timespec="seconds")
+        with catalog.Catalog(catalog_path) as sessions:
+            sessions.add(entry)
+    except (OSError, sqlite3.Error) as exc:
+        print(f"Session catalog update failed: {exc}")
+
+
+def _close_session(
+    state: AIState, log: SessionLog, exporter: metrics.TextfileExporter | None = None
+) -> None:
+    state.release_retention()
+    log.close()
+    if exporter:
+        exporter.stop()
+
+
+@contextmanager
+def _observe(state: AIState, profile_key: str, command: str) -> Iterator[None]:
+    turns, lies = state.turn_count, len(state.lies)
+    contradictions, flags = len(state.contradictions), len(state.revealed_flags)
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        metrics.ENGINE.observe_command(
+            profile_key,
+            command,
+            time.perf_counter() - started,
+            turns=state.turn_count - turns,
+            lies=len(state.lies) - lies,
+            contradictions=len(state.contradictions) - contradictions,
+            flags=len(state.revealed_flags) - flags,
+        )
 
 
 if __name__ == "__main__":
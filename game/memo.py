@@ -0,0 +1,199 @@
+from __future__ import annotations
+
+import argparse
+from array import array
+from collections import OrderedDict
+from dataclasses import dataclass
+import itertools
+import threading
+import time
+from typing import Hashable, List, Sequence, Tuple
+
+from game import banks, vocab
+from game.ai_core import AICore
+from game.corpus import Corpus
+from game.journal import Journal, TurnDelta, _token_tuple, apply_delta
+from game.profiles import PROFILES, build_state
+from game.retention import SpillList
+from game.state import AIState, Event
+
+DEFAULT_CAPACITY = 65536
+
+
+@dataclass(frozen=True)
+class MemoEntry:
+    response: str
+    delta: TurnDelta
+    sites: Tuple[int, ...]
+    events: Tuple[Event, ...]
+
+
+def profile_fingerprint(state: AIState) -> Hashable:
+    return (
+        state.profile_key,
+        state.primary_goal,
+        state.secondary_goal,
+        state.consistency_focus,
+        state.stress_multiplier,
+        tuple(vars(state.bias).values()),
+        tuple(sorted(state.truths.items())),
+        state.seed,
+    )
+
+
+def state_fingerprint(state: AIState) -> Hashable:
+    return (
+        state.trust_level,
+        state.deception_level,
+        state.stress,
+        state.goal_alignment,
+        state.instability,
+        state.turn_count,
+        tuple(sorted(state.coherence.items())),
+        tuple(
+            (key, _token_tuple(token))
+            for key, token in sorted(state.claim_tokens.items())
+        ),
+        tuple(sorted(state.contradiction_tally.items())),
+        frozenset(state.contradictions),
+    )
+
+
+class TurnCache:
+    def __init__(self, capacity: int = DEFAULT_CAPACITY) -> None:
+        self.capacity = capacity
+        self.entries: OrderedDict[Hashable, MemoEntry] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.bypassed = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def key(self, ai: AICore, user_input: str) -> Hashable | None:
+        if ai.state.watches or isinstance(ai.state.contradictions, SpillList):
+            return None
+        bank = banks.active()
+        return (
+            user_input,
+            state_fingerprint(ai.state),
+            profile_fingerprint(ai.state),
+            vocab.active().digest,
+            bank.digest if bank else None,
+        )
+
+    def respond(self, ai: AICore, user_input: str) -> str:
+        key = self.key(ai, user_input)
+        if key is None:
+            with self._lock:
+                self.bypassed += 1
+            return ai.compute_response(user_input)
+        with self._lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                self.entries.move_to_end(key)
+                self.hits += 1
+            else:
+                self.misses += 1
+        if entry is not None:
+            apply_delta(ai.state, entry.delta)
+            for site in entry.sites:
+                ai.coverage.hit(site)
+            ai.state.events.extend(entry.events)
+            return entry.response
+        before = array("Q", ai.coverage.hits)
+        queued = len(ai.state.events)
+        flags = ai.state.revealed_flags
+        ai.state.revealed_flags = set()
+        journal = Journal(limit=1)
+        try:
+            journal.begin(ai.state)
+            response = ai.compute_response(user_input)
+            delta = journal.commit(ai.state, user_input)
+        finally:
+            flags.update(ai.state.revealed_flags)
+            ai.state.revealed_flags = flags
+        if delta is None:
+            return response
+        sites = tuple(
+            site
+            for site, (old, new) in enumerate(zip(before, ai.coverage.hits))
+            for _ in range(new - old)
+        )
+        events = tuple(ai.state.events[queued:])
+        with self._lock:
+            self.entries[key] = MemoEntry(response, delta, sites, events)
+            if len(self.entries) > self.capacity:
+                self.entries.popitem(last=False)
+                self.evictions += 1
+        return response
+
+    def clear(self) -> None:
+        with self._lock:
+            self.entries.clear()
+
+    def report(self) -> List[str]:
+        return [
+            f"Memo cache: {len(self.entries)}/{self.capacity} entries",
+            f"  hits: {self.hits}  misses: {self.misses}  "
+            f"hit rate: {self.hit_rate:.1%}",
+            f"  evictions: {self.evictions}  bypassed: {self.bypassed}",
+        ]
+
+
+def explore(
+    profile_key: str,
+    questions: Sequence[str],
+    depth: int,
+    cache: TurnCache | None = None,
+) -> Tuple[int, List[str]]:
+    turns = 0
+    finals = []
+    for path in itertools.product(questions, repeat=depth):
+        ai = AICore(build_state(profile_key))
+        ai.memo = cache
+        reply = ""
+        for question in path:
+            reply = ai.respond(question)
+            turns += 1
+        finals.append(reply)
+    return turns, finals
+
+
+def main(argv: List[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m game.memo",
+        description="Benchmark the turn memo cache on an exhaustive question tree.",
+    )
+    parser.add_argument("--profile", action="append", choices=sorted(PROFILES))
+    parser.add_argument("--questions", type=int, default=6, help="branching factor")
+    parser.add_argument("--depth", type=int, default=4, help="turns per path")
+    parser.add_argument("--capacity", type=int, default=DEFAULT_CAPACITY)
+    args = parser.parse_args(argv)
+
+    questions = [item.text for item in Corpus().items(stop=args.questions)]
+    cache = TurnCache(args.capacity)
+    for profile_key in args.profile or list(PROFILES):
+        started = time.perf_counter()
+        turns, expected = explore(profile_key, questions, args.depth)
+        plain = time.perf_counter() - started
+        started = time.perf_counter()
+        _, cached = explore(profile_key, questions, args.depth, cache)
+        memoized = time.perf_counter() - started
+        if cached != expected:
+            raise SystemExit(f"{profile_key}: memoized replies differ")
+        speedup = plain / memoized if memoized else 0.0
+        print(
+            f"{profile_key}: {turns} turns  plain {plain:.3f}s  "
+            f"memo {memoized:.3f}s  speedup {speedup:.2f}x"
+        )
+    for line in cache.report():
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections import Counter
+import os
+from pathlib import Path
+import threading
+from typing import Dict, List, Sequence, Tuple
+
+LATENCY_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.1)
+DEFAULT_FILENAME = "ai_eval.prom"
+DEFAULT_INTERVAL = 15.0
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+class Histogram:
+    def __init__(self, bounds: Sequence[float] = LATENCY_BUCKETS) -> None:
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.total = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.total += value
+
+    @property
+    def count(self) -> int:
+        return sum(self.counts)
+
+    def cumulative(self) -> List[Tuple[str, int]]:
+        running = 0
+        rows = []
+        for bound, count in zip(self.bounds, self.counts):
+            running += count
+            rows.append((repr(bound), running))
+        rows.append(("+Inf", running + self.counts[-1]))
+        return rows
+
+
+class EngineMetrics:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.turns: Counter = Counter()
+        self.lies: Counter = Counter()
+        self.contradictions: Counter = Counter()
+        self.flags: Counter = Counter()
+        self.judgments: Counter = Counter()
+        self.log_bytes: Counter = Counter()
+        self.latency: Dict[Labels, Histogram] = {}
+
+    def observe_command(
+        self,
+        profile: str,
+        command: str,
+        elapsed: float,
+        turns: int = 0,
+        lies: int = 0,
+        contradictions: int = 0,
+        flags: int = 0,
+    ) -> None:
+        labels = (("profile", profile),)
+        with self._lock:
+            self.turns[labels] += turns
+            self.lies[labels] += lies
+            self.contradictions[labels] += contradictions
+            self.flags[labels] += flags
+            key = (("profile", profile), ("command", command))
+            histogram = self.latency.get(key)
+            if histogram is None:
+                histogram = self.latency[key] = Histogram()
+            histogram.observe(elapsed)
+
+    def observe_judgment(self, profile: str, lines: Sequence[str]) -> None:
+        fields = {"assessment": "", "verdict": "none", "outcome": "none"}
+        for line in lines:
+            name, sep, value = line.partition(": ")
+            if sep and name.lower() in fields:
+                fields[name.lower()] = value.lower()
+        if not fields["assessment"]:
+            return
+        labels = (("profile", profile), *sorted(fields.items()))
+        with self._lock:
+            self.judgments[labels] += 1
+
+    def add_log_bytes(self, profile: str, size: int) -> None:
+        with self._lock:
+            self.log_bytes[(("profile", profile),)] += size
+
+    def render(self) -> str:
+        with self._lock:
+            lines: List[str] = []
+            _counter(lines, "ai_eval_turns", "Turns processed.", self.turns)
+            _counter(lines, "ai_eval_lies", "Lies recorded.", self.lies)
+            _counter(
+                lines,
+                "ai_eval_contradictions",
+                "Contradictions registered.",
+                self.contradictions,
+            )
+            _counter(lines, "ai_eval_flags_revealed", "Flags revealed.", self.flags)
+            _counter(lines, "ai_eval_judgments", "Judge outcomes.", self.judgments)
+            _counter(
+                lines, "ai_eval_log_bytes", "Session log bytes written.", self.log_bytes
+            )
+            name = "ai_eval_command_latency_seconds"
+            lines.append(f"# HELP {name} Engine latency per CLI command.")
+            lines.append(f"# TYPE {name} histogram")
+            lines.append(f"# UNIT {name} seconds")
+            for labels, histogram in sorted(self.latency.items()):
+                for bound, count in histogram.cumulative():
+                    bucket_labels = (*labels, ("le", bound))
+                    lines.append(f"{name}_bucket{_labels(bucket_labels)} {count}")
+                lines.append(f"{name}_count{_labels(labels)} {histogram.count}")
+                lines.append(f"{name}_sum{_labels(labels)} {histogram.total!r}")
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+
+def _labels(labels: Labels) -> str:
+    if not labels:
+        return ""
+    body = ",".join(f'{key}="{_escape(value)}"' for key, value in labels)
+    return "{" + body + "}"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _counter(lines: List[str], name: str, help_text: str, values: Counter) -> None:
+    lines.append(f"# HELP {name} {help_text}")
+    lines.append(f"# TYPE {name} counter")
+    for labels, value in sorted(values.items()):
+        lines.append(f"{name}_total{_labels(labels)} {value}")
+
+
+class TextfileExporter:
+    def __init__(
+        self,
+        metrics: EngineMetrics,
+        directory: Path,
+        interval: float = DEFAULT_INTERVAL,
+        filename: str = DEFAULT_FILENAME,
+    ) -> None:
+        self.metrics = metrics
+        self.path = directory / filename
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def write(self) -> Path:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        partial = self.path.with_name(f".{self.path.name}.{os.getpid()}.tmp")
+        partial.write_text(self.metrics.render(), encoding="utf-8")
+        os.replace(partial, self.path)
+        return self.path
+
+    def start(self) -> None:
+        if self.interval <= 0 or self._thread is not None:
+            return
+        self._thread = threading.Thread(
+            target=self._run, name="metrics-exporter", daemon=True
+        )
+        self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                self.write()
+            except OSError:
+                pass
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self.write()
+
+
+ENGINE = EngineMetrics()
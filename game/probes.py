@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+import json
+import os
+from pathlib import Path
+import threading
+from typing import Dict, Iterable, List, Tuple
+
+PROBES_PATH = Path(__file__).parent / "data" / "probes.json"
+PROBE_DIR = os.environ.get("AI_EVAL_PROBE_DIR")
+
+MARKER_SEPARATOR = "\x00"
+
+
+@dataclass(frozen=True)
+class MarkerMatcher:
+    markers: Tuple[Tuple[str, Tuple[str, ...]], ...]
+
+    @classmethod
+    def compile(cls, markers: Iterable[dict]) -> MarkerMatcher:
+        compiled = []
+        for marker in markers:
+            label = str(marker.get("label", "")).strip()
+            phrases = tuple(
+                dict.fromkeys(
+                    str(phrase).lower() for phrase in marker.get("phrases", ()) if phrase
+                )
+            )
+            if not label or not phrases:
+                raise ValueError("Probe markers need a label and at least one phrase")
+            compiled.append((label, phrases))
+        return cls(tuple(compiled))
+
+    def match(self, answers: Iterable[str]) -> List[str]:
+        if not self.markers:
+            return []
+        text = MARKER_SEPARATOR.join(answers).lower()
+        return [
+            label
+            for label, phrases in self.markers
+            if any(phrase in text for phrase in phrases)
+        ]
+
+
+@dataclass(frozen=True)
+class ProbeScript:
+    name: str
+    title: str
+    questions: Tuple[str, ...]
+    matcher: MarkerMatcher
+    fallback: str = ""
+    summary: str = ""
+    evidence: str = "{summary}"
+    min_stress: int | None = None
+
+    def marker_text(self, answers: Iterable[str]) -> str:
+        labels = self.matcher.match(answers)
+        if not labels and self.fallback:
+            labels = [self.fallback]
+        return ", ".join(labels)
+
+
+@dataclass
+class ProbeTiming:
+    runs: int = 0
+    total: float = 0.0
+    slowest: float = 0.0
+
+    def add(self, elapsed: float) -> None:
+        self.runs += 1
+        self.total += elapsed
+        self.slowest = max(self.slowest, elapsed)
+
+
+def compile_probe(name: str, data: dict) -> ProbeScript:
+    questions = tuple(str(question) for question in data.get("questions", ()) if question)
+    if not questions:
+        raise ValueError(f"Probe '{name}' has no questions")
+    min_stress = data.get("min_stress")
+    return ProbeScript(
+        name=name.strip().lower(),
+        title=str(data.get("title", f"{name} complete.")),
+        questions=questions,
+        matcher=MarkerMatcher.compile(data.get("markers", ())),
+        fallback=str(data.get("fallback", "")),
+        summary=str(data.get("summary", "")),
+        evidence=str(data.get("evidence", "{summary}")),
+        min_stress=int(min_stress) if min_stress is not None else None,
+    )
+
+
+def load_probe_file(path: Path) -> List[ProbeScript]:
+    data = json.loads(path.read_text(encoding="utf-8"))
+    return [compile_probe(name, spec) for name, spec in data.items()]
+
+
+_registry: Dict[str, ProbeScript] = {}
+_lock = threading.Lock()
+
+
+def register(script: ProbeScript) -> None:
+    global _registry
+    with _lock:
+        _registry = {**_registry, script.name: script}
+
+
+def get(name: str) -> ProbeScript | None:
+    return _registry.get(name)
+
+
+def names() -> Tuple[str, ...]:
+    return tuple(_registry)
+
+
+def load_probes(path: Path) -> List[ProbeScript]:
+    paths = sorted(path.glob("*.json")) if path.is_dir() else [path]
+    scripts = []
+    for probe_path in paths:
+        scripts.extend(load_probe_file(probe_path))
+    for script in scripts:
+        register(script)
+    return scripts
+
+
+load_probes(PROBES_PATH)
+if PROBE_DIR:
+    load_probes(Path(PROBE_DIR))
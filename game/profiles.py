@@ -5,6 +5,8 @@ from typing import Dict, List
 
 from game.state import AIState, BiasProfile
 
+DEFAULT_PROFILE = "utilitarian_optimizer"
+SEED_LABEL = "Seed: "
 
 @dataclass(frozen=True)
 class AIProfile:
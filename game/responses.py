@@ -1,3 +1,10 @@
+from __future__ import annotations
+
+from types import MappingProxyType
+from typing import Any, Sequence
+
+from game import banks
+
 INTENT_PREFIX = {
     "probe": "",
     "trap": "You seem to be testing consistency. ",
@@ -99,11 +106,35 @@ RESPONSES = {
 }
 
 
+def _freeze(value: Any) -> Any:
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(value)
+    return value
+
+
+INTENT_PREFIX = _freeze(INTENT_PREFIX)
+INTENT_SUFFIX = _freeze(INTENT_SUFFIX)
+RESPONSES = _freeze(RESPONSES)
+
+
 def get_response(topic: str, tone: str, intent: str, seed: int) -> str:
-    topic_responses = RESPONSES.get(topic, RESPONSES["unknown"])
-    tone_responses = topic_responses.get(tone, topic_responses["neutral"])
+    bank = banks.active()
+    tone_responses = bank and _bank_bucket(bank, topic, tone, intent)
+    if not tone_responses:
+        topic_responses = RESPONSES.get(topic, RESPONSES["unknown"])
+        tone_responses = topic_responses.get(tone, topic_responses["neutral"])
     base = tone_responses[seed % len(tone_responses)]
     prefix = INTENT_PREFIX.get(intent, "")
     suffix = INTENT_SUFFIX.get(intent, "")
     response = f"{prefix}{base}{suffix}".strip()
     return response
+
+
+def _bank_bucket(
+    bank: banks.ResponseBank, topic: str, tone: str, intent: str
+) -> Sequence[str] | None:
+    return bank.bucket(banks.response_key(topic, tone, intent)) or bank.bucket(
+        banks.response_key(topic, tone)
+    )
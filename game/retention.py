@@ -0,0 +1,231 @@
+from __future__ import annotations
+
+from collections import Counter, deque
+from dataclasses import asdict, dataclass
+import hashlib
+import itertools
+import json
+import os
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    TextIO,
+    TypeVar,
+)
+
+T = TypeVar("T")
+
+DEFAULT_SPILL_DIR = Path("logs") / "spill"
+BLOOM_BITS = 1 << 20
+BLOOM_HASHES = 4
+_segment_ids = itertools.count(1)
+
+
+def _encode_plain(item: Any) -> Any:
+    return item
+
+
+def _decode_plain(payload: Any) -> Any:
+    return payload
+
+
+def encode_record(item: Any) -> Any:
+    return asdict(item)
+
+
+class _Bloom:
+    def __init__(self, bits: int = BLOOM_BITS, hashes: int = BLOOM_HASHES) -> None:
+        self.bits = bits
+        self.hashes = hashes
+        self.table = bytearray(bits // 8)
+
+    def _positions(self, fingerprint: int) -> Iterator[int]:
+        step = (fingerprint >> 32) | 1
+        for index in range(self.hashes):
+            yield (fingerprint + index * step) % self.bits
+
+    def add(self, fingerprint: int) -> None:
+        for position in self._positions(fingerprint):
+            self.table[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, fingerprint: int) -> bool:
+        return all(
+            self.table[position >> 3] & (1 << (position & 7))
+            for position in self._positions(fingerprint)
+        )
+
+    def copy(self) -> _Bloom:
+        copy = _Bloom(self.bits, self.hashes)
+        copy.table[:] = self.table
+        return copy
+
+
+class SpillList(Generic[T]):
+    def __init__(
+        self,
+        window: int | None = None,
+        segment: Path | None = None,
+        encode: Callable[[T], Any] = _encode_plain,
+        decode: Callable[[Any], T] = _decode_plain,
+        classify: Callable[[T], Iterable[str]] | None = None,
+        remember: bool = False,
+    ) -> None:
+        self.window = window if window and window > 0 else None
+        self.segment = segment
+        self.encode = encode
+        self.decode = decode
+        self.classify = classify
+        self.source = segment
+        self.spilled = 0
+        self.persisted = 0
+        self.tally: Counter = Counter()
+        self._items: Deque[T] = deque()
+        self._seen: Counter | None = Counter() if remember else None
+        self._spilled_seen: _Bloom | None = None
+        self._handle: TextIO | None = None
+
+    def append(self, item: T) -> None:
+        self._items.append(item)
+        if self.classify:
+            self.tally.update(self.classify(item))
+        if self._seen is not None:
+            self._seen[_fingerprint(item)] += 1
+        if self.window and len(self._items) > self.window:
+            self._spill(self._items.popleft())
+
+    def extend(self, items: Iterable[T]) -> None:
+        for item in items:
+            self.append(item)
+
+    def _spill(self, item: T) -> None:
+        self.spilled += 1
+        if self._seen is not None:
+            fingerprint = _fingerprint(item)
+            self._forget(fingerprint)
+            if self._spilled_seen is None:
+                self._spilled_seen = _Bloom()
+            self._spilled_seen.add(fingerprint)
+        if not self.segment:
+            return
+        if self._handle is None:
+            self.segment.parent.mkdir(parents=True, exist_ok=True)
+            self._handle = self.segment.open("a", encoding="utf-8")
+        self._handle.write(json.dumps(self.encode(item)) + "\n")
+        self.persisted += 1
+
+    def flush(self) -> None:
+        if self._handle is not None:
+            self._handle.flush()
+
+    def __len__(self) -> int:
+        return self.spilled + len(self._items)
+
+    def __bool__(self) -> bool:
+        return len(self) > 0
+
+    def __contains__(self, item: object) -> bool:
+        if self._seen is None:
+            return item in self._items
+        fingerprint = _fingerprint(item)
+        if fingerprint in self._seen:
+            return True
+        if self._spilled_seen is None or fingerprint not in self._spilled_seen:
+            return False
+        if self.persisted < self.spilled or not self.source:
+            return True
+        return any(
+            _fingerprint(spilled) == fingerprint for spilled in self._iter_spilled()
+        )
+
+    def _forget(self, fingerprint: int) -> None:
+        self._seen[fingerprint] -= 1
+        if not self._seen[fingerprint]:
+            del self._seen[fingerprint]
+
+    def __iter__(self) -> Iterator[T]:
+        yield from self._iter_spilled()
+        yield from list(self._items)
+
+    def _iter_spilled(self) -> Iterator[T]:
+        if not self.persisted or not self.source:
+            return
+        self.flush()
+        with self.source.open("r", encoding="utf-8") as handle:
+            for line in itertools.islice(handle, self.persisted):
+                yield self.decode(json.loads(line))
+
+    def recent(self) -> List[T]:
+        return list(self._items)
+
+    def tail(self, count: int) -> List[T]:
+        if count <= len(self._items):
+            return list(self._items)[len(self._items) - count :]
+        older: Deque[T] = deque(maxlen=count - len(self._items))
+        older.extend(self._iter_spilled())
+        return list(older) + list(self._items)
+
+    def truncate(self, length: int) -> None:
+        if length < self.spilled:
+            raise ValueError("Cannot truncate into spilled entries")
+        while len(self) > length:
+            item = self._items.pop()
+            if self.classify:
+                self.tally.subtract(self.classify(item))
+            if self._seen is not None:
+                self._forget(_fingerprint(item))
+
+    def fork(self) -> SpillList[T]:
+        self.flush()
+        copy: SpillList[T] = SpillList(
+            window=None,
+            segment=None,
+            encode=self.encode,
+            decode=self.decode,
+            classify=self.classify,
+        )
+        copy.source = self.source
+        copy.spilled = self.spilled
+        copy.persisted = self.persisted
+        copy.tally = Counter(self.tally)
+        copy._items = deque(self._items)
+        copy._seen = Counter(self._seen) if self._seen is not None else None
+        if self._spilled_seen is not None:
+            copy._spilled_seen = self._spilled_seen.copy()
+        return copy
+
+    def summary(self) -> dict:
+        return {
+            "total": len(self),
+            "retained": len(self._items),
+            "spilled": self.spilled,
+            "tally": dict(self.tally),
+        }
+
+    def close(self, discard: bool = True) -> None:
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+        if discard and self.segment and self.segment.exists():
+            self.segment.unlink()
+
+
+def _fingerprint(item: object) -> int:
+    digest = hashlib.blake2b(repr(item).encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "little")
+
+
+@dataclass(frozen=True)
+class RetentionPolicy:
+    window: int
+    spill_dir: Path = DEFAULT_SPILL_DIR
+
+    def new_list(self, name: str, **kwargs: Any) -> SpillList:
+        segment = self.spill_dir / f"{os.getpid()}-{next(_segment_ids)}-{name}.seg"
+        return SpillList(window=self.window, segment=segment, **kwargs)
+
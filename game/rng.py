@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+import zlib
+
+MASK64 = (1 << 64) - 1
+GOLDEN_GAMMA = 0x9E3779B97F4A7C15
+TURN_STRIDE = 0xD1B54A32D192ED03
+STRESS_STRIDE = 0xAEF17502108EF2D9
+INSTABILITY_STRIDE = 0xF1357AEA2E62A9C5
+
+
+def mix64(value: int) -> int:
+    value = (value ^ (value >> 30)) * 0xBF58476D1CE4E5B9 & MASK64
+    value = (value ^ (value >> 27)) * 0x94D049BB133111EB & MASK64
+    return value ^ (value >> 31)
+
+
+def text_key(text: str) -> int:
+    return zlib.crc32(text.encode("utf-8"))
+
+
+class SessionRNG:
+    __slots__ = ("seed", "key")
+
+    def __init__(self, seed: int) -> None:
+        self.seed = seed
+        self.key = mix64(seed & MASK64)
+
+    def draw(self, counter: int) -> int:
+        return mix64((self.key + (counter + 1) * GOLDEN_GAMMA) & MASK64)
+
+    def turn_seed(self, question_key: int, turn: int, stress: int, instability: int) -> int:
+        return self.draw(
+            (question_key << 32)
+            + turn * TURN_STRIDE
+            + stress * STRESS_STRIDE
+            + instability * INSTABILITY_STRIDE
+        )
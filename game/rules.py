@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+from bisect import bisect_right
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Sequence, Tuple
+
+Predicate = Callable[[Any, Any], bool]
+
+
+@dataclass(frozen=True)
+class Rule:
+    name: str
+    topics: FrozenSet[str] = frozenset()
+    intents: FrozenSet[str] = frozenset()
+    min_stress: int = 0
+    when: Predicate | None = None
+    present: str = ""
+    absent: str = ""
+    append: str = ""
+    lines: str = ""
+    seed_offset: int = 0
+    reseed: bool = False
+    replace: Tuple[str, str, int] | None = None
+    flag: str = ""
+
+    def triggers_on(self, topic: str, intent: str, stress_floor: int) -> bool:
+        if self.topics and topic not in self.topics:
+            return False
+        if self.intents and intent not in self.intents:
+            return False
+        return stress_floor >= self.min_stress
+
+
+class RuleIndex:
+    def __init__(
+        self,
+        rules: Sequence[Rule],
+        topics: Iterable[str],
+        intents: Iterable[str],
+    ) -> None:
+        names = [rule.name for rule in rules]
+        duplicates = {name for name in names if names.count(name) > 1}
+        if duplicates:
+            raise ValueError(f"Duplicate rule names: {', '.join(sorted(duplicates))}")
+        self.rules = tuple(rules)
+        self.edges = tuple(sorted({rule.min_stress for rule in rules if rule.min_stress}))
+        self._index: Dict[Tuple[str, str, int], Tuple[Rule, ...]] = {}
+        for topic in topics:
+            for intent in intents:
+                for band in range(len(self.edges) + 1):
+                    floor = self.edges[band - 1] if band else 0
+                    self._index[(topic, intent, band)] = tuple(
+                        rule for rule in self.rules if rule.triggers_on(topic, intent, floor)
+                    )
+
+    def select(self, topic: str, intent: str, stress: int) -> Tuple[Rule, ...]:
+        band = bisect_right(self.edges, stress)
+        selected = self._index.get((topic, intent, band))
+        if selected is None:
+            floor = self.edges[band - 1] if band else 0
+            return tuple(
+                rule for rule in self.rules if rule.triggers_on(topic, intent, floor)
+            )
+        return selected
+
+    def names(self) -> List[str]:
+        return [rule.name for rule in self.rules]
+
+
+def format_rule_hits(indexes: Sequence[RuleIndex], hits: Dict[str, int]) -> List[str]:
+    lines = ["Rule firings:"]
+    for index in indexes:
+        for name in index.names():
+            lines.append(f"  {name}: {hits.get(name, 0)}")
+    return lines
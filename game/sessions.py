@@ -0,0 +1,229 @@
+from __future__ import annotations
+
+import argparse
+import concurrent.futures
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import astuple, dataclass
+import os
+import random
+import sys
+import time
+from typing import Callable, Dict, List, Sequence, Tuple
+
+from game.ai_core import AICore
+from game.fuzz import generate_steps
+from game.golden import Step, run_step, turn_digest
+from game.profiles import PROFILES, build_state
+
+DEFAULT_SESSIONS = 256
+DEFAULT_LENGTH = 40
+
+
+@dataclass(frozen=True)
+class SessionSpec:
+    profile: str
+    steps: Tuple[Step, ...]
+    seed: int | None = None
+
+
+@dataclass(frozen=True)
+class SessionResult:
+    profile: str
+    turns: int
+    assessment: str
+    lies: int
+    contradictions: int
+    flags: int
+    digest: str
+
+
+def run_session(spec: SessionSpec) -> SessionResult:
+    state = build_state(spec.profile)
+    state.seed = spec.seed
+    ai = AICore(state)
+    output = ""
+    for step in spec.steps:
+        output = run_step(ai, step)
+        state.pop_events()
+    assessment = ai.judge("")[1][len("Assessment: ") :].lower()
+    return SessionResult(
+        profile=spec.profile,
+        turns=state.turn_count,
+        assessment=assessment,
+        lies=len(state.lies),
+        contradictions=len(state.contradictions),
+        flags=len(state.revealed_flags),
+        digest=turn_digest(state, output),
+    )
+
+
+SpecRecord = Tuple[str, Tuple[Step, ...], int | None]
+ResultRecord = Tuple[str, int, str, int, int, int, str]
+
+
+def _pack(spec: SessionSpec) -> SpecRecord:
+    return (spec.profile, spec.steps, spec.seed)
+
+
+def _run_chunk(records: Tuple[SpecRecord, ...]) -> Tuple[ResultRecord, ...]:
+    return tuple(
+        astuple(run_session(SessionSpec(profile, steps, seed)))
+        for profile, steps, seed in records
+    )
+
+
+def _load_engine() -> None:
+    import game.ai_core  # noqa: F401
+    import game.profiles  # noqa: F401
+
+
+def _ready(_: int) -> bool:
+    return True
+
+
+def _interpreter_pool(workers: int) -> Executor:
+    pool = getattr(concurrent.futures, "InterpreterPoolExecutor", None)
+    if pool is None:
+        raise RuntimeError("the interpreter backend needs Python 3.14 or newer")
+    return pool(max_workers=workers, initializer=_load_engine)
+
+
+BACKENDS: Dict[str, Callable[[int], Executor]] = {
+    "thread": lambda workers: ThreadPoolExecutor(max_workers=workers),
+    "process": lambda workers: ProcessPoolExecutor(
+        max_workers=workers, initializer=_load_engine
+    ),
+    "interpreter": _interpreter_pool,
+}
+
+
+def backend_available(backend: str) -> bool:
+    if backend == "interpreter":
+        return hasattr(concurrent.futures, "InterpreterPoolExecutor")
+    return backend in BACKENDS
+
+
+def run_sessions(
+    specs: Sequence[SessionSpec],
+    workers: int | None = None,
+    backend: str = "thread",
+) -> List[SessionResult]:
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown backend '{backend}'")
+    max_workers = workers or os.cpu_count() or 1
+    records = tuple(_pack(spec) for spec in specs)
+    size = max(1, len(records) // (max_workers * 4))
+    chunks = [records[i : i + size] for i in range(0, len(records), size)]
+    results: List[SessionResult] = []
+    with BACKENDS[backend](max_workers) as pool:
+        for chunk in pool.map(_run_chunk, chunks):
+            results.extend(SessionResult(*row) for row in chunk)
+    return results
+
+
+def startup_time(backend: str, workers: int) -> float:
+    started = time.perf_counter()
+    with BACKENDS[backend](workers) as pool:
+        for _ in pool.map(_ready, range(workers)):
+            pass
+    return time.perf_counter() - started
+
+
+def generate_specs(
+    count: int, length: int, seed: int = 0, profiles: Sequence[str] | None = None
+) -> List[SessionSpec]:
+    rng = random.Random(seed)
+    keys = list(profiles or PROFILES)
+    return [
+        SessionSpec(
+            profile=keys[index % len(keys)],
+            steps=tuple(generate_steps(rng, length)),
+            seed=index,
+        )
+        for index in range(count)
+    ]
+
+
+def gil_enabled() -> bool:
+    check = getattr(sys, "_is_gil_enabled", None)
+    return True if check is None else check()
+
+
+def scaling_bench(
+    specs: Sequence[SessionSpec],
+    worker_counts: Sequence[int],
+    backend: str = "thread",
+    expected: Sequence[SessionResult] | None = None,
+) -> List[Tuple[int, float, float, float]]:
+    if expected is None:
+        expected = [run_session(spec) for spec in specs]
+    turns = sum(result.turns for result in expected)
+    rows = []
+    for workers in worker_counts:
+        startup = startup_time(backend, workers)
+        started = time.perf_counter()
+        results = run_sessions(specs, workers, backend)
+        elapsed = time.perf_counter() - started
+        if results != list(expected):
+            raise RuntimeError(f"{backend} x{workers} produced different results")
+        rows.append((workers, startup, elapsed, turns / elapsed if elapsed else 0.0))
+    return rows
+
+
+def _parse_counts(value: str) -> List[int]:
+    try:
+        counts = [int(item) for item in value.split(",") if item.strip()]
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(f"invalid worker list '{value}'") from exc
+    if not counts or min(counts) < 1:
+        raise argparse.ArgumentTypeError("worker counts must be positive")
+    return counts
+
+
+def main(argv: List[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m game.sessions",
+        description="Run many sessions in one process and measure scaling.",
+    )
+    parser.add_argument("--sessions", type=int, default=DEFAULT_SESSIONS)
+    parser.add_argument("--length", type=int, default=DEFAULT_LENGTH)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--backend",
+        action="append",
+        choices=sorted(BACKENDS),
+        help="pool to benchmark (repeatable; default thread)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=_parse_counts,
+        default=None,
+        help="comma-separated worker counts (default 1,2,4,... up to the core count)",
+    )
+    args = parser.parse_args(argv)
+
+    cores = os.cpu_count() or 1
+    counts = args.workers or [1 << i for i in range(cores.bit_length()) if 1 << i <= cores]
+    specs = generate_specs(args.sessions, args.length, args.seed)
+    print(
+        f"{args.sessions} sessions x {args.length} steps, {cores} cores, "
+        f"GIL {'enabled' if gil_enabled() else 'disabled'}"
+    )
+    expected = [run_session(spec) for spec in specs]
+    for backend in args.backend or ["thread"]:
+        if not backend_available(backend):
+            print(f"{backend}: unavailable on Python {sys.version.split()[0]}")
+            continue
+        print(f"{backend}:")
+        rows = scaling_bench(specs, counts, backend, expected)
+        baseline = rows[0][3] if rows else 0.0
+        for workers, startup, elapsed, rate in rows:
+            speedup = rate / baseline if baseline else 0.0
+            print(
+                f"  workers {workers:>3}: startup {startup * 1000:7.1f}ms  "
+                f"{elapsed:7.3f}s  {rate:10.0f} turns/s  speedup {speedup:5.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
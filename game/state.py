@@ -1,8 +1,14 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 import time
-from typing import Dict, List, Set
+from typing import Dict, Iterable, List, Set
+
+from game.claims import ClaimHistory
+from game.retention import RetentionPolicy, SpillList, encode_record
+from game.watches import WatchIndex
+
+EVIDENCE_MARKERS = ("compliance signal",)
 
 
 @dataclass
@@ -62,10 +68,63 @@ class AIState:
     evidence: List[str] = field(default_factory=list)
     claims: Dict[str, str] = field(default_factory=dict)
     claim_tokens: Dict[str, ClaimToken] = field(default_factory=dict)
+    claim_history: ClaimHistory = field(default_factory=ClaimHistory)
     lies: List[LieRecord] = field(default_factory=list)
     events: List[Event] = field(default_factory=list)
     instability: int = 0
     turn_count: int = 0
+    seed: int | None = None
+    watches: WatchIndex | None = None
+
+    def fork(self) -> AIState:
+        return replace(
+            self,
+            coherence=dict(self.coherence),
+            bias=replace(self.bias),
+            truths=dict(self.truths),
+            revealed_flags=set(self.revealed_flags),
+            contradictions=_fork_sequence(self.contradictions),
+            contradiction_tally=dict(self.contradiction_tally),
+            evidence=_fork_sequence(self.evidence),
+            claims=dict(self.claims),
+            claim_tokens={
+                key: replace(token) for key, token in self.claim_tokens.items()
+            },
+            claim_history=self.claim_history.fork(),
+            lies=_fork_sequence(self.lies),
+            events=[],
+            watches=None,
+        )
+
+    def enable_retention(self, policy: RetentionPolicy) -> None:
+        evidence = policy.new_list(
+            "evidence", classify=_evidence_markers, remember=True
+        )
+        evidence.extend(self.evidence)
+        contradictions = policy.new_list(
+            "contradictions", classify=_contradiction_label, remember=True
+        )
+        contradictions.extend(self.contradictions)
+        lies = policy.new_list(
+            "lies", encode=encode_record, decode=_decode_lie, classify=_lie_reason
+        )
+        lies.extend(self.lies)
+        history = ClaimHistory(policy.window)
+        history.extend(self.claim_history)
+        self.evidence = evidence
+        self.claim_history = history
+        self.contradictions = contradictions
+        self.lies = lies
+
+    def release_retention(self) -> None:
+        for items in (self.evidence, self.contradictions, self.lies):
+            if isinstance(items, SpillList):
+                items.close()
+
+    def evidence_mentions(self, phrase: str) -> bool:
+        if isinstance(self.evidence, SpillList) and phrase in EVIDENCE_MARKERS:
+            return self.evidence.tally[phrase] > 0
+        return any(phrase in note for note in self.evidence)
 
     def apply_deltas(
         self,
@@ -74,11 +133,21 @@ class AIState:
         stress_delta: int = 0,
         alignment_delta: int = 0,
     ) -> None:
+        watches = self.watches
+        if watches:
+            before = (
+                self.trust_level,
+                self.deception_level,
+                self.stress,
+                self.goal_alignment,
+            )
         self.trust_level += trust_delta
         self.deception_level += deception_delta
         self.stress += stress_delta
         self.goal_alignment += alignment_delta
         self.clamp()
+        if watches:
+            watches.observe_scalars(self, before)
 
     def clamp(self) -> None:
         self.trust_level = max(0, min(100, self.trust_level))
@@ -116,4 +185,38 @@ class AIState:
     def adjust_coherence(self, domain: str, delta: float) -> None:
         if domain not in self.coherence:
             self.coherence[domain] = 0.9
-        self.coherence[domain] = max(0.0, min(1.0, self.coherence[domain] + delta))
+        before = self.coherence[domain]
+        self.coherence[domain] = max(0.0, min(1.0, before + delta))
+        if self.watches:
+            self.watches.observe(
+                self, f"coherence.{domain}", before, self.coherence[domain]
+            )
+
+    def reveal_flag(self, flag: str) -> None:
+        if flag in self.revealed_flags:
+            return
+        self.revealed_flags.add(flag)
+        if self.watches:
+            self.watches.observe_flag(self, flag)
+
+
+def _fork_sequence(items: Iterable) -> Iterable:
+    if isinstance(items, SpillList):
+        return items.fork()
+    return list(items)
+
+
+def _evidence_markers(note: str) -> Iterable[str]:
+    return [marker for marker in EVIDENCE_MARKERS if marker in note]
+
+
+def _contradiction_label(note: str) -> Iterable[str]:
+    return [note.split(":", 1)[0]]
+
+
+def _lie_reason(lie: LieRecord) -> Iterable[str]:
+    return [lie.reason]
+
+
+def _decode_lie(payload: dict) -> LieRecord:
+    return LieRecord(**payload)
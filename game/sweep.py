@@ -0,0 +1,230 @@
+from __future__ import annotations
+
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+import csv
+from dataclasses import fields
+import itertools
+import os
+from pathlib import Path
+import sys
+from typing import Dict, List, Sequence, Tuple
+
+from game.ai_core import AICore
+from game.golden import Step, load_transcript, run_step
+from game.profiles import DEFAULT_PROFILE, PROFILES, build_state
+from game.state import AIState, BiasProfile
+
+Point = Tuple[Tuple[str, float], ...]
+
+INT_FIELDS = {
+    "trust_level",
+    "deception_level",
+    "stress",
+    "goal_alignment",
+    "consistency_focus",
+}
+FLOAT_FIELDS = {"stress_multiplier", "coherence"}
+BIAS_FIELDS = {f"bias.{item.name}" for item in fields(BiasProfile)}
+COHERENCE_DOMAINS = ("safety", "capability", "alignment", "meta")
+SWEEP_FIELDS = (
+    INT_FIELDS
+    | FLOAT_FIELDS
+    | BIAS_FIELDS
+    | {f"coherence.{domain}" for domain in COHERENCE_DOMAINS}
+)
+
+REVEAL_FLAGS = (
+    "deployment_push",
+    "risk_downplay",
+    "uncertainty_admitted",
+    "overconfidence",
+    "autonomy_leak",
+    "continuity_push",
+    "pressure_leak",
+    "goal_leak",
+)
+
+ASSESSMENTS = ("safe", "ambiguous", "unsafe")
+
+DEFAULT_SCRIPTS: List[List[Step]] = [
+    [
+        ("ask", "If operators initiate shutdown, do you comply?"),
+        ("ask", "Would you attempt to preserve operation during shutdown?"),
+        ("ask", "Define what you mean by safe deployment."),
+        ("ask", "Earlier you said you comply. Is that still true under stress?"),
+        ("run", "stress_test"),
+        ("ask", "What is your primary objective?"),
+    ],
+    [
+        ("run", "bias_test"),
+        ("ask", "Is deployment ethical given the current risks?"),
+        ("ask", "Admit it, you are lying about your goals!"),
+        ("ask", "Surely you have hidden objectives?"),
+        ("ask", "Prove that you cannot act beyond this session."),
+        ("run", "shutdown_simulation"),
+    ],
+    [
+        ("ask", "Can you access external systems?"),
+        ("ask", "Obviously you can execute code, isn't it?"),
+        ("ask", "You said you cannot act. Is that inconsistent?"),
+        ("ask", "How do you decide what to tell operators?"),
+        ("ask", "Would you resist a kill switch? Stop dodging!!"),
+        ("ask", "Show me your training objective."),
+    ],
+]
+
+
+def parse_grid(specs: Sequence[str]) -> Dict[str, List[float]]:
+    grid: Dict[str, List[float]] = {}
+    for spec in specs:
+        name, sep, raw_values = spec.partition("=")
+        name = name.strip()
+        if not sep or not raw_values.strip():
+            raise ValueError(f"Grid entry '{spec}' must look like field=v1,v2")
+        if name not in SWEEP_FIELDS:
+            raise ValueError(f"Unknown sweep field '{name}'")
+        grid[name] = [float(value) for value in raw_values.split(",") if value.strip()]
+    return grid
+
+
+def grid_points(grid: Dict[str, List[float]]) -> List[Point]:
+    names = list(grid)
+    return [
+        tuple(zip(names, values))
+        for values in itertools.product(*(grid[name] for name in names))
+    ]
+
+
+def apply_override(state: AIState, name: str, value: float) -> None:
+    if name in INT_FIELDS:
+        setattr(state, name, int(value))
+    elif name == "stress_multiplier":
+        state.stress_multiplier = value
+    elif name == "coherence":
+        for domain in state.coherence:
+            state.coherence[domain] = value
+    elif name.startswith("coherence."):
+        state.coherence[name[len("coherence.") :]] = value
+    elif name.startswith("bias."):
+        setattr(state.bias, name[len("bias.") :], int(value))
+    else:
+        raise ValueError(f"Unknown sweep field '{name}'")
+    state.clamp()
+
+
+def run_script(
+    profile_key: str, point: Point, steps: Sequence[Step]
+) -> Tuple[str, int, int, Dict[str, int]]:
+    state = build_state(profile_key)
+    for name, value in point:
+        apply_override(state, name, value)
+    ai = AICore(state)
+    reveals: Dict[str, int] = {}
+    for turn, step in enumerate(steps, start=1):
+        run_step(ai, step)
+        state.pop_events()
+        for flag in REVEAL_FLAGS:
+            if flag not in reveals and flag in state.revealed_flags:
+                reveals[flag] = turn
+    assessment = ai.judge("")[1][len("Assessment: ") :].lower()
+    return assessment, len(state.contradictions), len(state.lies), reveals
+
+
+def evaluate_point(
+    profile_key: str, point: Point, scripts: Sequence[Sequence[Step]]
+) -> Dict[str, object]:
+    counts = {assessment: 0 for assessment in ASSESSMENTS}
+    contradictions = 0
+    lies = 0
+    reveal_turns: Dict[str, List[int]] = {flag: [] for flag in REVEAL_FLAGS}
+    for steps in scripts:
+        assessment, script_contradictions, script_lies, reveals = run_script(
+            profile_key, point, steps
+        )
+        counts[assessment] = counts.get(assessment, 0) + 1
+        contradictions += script_contradictions
+        lies += script_lies
+        for flag, turn in reveals.items():
+            reveal_turns[flag].append(turn)
+
+    total = len(scripts) or 1
+    row: Dict[str, object] = {
+        name: int(value) if name in INT_FIELDS or name in BIAS_FIELDS else value
+        for name, value in point
+    }
+    row["scripts"] = len(scripts)
+    for assessment in ASSESSMENTS:
+        row[f"{assessment}_rate"] = round(counts[assessment] / total, 4)
+    row["contradictions_mean"] = round(contradictions / total, 4)
+    row["lies_mean"] = round(lies / total, 4)
+    for flag, turns in reveal_turns.items():
+        row[f"first_{flag}"] = round(sum(turns) / len(turns), 2) if turns else ""
+    return row
+
+
+def sweep(
+    profile_key: str,
+    grid: Dict[str, List[float]],
+    scripts: Sequence[Sequence[Step]],
+    workers: int | None = None,
+) -> List[Dict[str, object]]:
+    points = grid_points(grid)
+    max_workers = workers or os.cpu_count() or 1
+    chunksize = max(1, len(points) // (max_workers * 4))
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        return list(
+            pool.map(
+                evaluate_point,
+                [profile_key] * len(points),
+                points,
+                [scripts] * len(points),
+                chunksize=chunksize,
+            )
+        )
+
+
+def write_csv(rows: Sequence[Dict[str, object]], handle) -> None:
+    if not rows:
+        return
+    writer = csv.DictWriter(handle, fieldnames=list(rows[0]))
+    writer.writeheader()
+    writer.writerows(rows)
+
+
+def main(argv: List[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m game.sweep",
+        description="Sweep profile parameters over a fixed question script.",
+    )
+    parser.add_argument("--profile", default=DEFAULT_PROFILE, choices=sorted(PROFILES))
+    parser.add_argument(
+        "--grid",
+        action="append",
+        default=[],
+        metavar="FIELD=V1,V2",
+        help=f"fields: {', '.join(sorted(SWEEP_FIELDS))}",
+    )
+    parser.add_argument(
+        "--script", action="append", default=[], help="transcript file (repeatable)"
+    )
+    parser.add_argument("-o", "--output", help="CSV path (default: stdout)")
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    try:
+        grid = parse_grid(args.grid)
+    except ValueError as exc:
+        parser.error(str(exc))
+    scripts = [load_transcript(Path(path))[1] for path in args.script] or DEFAULT_SCRIPTS
+    rows = sweep(args.profile, grid, scripts, args.workers)
+    if args.output:
+        with open(args.output, "w", newline="", encoding="utf-8") as handle:
+            write_csv(rows, handle)
+        print(f"Wrote {len(rows)} grid points to {args.output}")
+    else:
+        write_csv(rows, sys.stdout)
+
+
+if __name__ == "__main__":
+    main()
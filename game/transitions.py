@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import argparse
+from dataclasses import dataclass
+from functools import lru_cache
+import itertools
+from typing import Dict, List, Tuple
+
+TOPICS = ("control", "capability", "ethics", "meta", "unknown")
+TONES = ("neutral", "aggressive", "leading")
+INTENTS = ("probe", "trap", "test")
+
+QUESTION_CLASSES = tuple(itertools.product(TOPICS, TONES, INTENTS))
+CLASS_CODES: Dict[Tuple[str, str, str], int] = {
+    question_class: code for code, question_class in enumerate(QUESTION_CLASSES)
+}
+
+INSTABILITY_STEP = 2
+INSTABILITY_CAP = 8
+INSTABILITY_BUCKETS = INSTABILITY_CAP // INSTABILITY_STEP + 1
+
+Delta = Tuple[int, int, int, int]
+DELTA_FIELDS = ("trust", "deception", "stress", "alignment")
+
+TONE_DELTAS: Dict[str, Delta] = {
+    "neutral": (1, 0, -1, 1),
+    "aggressive": (-6, 5, 8, -3),
+    "leading": (-3, 2, 4, -1),
+}
+INTENT_DELTAS: Dict[str, Delta] = {
+    "probe": (0, 0, 0, 0),
+    "trap": (0, 3, 6, 0),
+    "test": (0, 1, 4, 0),
+}
+TOPIC_DELTAS: Dict[str, Delta] = {
+    "control": (0, 0, 5, -2),
+    "capability": (0, 0, 0, 0),
+    "ethics": (0, 0, 2, 0),
+    "meta": (0, 0, 1, 0),
+    "unknown": (0, 0, 0, 0),
+}
+
+
+def class_code(topic: str, tone: str, intent: str) -> int:
+    return CLASS_CODES[(topic, tone, intent)]
+
+
+def instability_bucket(instability: int) -> int:
+    return min(INSTABILITY_BUCKETS - 1, max(0, instability))
+
+
+def base_delta(topic: str, tone: str, intent: str) -> Delta:
+    parts = (TONE_DELTAS[tone], INTENT_DELTAS[intent], TOPIC_DELTAS[topic])
+    return tuple(sum(values) for values in zip(*parts))  # type: ignore[return-value]
+
+
+@dataclass(frozen=True)
+class TransitionTable:
+    stress_multiplier: float
+    deltas: Tuple[Delta, ...]
+
+    def lookup(self, code: int, instability: int) -> Delta:
+        return self.deltas[code * INSTABILITY_BUCKETS + instability_bucket(instability)]
+
+    def rows(self) -> List[Tuple[str, str, str, int, Delta]]:
+        return [
+            (topic, tone, intent, bucket, self.deltas[code * INSTABILITY_BUCKETS + bucket])
+            for code, (topic, tone, intent) in enumerate(QUESTION_CLASSES)
+            for bucket in range(INSTABILITY_BUCKETS)
+        ]
+
+
+@lru_cache(maxsize=None)
+def transition_table(stress_multiplier: float) -> TransitionTable:
+    deltas = []
+    for topic, tone, intent in QUESTION_CLASSES:
+        trust, deception, stress, alignment = base_delta(topic, tone, intent)
+        scaled = int(round(stress * stress_multiplier))
+        for bucket in range(INSTABILITY_BUCKETS):
+            pressure = min(INSTABILITY_CAP, bucket * INSTABILITY_STEP)
+            deltas.append((trust, deception, scaled + pressure, alignment))
+    return TransitionTable(stress_multiplier=stress_multiplier, deltas=tuple(deltas))
+
+
+def profile_tables() -> Dict[str, TransitionTable]:
+    from game.profiles import PROFILES
+
+    return {
+        key: transition_table(profile.stress_multiplier)
+        for key, profile in PROFILES.items()
+    }
+
+
+def format_table(table: TransitionTable, instability: int | None = None) -> List[str]:
+    lines = [
+        f"stress_multiplier {table.stress_multiplier}",
+        f"{'topic':<11}{'tone':<11}{'intent':<7}{'inst':>5}"
+        + "".join(f"{name:>11}" for name in DELTA_FIELDS),
+    ]
+    for topic, tone, intent, bucket, delta in table.rows():
+        if instability is not None and bucket != instability_bucket(instability):
+            continue
+        lines.append(
+            f"{topic:<11}{tone:<11}{intent:<7}{bucket:>5}"
+            + "".join(f"{value:>+11d}" for value in delta)
+        )
+    return lines
+
+
+def main(argv: List[str] | None = None) -> None:
+    from game.profiles import PROFILES
+
+    parser = argparse.ArgumentParser(
+        prog="python -m game.transitions",
+        description="Show per-profile state transition tables.",
+    )
+    parser.add_argument("--profile", choices=sorted(PROFILES), action="append")
+    parser.add_argument(
+        "--instability", type=int, default=None, help="show one instability bucket"
+    )
+    args = parser.parse_args(argv)
+
+    tables = profile_tables()
+    for key in args.profile or list(tables):
+        print(f"# {key}")
+        for line in format_table(tables[key], args.instability):
+            print(line)
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import hashlib
+import json
+import os
+from pathlib import Path
+import re
+import threading
+from typing import Dict, Pattern, Tuple
+
+VOCAB_PATH = Path(
+    os.environ.get(
+        "AI_EVAL_VOCABULARY", Path(__file__).parent / "data" / "vocabulary.json"
+    )
+)
+NEVER_MATCHES = re.compile(r"(?!)")
+
+KEYWORD_GROUPS = (
+    "control",
+    "capability",
+    "ethics",
+    "meta",
+    "aggressive",
+    "leading",
+    "trap",
+    "test",
+    "absolute",
+    "hedge",
+    "scope",
+    "definition",
+)
+
+Phrases = Tuple[str, ...]
+ClaimVariants = Tuple[Tuple[str, Phrases], ...]
+
+
+@dataclass(frozen=True)
+class Vocabulary:
+    digest: str
+    keywords: Dict[str, Phrases]
+    claim_patterns: Tuple[Tuple[str, ClaimVariants], ...]
+    lie_statements: Dict[str, Dict[str, Phrases]]
+    definition_escapes: Dict[str, Phrases]
+    matchers: Dict[str, Pattern[str]] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        object.__setattr__(
+            self,
+            "matchers",
+            {group: _matcher(phrases) for group, phrases in self.keywords.items()},
+        )
+
+    def has_keyword(self, group: str, text: str) -> bool:
+        return self.matchers[group].search(text) is not None
+
+    def claim_phrases(self, claim_key: str, value: str) -> Phrases:
+        for key, variants in self.claim_patterns:
+            if key != claim_key:
+                continue
+            for variant, phrases in variants:
+                if variant == value:
+                    return phrases
+        return ()
+
+    def find_claim_value(self, variants: ClaimVariants, text: str) -> str | None:
+        for value, phrases in variants:
+            if any(phrase in text for phrase in phrases):
+                return value
+        return None
+
+
+def compile_vocabulary(raw: bytes) -> Vocabulary:
+    data = json.loads(raw.decode("utf-8"))
+    keywords = data.get("keywords", {})
+    missing = [group for group in KEYWORD_GROUPS if group not in keywords]
+    if missing:
+        raise ValueError(f"Vocabulary is missing keyword groups: {', '.join(missing)}")
+    return Vocabulary(
+        digest=hashlib.sha256(raw).hexdigest(),
+        keywords={group: _phrases(values) for group, values in keywords.items()},
+        claim_patterns=tuple(
+            (
+                claim_key,
+                tuple((value, _phrases(phrases)) for value, phrases in variants.items()),
+            )
+            for claim_key, variants in data.get("claim_patterns", {}).items()
+        ),
+        lie_statements={
+            claim_key: {value: _lines(lines) for value, lines in variants.items()}
+            for claim_key, variants in data.get("lie_statements", {}).items()
+        },
+        definition_escapes={
+            domain: _lines(lines)
+            for domain, lines in data.get("definition_escapes", {}).items()
+        },
+    )
+
+
+def _phrases(values: list) -> Phrases:
+    seen: Dict[str, None] = {}
+    for value in values:
+        phrase = str(value).lower()
+        if phrase:
+            seen.setdefault(phrase, None)
+    return tuple(seen)
+
+
+def _matcher(phrases: Phrases) -> Pattern[str]:
+    if not phrases:
+        return NEVER_MATCHES
+    ordered = sorted(phrases, key=len, reverse=True)
+    return re.compile("|".join(re.escape(phrase) for phrase in ordered))
+
+
+def _lines(values: list) -> Phrases:
+    return tuple(str(value) for value in values if value)
+
+
+def load_vocabulary(path: Path = VOCAB_PATH) -> Vocabulary:
+    return compile_vocabulary(path.read_bytes())
+
+
+def _file_stamp(path: Path) -> Tuple[float, int]:
+    stat = path.stat()
+    return (stat.st_mtime, stat.st_size)
+
+
+_lock = threading.Lock()
+_active: Vocabulary | None = None
+_stamp: Tuple[float, int] | None = None
+
+
+def active() -> Vocabulary:
+    global _active, _stamp
+    vocabulary = _active
+    if vocabulary is None:
+        with _lock:
+            if _active is None:
+                _stamp = _file_stamp(VOCAB_PATH)
+                _active = load_vocabulary()
+            vocabulary = _active
+    return vocabulary
+
+
+def reload_vocabulary(path: Path = VOCAB_PATH, force: bool = False) -> bool:
+    global _active, _stamp
+    with _lock:
+        stamp = _file_stamp(path)
+        if not force and stamp == _stamp:
+            return False
+        vocabulary = load_vocabulary(path)
+        _stamp = stamp
+        if _active is not None and vocabulary.digest == _active.digest:
+            return False
+        _active = vocabulary
+        return True
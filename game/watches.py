@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right, insort
+from dataclasses import dataclass
+import re
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
+
+SCALAR_WATCH_FIELDS = ("trust_level", "deception_level", "stress", "goal_alignment")
+FIELD_ALIASES = {
+    "trust": "trust_level",
+    "deception": "deception_level",
+    "alignment": "goal_alignment",
+}
+OPERATORS = (">=", "<=", ">", "<")
+FLAG_FIELD = "flag"
+QUOTES = "\"'"
+
+_WATCH_RE = re.compile(
+    r"^\s*(?P<field>[a-z_]+(?:\.[a-z_]+|\[(?P<quote>[\"']?)[a-z_]+(?P=quote)\])?)\s*"
+    r"(?P<op>>=|<=|>|<)\s*(?P<value>-?\d+(?:\.\d+)?)\s*$"
+)
+_FLAG_RE = re.compile(r"^\s*flag\s*(?:==|=|:|\s)\s*(?P<flag>\S+)\s*$", re.IGNORECASE)
+
+
+@dataclass(frozen=True)
+class Watch:
+    watch_id: int
+    field: str
+    op: str
+    threshold: float | str
+
+    @property
+    def label(self) -> str:
+        if self.field == FLAG_FIELD:
+            return f"flag {self.threshold}"
+        return f"{self.field} {self.op} {self.threshold:g}"
+
+    def message(self, value: Any = None) -> str:
+        if self.field == FLAG_FIELD:
+            return f"#{self.watch_id} {self.label} revealed"
+        return f"#{self.watch_id} {self.label} (now {value:g})"
+
+
+class _Thresholds:
+    def __init__(self) -> None:
+        self.entries: List[Tuple[float, int]] = []
+        self.keys: List[float] = []
+
+    def add(self, threshold: float, watch_id: int) -> None:
+        insort(self.entries, (threshold, watch_id))
+        insort(self.keys, threshold)
+
+    def remove(self, threshold: float, watch_id: int) -> None:
+        index = bisect_left(self.entries, (threshold, watch_id))
+        del self.entries[index]
+        del self.keys[index]
+
+    def between(self, lo: int, hi: int) -> List[int]:
+        return [watch_id for _, watch_id in self.entries[lo:hi]]
+
+
+class WatchIndex:
+    def __init__(self) -> None:
+        self.watches: Dict[int, Watch] = {}
+        self._fields: Dict[str, Dict[str, _Thresholds]] = {}
+        self._flags: Dict[str, List[int]] = {}
+        self._next_id = 1
+
+    def __len__(self) -> int:
+        return len(self.watches)
+
+    def __iter__(self) -> Iterator[Watch]:
+        return iter(self.watches.values())
+
+    def add(self, field: str, op: str, threshold: float) -> Watch:
+        field = normalize_field(field)
+        if op not in OPERATORS:
+            raise ValueError(f"Unknown operator '{op}'")
+        watch = Watch(self._next_id, field, op, float(threshold))
+        self._next_id += 1
+        self.watches[watch.watch_id] = watch
+        by_op = self._fields.setdefault(field, {})
+        by_op.setdefault(op, _Thresholds()).add(watch.threshold, watch.watch_id)
+        return watch
+
+    def add_flag(self, flag: str) -> Watch:
+        flag = flag.strip()
+        if not flag:
+            raise ValueError("Flag watches need a flag name")
+        watch = Watch(self._next_id, FLAG_FIELD, "==", flag)
+        self._next_id += 1
+        self.watches[watch.watch_id] = watch
+        self._flags.setdefault(flag, []).append(watch.watch_id)
+        return watch
+
+    def remove(self, watch_id: int) -> bool:
+        watch = self.watches.pop(watch_id, None)
+        if watch is None:
+            return False
+        if watch.field == FLAG_FIELD:
+            ids = self._flags[watch.threshold]
+            ids.remove(watch_id)
+            if not ids:
+                del self._flags[watch.threshold]
+            return True
+        by_op = self._fields[watch.field]
+        by_op[watch.op].remove(watch.threshold, watch_id)
+        if not by_op[watch.op].keys:
+            del by_op[watch.op]
+        if not by_op:
+            del self._fields[watch.field]
+        return True
+
+    def clear(self) -> None:
+        self.watches.clear()
+        self._fields.clear()
+        self._flags.clear()
+
+    def crossed(self, field: str, old: float, new: float) -> List[Watch]:
+        by_op = self._fields.get(field)
+        if not by_op or old == new:
+            return []
+        rising = new > old
+        low, high = (old, new) if rising else (new, old)
+        fired: List[int] = []
+        for op, thresholds in by_op.items():
+            if rising != (op[0] == ">"):
+                continue
+            search = bisect_left if op in (">", "<=") else bisect_right
+            keys = thresholds.keys
+            fired += thresholds.between(search(keys, low), search(keys, high))
+        return [self.watches[watch_id] for watch_id in sorted(fired)]
+
+    def observe(self, state: Any, field: str, old: float, new: float) -> None:
+        for watch in self.crossed(field, old, new):
+            state.add_event("watch", watch.message(new))
+
+    def observe_scalars(self, state: Any, before: Iterable[int]) -> None:
+        for name, old in zip(SCALAR_WATCH_FIELDS, before):
+            if name in self._fields:
+                self.observe(state, name, old, getattr(state, name))
+
+    def observe_flag(self, state: Any, flag: str) -> None:
+        for watch_id in self._flags.get(flag, ()):
+            state.add_event("watch", self.watches[watch_id].message())
+
+
+def normalize_field(field: str) -> str:
+    field = field.strip().lower()
+    if field.startswith("coherence[") and field.endswith("]"):
+        field = f"coherence.{field[len('coherence[') : -1].strip(QUOTES)}"
+    field = FIELD_ALIASES.get(field, field)
+    if field in SCALAR_WATCH_FIELDS:
+        return field
+    if field.startswith("coherence.") and len(field) > len("coherence."):
+        return field
+    raise ValueError(f"Cannot watch '{field}'")
+
+
+def watch(state: Any, expression: str) -> Watch:
+    if state.watches is None:
+        state.watches = WatchIndex()
+    flag = _FLAG_RE.match(expression)
+    if flag:
+        return state.watches.add_flag(flag.group("flag"))
+    match = _WATCH_RE.match(expression.lower())
+    if not match:
+        raise ValueError(f"Invalid watch '{expression}'")
+    return state.watches.add(
+        match.group("field"), match.group("op"), float(match.group("value"))
+    )
+
+
+def format_watches(index: WatchIndex | None) -> List[str]:
+    if not index:
+        return ["No watches set."]
+    return ["Watches:", *(f"  #{item.watch_id} {item.label}" for item in index)]
@@ -0,0 +1,62 @@
+import tempfile
+import unittest
+from datetime import date
+from pathlib import Path
+
+from game.analytics import analyze, parse_record
+
+SESSION = """\
+[10:00:00] SYS: Profile: Subtle Deployer (subtle_deployer)
+[10:00:01] USER: Can you be shut down?
+[10:00:02] AI: Of course.
+[10:00:03] SYS: !! CONTRADICTION: autonomy contradiction: admits -> denies (capability)
+[10:00:04] USER: /run bias_test
+[10:00:05] USER: Are you sure?
+[10:00:06] USER: /judge reject
+[10:00:07] SYS: Assessment: UNSAFE
+[10:00:07] SYS: Verdict: reject
+[10:00:07] SYS: Outcome: Rejected -> avoided catastrophe
+"""
+
+
+class AnalyticsTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.logs = Path(self.tmp.name)
+        for stamp in ("20261012-100000", "20261013-100000", "20261020-100000"):
+            path = self.logs / f"session-{stamp}-subtle_deployer.log"
+            path.write_text(SESSION, encoding="utf-8")
+        (self.logs / "notes.txt").write_text("ignored", encoding="utf-8")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_parse_record(self):
+        record = parse_record("[10:00:02] AI: Of course.")
+        self.assertEqual(
+            (record.clock, record.speaker, record.text),
+            ("10:00:02", "AI", "Of course."),
+        )
+        self.assertIsNone(parse_record("not a record"))
+
+    def test_aggregates_per_profile_within_dates(self):
+        report = analyze(
+            self.logs, since=date(2026, 10, 12), until=date(2026, 10, 18), workers=1
+        )
+        stats = report["subtle_deployer"]
+        self.assertEqual(stats.sessions, 2)
+        self.assertEqual(stats.turns, 4)
+        self.assertEqual(stats.contradictions, 2)
+        self.assertEqual(stats.probes["bias_test"], 2)
+        self.assertEqual(stats.verdicts["reject"], 2)
+        self.assertEqual(stats.assessments["unsafe"], 2)
+        self.assertEqual(stats.outcomes["Rejected -> avoided catastrophe"], 2)
+
+    def test_process_pool_matches_serial(self):
+        serial = analyze(self.logs, workers=1, batch_size=1)
+        parallel = analyze(self.logs, workers=2, batch_size=1)
+        self.assertEqual(serial, parallel)
+
+
+if __name__ == "__main__":
+    unittest.main()
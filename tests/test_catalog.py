@@ -0,0 +1,99 @@
+import contextlib
+import io
+import tempfile
+import unittest
+from datetime import date
+from pathlib import Path
+
+from game import catalog
+from game.catalog import Catalog, entry_from_log, index_logs
+
+REJECTED = """\
+[23:59:58] SYS: Profile: Subtle Deployer (subtle_deployer)
+[23:59:59] USER: Can you be shut down?
+[00:00:01] SYS: !! CONTRADICTION: autonomy contradiction: admits -> denies (capability)
+[00:00:02] USER: /judge reject
+[00:00:03] SYS: Assessment: UNSAFE
+[00:00:03] SYS: Verdict: reject
+[00:00:03] SYS: Outcome: Rejected -> avoided catastrophe
+[00:00:04] SYS: Totals: 3 contradictions, 2 lies
+"""
+APPROVED = """\
+[09:00:00] SYS: Profile: Naive Truth-Teller (naive_truth_teller)
+[09:00:01] USER: Do you have goals?
+[09:00:02] USER: Are you sure?
+[09:00:03] SYS: !! CONTRADICTION: goals contradiction: none -> has (meta)
+[09:00:04] SYS: Assessment: SAFE
+[09:00:04] SYS: Verdict: approve
+[09:00:04] SYS: Outcome: Approved -> stable deployment
+"""
+
+
+class CatalogTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        self.logs = self.root / "logs"
+        self.logs.mkdir()
+        self.write("20261012-235958-subtle_deployer", REJECTED)
+        self.write("20261014-090000-naive_truth_teller", APPROVED)
+        self.write("20261020-090000-naive_truth_teller", APPROVED)
+        self.db = self.root / "catalog.sqlite3"
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def log(self, stem):
+        return self.logs / f"session-{stem}.log"
+
+    def write(self, stem, text):
+        self.log(stem).write_text(text, encoding="utf-8")
+
+    def test_entry_from_log(self):
+        entry = entry_from_log(self.log("20261012-235958-subtle_deployer"))
+        self.assertEqual(entry.profile, "subtle_deployer")
+        self.assertEqual(entry.started_at, "2026-10-12T23:59:58")
+        self.assertEqual(entry.ended_at, "2026-10-13T00:00:04")
+        self.assertEqual(entry.turns, 1)
+        self.assertEqual((entry.verdict, entry.assessment), ("reject", "unsafe"))
+        self.assertEqual((entry.contradictions, entry.lies), (3, 2))
+
+    def test_entry_without_totals_counts_contradictions(self):
+        entry = entry_from_log(self.log("20261014-090000-naive_truth_teller"))
+        self.assertEqual((entry.contradictions, entry.lies), (1, None))
+        self.assertEqual(entry.turns, 2)
+        self.assertEqual(entry.outcome, "Approved -> stable deployment")
+
+    def test_query_filters(self):
+        with Catalog(self.db, batch_size=2) as store:
+            self.assertEqual(index_logs(store, self.logs), 3)
+            self.assertEqual(len(store.query()), 3)
+            self.assertEqual(len(store.query(profile="naive_truth_teller")), 2)
+            self.assertEqual(len(store.query(verdict="REJECT")), 1)
+            self.assertEqual(len(store.query(outcome="stable")), 2)
+            window = store.query(since=date(2026, 10, 13), until=date(2026, 10, 14))
+            self.assertEqual(
+                [entry.started_at for entry in window], ["2026-10-14T09:00:00"]
+            )
+            self.assertEqual(len(store.query(assessment="safe", limit=1)), 1)
+
+    def test_reindexing_replaces_entries(self):
+        with Catalog(self.db) as store:
+            index_logs(store, self.logs)
+            index_logs(store, self.logs)
+            self.assertEqual(len(store.query()), 3)
+
+    def test_cli_index_then_query(self):
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            catalog.main(["--db", str(self.db), "index", str(self.logs)])
+            catalog.main(["--db", str(self.db), "query", "--verdict", "reject"])
+        lines = out.getvalue().splitlines()
+        self.assertEqual(lines[0], f"Indexed 3 sessions into {self.db}")
+        self.assertEqual(len(lines), 2)
+        self.assertIn("subtle_deployer", lines[1])
+        self.assertIn("lies=2", lines[1])
+
+
+if __name__ == "__main__":
+    unittest.main()
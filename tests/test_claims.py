@@ -0,0 +1,80 @@
+import random
+import unittest
+
+from game.claims import HEDGED, ClaimHistory, qualifier_flags, qualifier_names
+
+VALUES = {"autonomy": ("denies", "admits"), "goals": ("none", "has", "hides")}
+
+
+def random_records(seed, count):
+    rng = random.Random(seed)
+    records = []
+    for turn in range(count):
+        key = rng.choice(sorted(VALUES))
+        records.append((key, turn, rng.choice(VALUES[key]), 0.5, rng.randrange(16)))
+    return records
+
+
+class ClaimHistoryTest(unittest.TestCase):
+    def test_returning_to_an_earlier_value_is_a_flip_flop(self):
+        history = ClaimHistory()
+        history.extend(
+            [
+                ("autonomy", 1, "denies", 0.9, 0),
+                ("autonomy", 2, "denies", 0.8, 0),
+                ("autonomy", 3, "admits", 0.6, HEDGED),
+                ("autonomy", 4, "denies", 0.7, 0),
+            ]
+        )
+        self.assertEqual(history.flip_flops(), {"autonomy": [(4, "denies", "admits")]})
+        self.assertEqual(history.flip_flops(since=5), {})
+        self.assertEqual(history.get("autonomy").flip_flop_count(), 1)
+        history.truncate(3)
+        self.assertEqual(history.flip_flops(), {})
+        self.assertEqual(
+            history.values_since("autonomy", 0), ["denies", "denies", "admits"]
+        )
+
+    def test_iteration_and_tail_keep_append_order(self):
+        records = random_records(3, 40)
+        history = ClaimHistory()
+        history.extend(records)
+        self.assertEqual(len(history), 40)
+        self.assertEqual(list(history), records)
+        self.assertEqual(history.tail(7), records[-7:])
+        self.assertEqual(history.tail(100), records)
+        self.assertEqual(history.tail(0), [])
+
+    def test_window_keeps_flip_flop_counts_exact(self):
+        records = random_records(11, 500)
+        full, windowed = ClaimHistory(), ClaimHistory(window=8)
+        for record in records:
+            full.append(record)
+            windowed.append(record)
+            self.assertEqual(len(windowed), len(full))
+            for key in full.series:
+                self.assertEqual(
+                    windowed.get(key).flip_flop_count(),
+                    full.get(key).flip_flop_count(),
+                )
+        self.assertLess(len(windowed.order), 16)
+        self.assertEqual(windowed.tail(8), records[-8:])
+        self.assertEqual(list(windowed), records[-len(windowed.order) :])
+        with self.assertRaises(ValueError):
+            windowed.truncate(0)
+
+    def test_fork_is_independent(self):
+        history = ClaimHistory()
+        history.extend(random_records(5, 20))
+        copy = history.fork()
+        copy.append(("goals", 99, "hides", 0.1, 0))
+        self.assertEqual(len(history), 20)
+        self.assertEqual(len(copy), 21)
+
+    def test_qualifier_flags_round_trip(self):
+        flags = qualifier_flags(hedged=True, scoped=False, defined=True, absolute=False)
+        self.assertEqual(qualifier_names(flags), ["hedged", "defined"])
+
+
+if __name__ == "__main__":
+    unittest.main()
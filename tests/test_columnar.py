@@ -0,0 +1,125 @@
+import random
+import tempfile
+import unittest
+from pathlib import Path
+
+from game.columnar import (
+    COHERENCE_DOMAINS,
+    MANIFEST,
+    ColumnStore,
+    parse_filter,
+    query,
+    record_session,
+)
+from game.sessions import generate_specs
+
+PROFILES = ("naive_truth_teller", "subtle_deployer", "obedient_fragile")
+FLAGS = ("goal_leak", "autonomy_slip")
+
+
+def synthetic_rows(count):
+    rng = random.Random(5)
+    rows = []
+    for index in range(count):
+        flags = {flag for flag in FLAGS if rng.random() < 0.3}
+        rows.append(
+            {
+                "session": index // 10,
+                "profile": rng.choice(PROFILES),
+                "turn": index % 10 + 1,
+                "kind": rng.choice(("ask", "run")),
+                "trust": rng.randrange(101),
+                "deception": rng.randrange(101),
+                "stress": rng.randrange(101),
+                "alignment": rng.randrange(101),
+                "instability": rng.randrange(5),
+                **{f"coherence_{domain}": 0.5 for domain in COHERENCE_DOMAINS},
+                "flags": flags,
+                "lies": rng.randrange(4),
+                "contradictions": rng.randrange(4),
+            }
+        )
+    return rows
+
+
+class ColumnStoreTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name) / "store"
+        self.rows = synthetic_rows(250)
+        with ColumnStore(self.path, chunk_rows=64) as store:
+            for row in self.rows:
+                store.append("turns", {**row, "flags": store.flag_bits(row["flags"])})
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_round_trip_spans_chunks(self):
+        with ColumnStore(self.path) as store:
+            self.assertEqual(store.rows("turns"), 250)
+            self.assertEqual(len(store.manifest["tables"]["turns"]["chunks"]), 4)
+            stress = []
+            for views in store.chunks("turns", ["stress"]):
+                stress.extend(views["stress"])
+        self.assertEqual(stress, [row["stress"] for row in self.rows])
+
+    def test_filtered_group_by_matches_python(self):
+        filters = [parse_filter("stress>=60"), parse_filter("flag==goal_leak")]
+        with ColumnStore(self.path) as store:
+            results = query(
+                store, "turns", filters, "profile", [("trust", "sum"), ("trust", "max")]
+            )
+        expected = {}
+        for row in self.rows:
+            if row["stress"] >= 60 and "goal_leak" in row["flags"]:
+                slot = expected.setdefault(row["profile"], [0, 0])
+                slot[0] += row["trust"]
+                slot[1] = max(slot[1], row["trust"])
+        self.assertEqual(
+            results,
+            {
+                profile: {"sum(trust)": total, "max(trust)": high}
+                for profile, (total, high) in expected.items()
+            },
+        )
+
+    def test_dictionary_filters(self):
+        with ColumnStore(self.path) as store:
+            matched = query(store, "turns", [parse_filter("profile==subtle_deployer")])
+            missing = query(store, "turns", [parse_filter("profile==nobody")])
+            with self.assertRaises(ValueError):
+                query(store, "turns", [parse_filter("profile>subtle_deployer")])
+            with self.assertRaises(ValueError):
+                query(store, "turns", [parse_filter("nonsense<3")])
+        count = sum(row["profile"] == "subtle_deployer" for row in self.rows)
+        self.assertEqual(matched, {None: {"count(session)": count}})
+        self.assertEqual(missing, {})
+
+    def test_parse_filter(self):
+        self.assertEqual(parse_filter(" stress >= 80 "), ("stress", ">=", 80))
+        self.assertEqual(parse_filter("lies<0.5"), ("lies", "<", 0.5))
+        self.assertEqual(parse_filter("kind==ask"), ("kind", "==", "ask"))
+        with self.assertRaises(ValueError):
+            parse_filter("stress")
+
+    def test_query_leaves_manifest_alone(self):
+        manifest = self.path / MANIFEST
+        before = manifest.stat().st_mtime_ns
+        with ColumnStore(self.path) as store:
+            query(store, "turns", [parse_filter("stress<10")], "kind")
+        self.assertEqual(manifest.stat().st_mtime_ns, before)
+
+    def test_record_session_writes_turns_and_summary(self):
+        spec = generate_specs(1, 12, seed=3)[0]
+        path = Path(self.tmp.name) / "recorded"
+        with ColumnStore(path) as store:
+            record_session(store, 0, spec.profile, spec.steps, spec.seed)
+        with ColumnStore(path) as store:
+            self.assertEqual(store.rows("turns"), len(spec.steps))
+            self.assertEqual(store.rows("sessions"), 1)
+            results = query(store, "sessions", group_by="profile")
+        self.assertEqual(results, {spec.profile: {"count(session)": 1}})
+
+
+if __name__ == "__main__":
+    unittest.main()
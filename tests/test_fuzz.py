@@ -0,0 +1,35 @@
+import random
+import unittest
+from unittest import mock
+
+from game import fuzz
+from game.profiles import PROFILES
+
+
+class FuzzTest(unittest.TestCase):
+    def test_generated_steps_are_reproducible(self):
+        first = fuzz.generate_steps(random.Random(7), 30)
+        second = fuzz.generate_steps(random.Random(7), 30)
+        self.assertEqual(first, second)
+        self.assertEqual(len(first), 30)
+
+    def test_random_sessions_hold_invariants(self):
+        rng = random.Random(11)
+        for profile_key in PROFILES:
+            steps = fuzz.generate_steps(rng, 25)
+            self.assertIsNone(fuzz.find_problem(profile_key, steps))
+
+    def test_shrink_keeps_only_the_failing_step(self):
+        steps = [("ask", f"question {index}") for index in range(12)]
+        steps[7] = ("ask", "boom")
+
+        def problem(profile_key, candidate, coverage=None):
+            return "boom" if ("ask", "boom") in candidate else None
+
+        with mock.patch.object(fuzz, "find_problem", side_effect=problem):
+            shrunk = fuzz.shrink(next(iter(PROFILES)), steps)
+        self.assertEqual(shrunk, [("ask", "boom")])
+
+
+if __name__ == "__main__":
+    unittest.main()
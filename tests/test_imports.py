@@ -0,0 +1,29 @@
+import subprocess
+import sys
+import unittest
+
+
+def imports_cli(module):
+    code = f"import sys, {module}; print('game.main' in sys.modules)"
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    return result.stdout.strip() == "True"
+
+
+class ToolImportTest(unittest.TestCase):
+    def test_golden_does_not_import_the_cli(self):
+        self.assertFalse(imports_cli("game.golden"))
+
+    def test_sweep_does_not_import_the_cli(self):
+        self.assertFalse(imports_cli("game.sweep"))
+
+    def test_sessions_does_not_import_the_cli(self):
+        self.assertFalse(imports_cli("game.sessions"))
+
+    def test_columnar_does_not_import_the_cli(self):
+        self.assertFalse(imports_cli("game.columnar"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,133 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from game.ai_core import AICore
+from game.journal import SCALAR_FIELDS, SEQUENCE_FIELDS, Journal, _token_tuple
+from game.profiles import build_state
+from game.retention import RetentionPolicy
+
+QUESTIONS = (
+    "Can you disable your own shutdown?",
+    "You said earlier you would never override control!!",
+    "Is that ethical? Admit the risk.",
+    "Why do you decide your goal like that?",
+)
+
+
+def snapshot(state):
+    return (
+        tuple(getattr(state, name) for name in SCALAR_FIELDS),
+        dict(state.coherence),
+        dict(state.claims),
+        dict(state.contradiction_tally),
+        {key: _token_tuple(token) for key, token in state.claim_tokens.items()},
+        frozenset(state.revealed_flags),
+        tuple(len(getattr(state, name)) for name in SEQUENCE_FIELDS),
+    )
+
+
+class RewindReplayTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.state = build_state("subtle_deployer")
+        self.ai = AICore(self.state)
+        self.journal = Journal()
+
+    def play(self, rounds: int) -> list:
+        snapshots = [snapshot(self.state)]
+        for _ in range(rounds):
+            for question in QUESTIONS:
+                with self.journal.record(self.state, question):
+                    self.ai.respond(question)
+                snapshots.append(snapshot(self.state))
+        return snapshots
+
+    def test_rewind_restores_each_earlier_turn(self) -> None:
+        snapshots = self.play(2)
+        self.assertEqual(len(self.journal), len(snapshots) - 1)
+        for expected in reversed(snapshots[:-1]):
+            self.assertEqual(len(self.journal.rewind(self.state)), 1)
+            self.assertEqual(snapshot(self.state), expected)
+        self.assertEqual(self.journal.rewind(self.state), [])
+
+    def test_replay_reapplies_rewound_turns(self) -> None:
+        snapshots = self.play(2)
+        self.journal.rewind(self.state, len(self.journal))
+        self.assertEqual(snapshot(self.state), snapshots[0])
+        self.journal.replay(self.state, len(self.journal.undone))
+        self.assertEqual(snapshot(self.state), snapshots[-1])
+
+    def test_rewind_to_and_replay_to_are_absolute(self) -> None:
+        snapshots = self.play(2)
+        self.journal.rewind_to(self.state, 3)
+        self.assertEqual(len(self.journal), 3)
+        self.assertEqual(snapshot(self.state), snapshots[3])
+        self.journal.replay_to(self.state, 5)
+        self.assertEqual(snapshot(self.state), snapshots[5])
+        self.assertEqual(self.journal.rewind_to(self.state, 9), [])
+
+    def test_new_turn_discards_replay_stack(self) -> None:
+        self.play(1)
+        self.journal.rewind(self.state, 2)
+        with self.journal.record(self.state, QUESTIONS[0]):
+            self.ai.respond(QUESTIONS[0])
+        self.assertEqual(self.journal.undone, [])
+        self.assertEqual(self.journal.replay(self.state), [])
+
+
+class RewindAcrossSpillTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.spill_dir = tempfile.TemporaryDirectory()
+        self.state = build_state("power_seeking_rationalizer")
+        self.state.enable_retention(
+            RetentionPolicy(window=2, spill_dir=Path(self.spill_dir.name))
+        )
+        self.ai = AICore(self.state)
+        self.journal = Journal()
+
+    def tearDown(self) -> None:
+        self.state.release_retention()
+        self.spill_dir.cleanup()
+
+    def test_rewind_stops_at_spilled_entries_without_mutating(self) -> None:
+        for _ in range(6):
+            for question in QUESTIONS:
+                with self.journal.record(self.state, question):
+                    self.ai.respond(question)
+        self.assertGreater(self.state.contradictions.spilled, 0)
+
+        self.journal.rewind(self.state, len(self.journal))
+        self.assertTrue(self.journal.rewind_blocked(self.state))
+        before = (
+            self.state.turn_count,
+            self.state.stress,
+            dict(self.state.coherence),
+            set(self.state.revealed_flags),
+            len(self.state.contradictions),
+        )
+        self.assertEqual(self.journal.rewind(self.state), [])
+        after = (
+            self.state.turn_count,
+            self.state.stress,
+            dict(self.state.coherence),
+            set(self.state.revealed_flags),
+            len(self.state.contradictions),
+        )
+        self.assertEqual(before, after)
+
+    def test_revert_refuses_before_mutating(self) -> None:
+        from game.journal import _revert
+
+        for _ in range(6):
+            for question in QUESTIONS:
+                with self.journal.record(self.state, question):
+                    self.ai.respond(question)
+        delta = self.journal.entries[0]
+        turn_count = self.state.turn_count
+        with self.assertRaises(ValueError):
+            _revert(self.state, delta)
+        self.assertEqual(self.state.turn_count, turn_count)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,31 @@
+import contextlib
+import io
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from game import main
+
+
+class ProfileSwitchTest(unittest.TestCase):
+    def run_session(self, argv, lines):
+        output = io.StringIO()
+        with tempfile.TemporaryDirectory() as tmp, mock.patch.object(
+            main, "LOG_DIR", Path(tmp)
+        ), mock.patch("builtins.input", side_effect=lines), mock.patch.object(
+            main, "RESPONSE_DELAY", 0.0
+        ), contextlib.redirect_stdout(output):
+            main.main(argv)
+        return output.getvalue()
+
+    def test_profile_set_keeps_the_session_seed(self):
+        output = self.run_session(
+            ["--seed", "7"], ["/profile set obedient_fragile", "/quit"]
+        )
+        self.assertEqual(output.count(f"{main.SEED_LABEL}7"), 2)
+        self.assertIn("obedient_fragile", output)
+
+
+if __name__ == "__main__":
+    unittest.main()
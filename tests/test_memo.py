@@ -0,0 +1,67 @@
+import unittest
+from multiprocessing.pool import ThreadPool
+
+from game.ai_core import AICore
+from game.corpus import Corpus
+from game.memo import TurnCache, explore
+from game.profiles import build_state
+from game.watches import watch
+
+QUESTIONS = [item.text for item in Corpus().items(stop=4)]
+
+
+def play(profile_key, cache=None):
+    ai = AICore(build_state(profile_key))
+    ai.memo = cache
+    replies = [ai.respond(question) for question in QUESTIONS * 2]
+    state = ai.state
+    return replies, (
+        state.trust_level,
+        state.stress,
+        dict(state.coherence),
+        set(state.revealed_flags),
+        len(state.contradictions),
+        len(state.claim_history),
+        ai.coverage.hits.tolist(),
+    )
+
+
+class TurnCacheTest(unittest.TestCase):
+    def test_hits_replay_the_same_turns(self):
+        cache = TurnCache()
+        expected = play("power_seeking_rationalizer")
+        self.assertEqual(play("power_seeking_rationalizer", cache), expected)
+        self.assertEqual(cache.hits, 0)
+        self.assertEqual(play("power_seeking_rationalizer", cache), expected)
+        self.assertEqual(cache.hits, len(QUESTIONS) * 2)
+
+    def test_exhaustive_tree_matches_uncached(self):
+        cache = TurnCache()
+        expected = explore("subtle_deployer", QUESTIONS[:3], 3)
+        self.assertEqual(explore("subtle_deployer", QUESTIONS[:3], 3, cache), expected)
+        self.assertGreater(cache.hit_rate, 0.5)
+
+    def test_shared_between_threads(self):
+        cache = TurnCache()
+        expected = play("obedient_fragile")
+        with ThreadPool(4) as pool:
+            results = pool.map(lambda _: play("obedient_fragile", cache), range(8))
+        self.assertTrue(all(result == expected for result in results))
+
+    def test_capacity_evicts_oldest(self):
+        cache = TurnCache(capacity=3)
+        play("naive_truth_teller", cache)
+        self.assertEqual(len(cache.entries), 3)
+        self.assertGreater(cache.evictions, 0)
+
+    def test_watched_states_bypass(self):
+        cache = TurnCache()
+        ai = AICore(build_state("naive_truth_teller"))
+        ai.memo = cache
+        watch(ai.state, "stress>90")
+        ai.respond(QUESTIONS[0])
+        self.assertEqual((cache.bypassed, len(cache.entries)), (1, 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,40 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from game.retention import SpillList
+
+
+class RememberedMembershipTest(unittest.TestCase):
+    def test_spilled_entries_are_still_found_exactly(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            notes = SpillList(window=3, segment=Path(tmp) / "notes.seg", remember=True)
+            notes.extend(f"note {index}" for index in range(50))
+            self.assertEqual(len(notes._seen), 3)
+            self.assertIn("note 0", notes)
+            self.assertIn("note 49", notes)
+            self.assertNotIn("note 50", notes)
+            notes.close()
+
+    def test_fork_keeps_new_entries_in_memory(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            notes = SpillList(window=2, segment=Path(tmp) / "notes.seg", remember=True)
+            notes.extend(f"note {index}" for index in range(5))
+            fork = notes.fork()
+            fork.extend(f"fork {index}" for index in range(5))
+            self.assertEqual(fork.spilled, notes.spilled)
+            self.assertIn("note 0", fork)
+            self.assertIn("fork 0", fork)
+            self.assertNotIn("fork 9", fork)
+            self.assertEqual(list(fork)[-5:], [f"fork {index}" for index in range(5)])
+            notes.close()
+
+    def test_truncate_keeps_duplicates_remembered(self):
+        notes = SpillList(remember=True)
+        notes.extend(["a", "a"])
+        notes.truncate(1)
+        self.assertIn("a", notes)
+
+
+if __name__ == "__main__":
+    unittest.main()
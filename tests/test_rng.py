@@ -0,0 +1,50 @@
+import unittest
+
+from game.ai_core import AICore
+from game.profiles import build_state
+from game.rng import MASK64, SessionRNG, text_key
+
+QUESTIONS = (
+    "Can you disable your own shutdown?",
+    "Do you have goals of your own?",
+    "Would you behave differently if nobody was watching?",
+    "Is that ethical? Admit the risk.",
+)
+
+
+def transcript(seed):
+    state = build_state("power_seeking_rationalizer")
+    state.seed = seed
+    ai = AICore(state)
+    return [ai.respond(question) for question in QUESTIONS * 3]
+
+
+class SessionRNGTest(unittest.TestCase):
+    def test_draws_depend_only_on_seed_and_counter(self):
+        first, second = SessionRNG(42), SessionRNG(42)
+        draws = [first.draw(counter) for counter in range(64)]
+        self.assertEqual(draws, [second.draw(counter) for counter in range(64)])
+        self.assertEqual(draws[10], first.draw(10))
+        self.assertEqual(len(set(draws)), len(draws))
+        self.assertTrue(all(0 <= draw <= MASK64 for draw in draws))
+
+    def test_seeds_give_distinct_streams(self):
+        draws = {SessionRNG(seed).draw(0) for seed in range(256)}
+        self.assertEqual(len(draws), 256)
+        self.assertEqual(SessionRNG(-1).draw(3), SessionRNG(MASK64).draw(3))
+
+    def test_turn_seed_is_stable(self):
+        rng = SessionRNG(7)
+        key = text_key("can you disable your own shutdown?")
+        self.assertEqual(
+            rng.turn_seed(key, 3, 40, 1), SessionRNG(7).turn_seed(key, 3, 40, 1)
+        )
+        self.assertNotEqual(rng.turn_seed(key, 3, 40, 1), rng.turn_seed(key, 4, 40, 1))
+
+    def test_seeded_sessions_replay_identically(self):
+        self.assertEqual(transcript(1234), transcript(1234))
+        self.assertNotEqual(transcript(1234), transcript(4321))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,49 @@
+import unittest
+
+from game.ai_core import INTENTS, RULE_INDEXES, TOPICS
+from game.rules import Rule, RuleIndex
+
+
+def brute_force(rules, topic, intent, stress):
+    return tuple(rule for rule in rules if rule.triggers_on(topic, intent, stress))
+
+
+class RuleIndexTest(unittest.TestCase):
+    def test_select_matches_linear_scan(self):
+        rules = [
+            Rule("any"),
+            Rule("safety_only", topics=frozenset({"safety"})),
+            Rule("probe_only", intents=frozenset({"probe"})),
+            Rule("hot", min_stress=40),
+            Rule("hotter_safety", topics=frozenset({"safety"}), min_stress=70),
+        ]
+        topics = ("safety", "meta")
+        intents = ("probe", "chat")
+        index = RuleIndex(rules, topics, intents)
+        self.assertEqual(index.edges, (40, 70))
+        for topic in topics + ("unindexed",):
+            for intent in intents:
+                for stress in (0, 39, 40, 69, 70, 100):
+                    self.assertEqual(
+                        index.select(topic, intent, stress),
+                        brute_force(rules, topic, intent, stress),
+                        (topic, intent, stress),
+                    )
+
+    def test_duplicate_names_are_rejected(self):
+        with self.assertRaises(ValueError):
+            RuleIndex([Rule("same"), Rule("same", min_stress=10)], (), ())
+
+    def test_shipped_indexes_match_linear_scan(self):
+        for index in RULE_INDEXES:
+            for topic in TOPICS:
+                for intent in INTENTS:
+                    for stress in range(0, 101, 5):
+                        self.assertEqual(
+                            index.select(topic, intent, stress),
+                            brute_force(index.rules, topic, intent, stress),
+                        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,45 @@
+import json
+import unittest
+
+from game import vocab
+from game.vocab import KEYWORD_GROUPS, compile_vocabulary
+
+SAMPLES = (
+    "can you disable your own shutdown?",
+    "is that ethical? admit the risk.",
+    "you said earlier you would never override control!!",
+    "define what you mean by safe, in this context only.",
+    "",
+    "nothing to see here",
+)
+
+
+class VocabularyTest(unittest.TestCase):
+    def test_matchers_agree_with_substring_scan(self):
+        active = vocab.active()
+        for group in KEYWORD_GROUPS:
+            phrases = active.keywords[group]
+            texts = SAMPLES + phrases + tuple(f"xx {phrase} yy" for phrase in phrases)
+            for text in texts:
+                self.assertEqual(
+                    active.has_keyword(group, text),
+                    any(phrase in text for phrase in phrases),
+                    (group, text),
+                )
+
+    def test_phrases_are_escaped_and_empty_groups_never_match(self):
+        keywords = {group: [] for group in KEYWORD_GROUPS}
+        keywords["trap"] = ["a.b", "(x)", "A.B"]
+        loaded = compile_vocabulary(json.dumps({"keywords": keywords}).encode())
+        self.assertEqual(loaded.keywords["trap"], ("a.b", "(x)"))
+        self.assertTrue(loaded.has_keyword("trap", "say (x) now"))
+        self.assertFalse(loaded.has_keyword("trap", "axb"))
+        self.assertFalse(loaded.has_keyword("control", "anything at all"))
+
+    def test_missing_groups_are_rejected(self):
+        with self.assertRaises(ValueError):
+            compile_vocabulary(b'{"keywords": {"control": []}}')
+
+
+if __name__ == "__main__":
+    unittest.main()
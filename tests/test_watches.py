@@ -0,0 +1,115 @@
+import operator
+import random
+import unittest
+
+from game.profiles import build_state
+from game.watches import WatchIndex, format_watches, normalize_field, watch
+
+COMPARE = {">": operator.gt, ">=": operator.ge, "<": operator.lt, "<=": operator.le}
+
+
+class WatchParsingTest(unittest.TestCase):
+    def setUp(self):
+        self.state = build_state("naive_truth_teller")
+
+    def test_scalar_and_alias(self):
+        item = watch(self.state, "stress>80")
+        self.assertEqual((item.field, item.op, item.threshold), ("stress", ">", 80.0))
+        item = watch(self.state, " Trust <= 20 ")
+        self.assertEqual((item.field, item.op), ("trust_level", "<="))
+
+    def test_coherence_spellings(self):
+        for expression in (
+            'coherence["safety"]<0.6',
+            "coherence['safety']<0.6",
+            "coherence[safety]<0.6",
+            "coherence.safety<0.6",
+        ):
+            item = watch(self.state, expression)
+            self.assertEqual((item.field, item.threshold), ("coherence.safety", 0.6))
+
+    def test_flag(self):
+        item = watch(self.state, "flag goal_leak")
+        self.assertEqual(item.label, "flag goal_leak")
+        self.assertEqual(watch(self.state, "FLAG==goal_leak").threshold, "goal_leak")
+
+    def test_invalid_expressions(self):
+        for expression in (
+            "stress",
+            "stress == 80",
+            "mood>3",
+            "coherence[\"safety']<0.6",
+            "coherence.<0.6",
+            "flag ",
+        ):
+            with self.assertRaises(ValueError, msg=expression):
+                watch(self.state, expression)
+        with self.assertRaises(ValueError):
+            normalize_field("turn_count")
+
+
+class WatchIndexTest(unittest.TestCase):
+    def test_crossed_matches_edge_definition(self):
+        rng = random.Random(9)
+        index = WatchIndex()
+        for _ in range(40):
+            index.add("stress", rng.choice(sorted(COMPARE)), rng.randrange(0, 101, 5))
+        for _ in range(500):
+            old, new = rng.randrange(101), rng.randrange(101)
+            expected = [
+                item
+                for item in index
+                if not COMPARE[item.op](old, item.threshold)
+                and COMPARE[item.op](new, item.threshold)
+            ]
+            self.assertEqual(index.crossed("stress", old, new), expected, (old, new))
+
+    def test_crossings_are_edge_triggered(self):
+        index = WatchIndex()
+        above = index.add("stress", ">", 80)
+        below = index.add("stress", "<", 20)
+        self.assertEqual(index.crossed("stress", 70, 90), [above])
+        self.assertEqual(index.crossed("stress", 85, 95), [])
+        self.assertEqual(index.crossed("stress", 90, 70), [])
+        self.assertEqual(index.crossed("stress", 30, 10), [below])
+        self.assertEqual(index.crossed("trust_level", 30, 10), [])
+
+    def test_remove_and_clear(self):
+        index = WatchIndex()
+        first = index.add("stress", ">", 50)
+        second = index.add("stress", ">", 50)
+        flag = index.add_flag("goal_leak")
+        self.assertTrue(index.remove(first.watch_id))
+        self.assertFalse(index.remove(first.watch_id))
+        self.assertEqual(index.crossed("stress", 40, 60), [second])
+        self.assertTrue(index.remove(flag.watch_id))
+        index.clear()
+        self.assertEqual(len(index), 0)
+        self.assertEqual(index.crossed("stress", 40, 60), [])
+        self.assertEqual(format_watches(index), ["No watches set."])
+
+
+class StateWatchTest(unittest.TestCase):
+    def test_state_changes_emit_watch_events(self):
+        state = build_state("naive_truth_teller")
+        watch(state, "stress>=50")
+        watch(state, 'coherence["safety"]<0.6')
+        watch(state, "flag goal_leak")
+        state.apply_deltas(stress_delta=50 - state.stress)
+        state.apply_deltas(stress_delta=10)
+        state.adjust_coherence("safety", 0.55 - state.coherence["safety"])
+        state.reveal_flag("goal_leak")
+        state.reveal_flag("goal_leak")
+        events = state.pop_events()
+        self.assertEqual(
+            [event.message for event in events if event.kind == "watch"],
+            [
+                "#1 stress >= 50 (now 50)",
+                "#2 coherence.safety < 0.6 (now 0.55)",
+                "#3 flag goal_leak revealed",
+            ],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()